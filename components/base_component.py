@@ -3,6 +3,7 @@ from typing import Pattern
 import allure
 from playwright.sync_api import Page, expect
 
+from tools import time_budget
 from tools.logger import get_logger
 
 logger = get_logger(__name__)
@@ -33,5 +34,6 @@ class BaseComponent:
         with allure.step(step):
             logger.info(step)
             # Проверяем, что URL соответствует заданному шаблону
-            expect(self.page).to_have_url(expected_url)
+            with time_budget.wait(f'url "{expected_url.pattern}"') as timeout:
+                expect(self.page).to_have_url(expected_url, timeout=timeout)
 
@@ -2,7 +2,7 @@ import json
 from typing import Any
 
 import allure
-from playwright.sync_api import Page, expect
+from playwright.sync_api import Page
 
 from components.base_component import BaseComponent
 from locators.registration_form_component_locators import RegistrationFormComponentsLocators
@@ -10,11 +10,54 @@ from data.person_info import PersonInfo
 from elements.text import Text
 from elements.input import Input
 from elements.button import Button
+from elements.element_collection import ElementCollection
+from tools.dom_waits import wait_for_state
 from tools.logger import get_logger
 
 
 logger = get_logger(__name__)
 
+# Проверка пачки значений поля внутри страницы: значение ставится нативным сеттером и событием
+# input (как его видит React) с обрезкой по maxlength (как при вводе), затем читаются validity,
+# checkValidity() и цвет бордера. Форма на время проверки помечается was-validated (как после
+# [Submit]), переход бордера отключается, чтобы читать итоговый цвет. Поле и форма восстанавливаются
+_PROBE_SCRIPT = """
+({ id, values }) => {
+    const input = document.getElementById(id);
+    const form = input.form;
+    const setValue = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+    const apply = (value) => {
+        setValue.call(input, value);
+        input.dispatchEvent(new Event('input', { bubbles: true }));
+    };
+    const original = input.value;
+    const wasValidated = form.classList.contains('was-validated');
+    const transition = input.style.transition;
+    form.classList.add('was-validated');
+    input.style.transition = 'none';
+    try {
+        return values.map((value) => {
+            const effective = input.maxLength >= 0 ? value.slice(0, input.maxLength) : value;
+            apply(effective);
+            const flags = [];
+            for (const key in input.validity) {
+                if (key !== 'valid' && input.validity[key]) flags.push(key);
+            }
+            return {
+                value: effective,
+                valid: input.checkValidity(),
+                flags,
+                border: getComputedStyle(input).borderBottomColor,
+            };
+        });
+    } finally {
+        apply(original);
+        input.style.transition = transition;
+        if (!wasValidated) form.classList.remove('was-validated');
+    }
+}
+"""
+
 
 class RegistrationFormComponent(BaseComponent):
     """
@@ -52,6 +95,8 @@ class RegistrationFormComponent(BaseComponent):
         self.salary_input = Input(page, locator=self.locators.SALARY_INPUT, name="salary field")
         self.department_input = Input(page, locator=self.locators.DEPARTMENT_INPUT, name="department field")
         self.submit_button = Button(page, locator=self.locators.SUBMIT_BUTTON, name="submit button")
+        self.close_button = Button(page, locator=self.locators.CLOSE_BUTTON, name="close button")
+        self.form_inputs = ElementCollection(page, locator=self.locators.FORM_INPUTS, name="registration form inputs")
 
         self.input_fields = {
             "first_name": self.first_name_input,
@@ -61,12 +106,106 @@ class RegistrationFormComponent(BaseComponent):
             "salary": self.salary_input,
             "department": self.department_input
         }
+        # id полей формы в DOM -> имена полей (как в input_fields)
+        self.input_ids = {
+            "firstName": "first_name",
+            "lastName": "last_name",
+            "userEmail": "email",
+            "age": "age",
+            "salary": "salary",
+            "department": "department"
+        }
 
     @allure.step("Check registration form is visible")
     def check_visible(self):
 
         return self.title_form.check_visible()
 
+    @allure.step("Close registration form")
+    def close(self) -> None:
+        """
+        Закрывает модальное окно формы, если оно открыто, и ждёт его исчезновения.
+        """
+        if not self.title_form.locator.is_visible():
+            logger.info("Registration form is already closed")
+            return
+        self.close_button.click()
+        if not self.wait_closed():
+            raise AssertionError("Registration form is still visible after closing")
+
+    @allure.step("Wait registration form closed")
+    def wait_closed(self, timeout: float = None) -> bool:
+        """
+        Ждёт закрытия модального окна формы по событиям страницы (без опроса).
+
+        Возвращает управление, как только окно скрыто или удалено из DOM, а не по истечении
+        таймаута expect(), как check_visible() при уже закрытой форме.
+
+        :param timeout: Таймаут в миллисекундах (None — глобальный таймаут expect()).
+        :return: True, если форма закрыта, иначе False.
+        """
+        return wait_for_state(self.title_form.locator, "hidden", timeout, "registration form closed")
+
+    @allure.step("Wait {field} marked invalid")
+    def wait_field_invalid(self, field: str, timeout: float = None) -> bool:
+        """
+        Ждёт, пока поле будет отмечено формой как невалидное и анимация бордера завершится.
+
+        Если форма закрылась (значение принято), ожидание сразу завершается с False.
+
+        :param field: Имя поля (например, "first_name").
+        :param timeout: Таймаут в миллисекундах (None — глобальный таймаут expect()).
+        :return: True, если поле отмечено невалидным, иначе False.
+        """
+        return wait_for_state(self.input_fields[field].locator, "invalid", timeout,
+                              f"{field} marked invalid")
+
+    def probe_validity(self, field: str, values: list[str]) -> list[dict[str, Any]]:
+        """
+        Проверяет пачку значений поля валидацией браузера одним evaluate, без отправки формы.
+
+        Форма должна быть открыта. Значения ставятся в поле по очереди, для каждого читаются
+        validity, checkValidity() и цвет бордера, после проверки поле восстанавливается.
+
+        :param field: Имя поля (например, "email").
+        :param values: Значения для проверки.
+        :return: Результаты по значениям: {"value": значение после обрезки по maxlength,
+                 "valid": bool, "flags": нарушенные свойства validity, "border": цвет бордера}.
+        :raises ValueError: Если не удалось проверить значения.
+        """
+        field_id = next(field_id for field_id, name in self.input_ids.items() if name == field)
+        try:
+            return self.page.evaluate(_PROBE_SCRIPT, {"id": field_id, "values": values})
+        except Exception as e:
+            err = f"error probing {field} validity: {str(e)}"
+            logger.error(err)
+            raise ValueError(err) from e
+
+    @staticmethod
+    def form_values(person: PersonInfo) -> dict[str, str]:
+        """
+        Значения полей формы для записи PersonInfo.
+
+        :param person: Данные пользователя.
+        :return: {имя поля: значение} (имена полей — значения input_ids).
+        """
+        return {
+            "first_name": person.first_name,
+            "last_name": person.last_name,
+            "email": person.email,
+            "age": str(person.age),
+            "salary": str(person.salary),
+            "department": person.company
+        }
+
+    @allure.step("Clear registration form")
+    def clear_form(self) -> None:
+        """
+        Очищает все поля ввода формы.
+        """
+        for input_field in self.input_fields.values():
+            input_field.clear()
+
     @allure.step("Fill form by data from PersonInfo")
     def fill_form(self, person: PersonInfo, field: str = None, value: Any = None)-> dict[str, str]:
         """
@@ -86,14 +225,7 @@ class RegistrationFormComponent(BaseComponent):
         """
         logger.info(f"Filling form, validating {field or 'all fields'} with value: {value if value is not None else 'default'}")
         filled_text = {}
-        values = {
-            "first_name": person.first_name,
-            "last_name": person.last_name,
-            "email": person.email,
-            "age": str(person.age),
-            "salary": str(person.salary),
-            "department": person.company
-        }
+        values = self.form_values(person)
 
         try:
             for field_name, input_field in self.input_fields.items():
@@ -125,17 +257,17 @@ class RegistrationFormComponent(BaseComponent):
                 """
         step = "Getting CSS property border-bottom-color"
         with allure.step(step):
-            # Список полей ввода (имя поля соответствует fill_form)
+            # Цвета всех полей читаются одним запросом к странице, а не по одному на поле
+            rows = self.form_inputs.read(text=False, attributes=["id"], styles=["border-bottom-color"])
             border_colors = {}
-            for field_name, field in self.input_fields.items():
-                try:
-                    color = field.get_css_property("border-bottom-color")
-                    border_colors[field_name] = color
-                    logger.info(f"Color bottom-border '{field_name}': {color}")
-                except Exception as e:
-                    err = f"error getting CSS property '{field_name}': {str(e)}"
-                    logger.error(err)
-                    raise ValueError(err) from e
+            for row in rows:
+                field_name = self.input_ids.get(row["attributes"]["id"])
+                if field_name is not None:
+                    border_colors[field_name] = row["styles"]["border-bottom-color"]
+                    logger.info(f"Color bottom-border '{field_name}': {border_colors[field_name]}")
+            missing = set(self.input_fields) - set(border_colors)
+            if missing:
+                raise ValueError(f"error getting CSS property: fields not found {sorted(missing)}")
 
             logger.info(f"Border colors retrieved: {border_colors}")
             allure.attach(
@@ -159,6 +291,9 @@ class RegistrationFormComponent(BaseComponent):
             ValueError: Если поле не найдено или не удалось получить цвет.
         """
         try:
+            # Цвет бордера анимируется: читаем его после завершения перехода, а не в его середине
+            if not self.wait_field_invalid(field):
+                logger.warning(f"Field '{field}' was not marked invalid by the form")
             color = self.input_fields[field].get_css_property("border-bottom-color")
             assert color == expected_color, f"Border color of {field} is {color}, expected {expected_color}"
             result = "Actual color: {color} = Expected color: {expected_color}"
@@ -0,0 +1,147 @@
+import re
+import time
+from typing import Any, Iterator, Optional
+
+import allure
+from playwright.sync_api import Page, expect
+
+from components.base_component import BaseComponent
+from elements.button import Button
+from elements.element_collection import ElementCollection
+from elements.input import Input
+from locators.web_table_component_locators import WebTableComponentLocators
+from tools import time_budget
+from tools.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Колонки таблицы с данными в порядке отображения (после них идёт колонка Action)
+COLUMNS = ("first_name", "last_name", "age", "email", "salary", "department")
+
+# Числовые колонки: значения в прочитанных строках приводятся к int
+_NUMERIC_COLUMNS = ("age", "salary")
+
+
+def parse_row(cells: list[str]) -> Optional[dict[str, Any]]:
+    """
+    Разбирает тексты ячеек строки таблицы.
+
+    :param cells: innerText ячеек строки (колонки COLUMNS, затем Action).
+    :return: Словарь {колонка: значение} или None для пустой строки-заполнителя.
+    """
+    values = [cell.strip() for cell in cells[:len(COLUMNS)]]
+    # react-table дорисовывает страницу до rows-per-page строками из неразрывных пробелов
+    if not any(values):
+        return None
+    row: dict[str, Any] = dict(zip(COLUMNS, values))
+    for column in _NUMERIC_COLUMNS:
+        if re.fullmatch(r"\d+", row[column]):
+            row[column] = int(row[column])
+    return row
+
+
+class WebTableComponent(BaseComponent):
+    """
+    Таблица записей Web Tables (react-table).
+
+    Включает элементы:
+    - Заголовки колонок (сортировка по клику)
+    - Ячейки строк текущей страницы таблицы
+    - Поле поиска
+    - Пагинация: кнопка [Next], номер страницы, число строк на странице
+
+    Наследуется от BaseComponent.
+    """
+
+    def __init__(self, page: Page):
+        """
+        Конструктор таблицы.
+
+        :param page: Экземпляр страницы Playwright
+        """
+        super().__init__(page)
+        self.locators = WebTableComponentLocators(page)
+
+        self.headers = ElementCollection(page, locator=self.locators.HEADERS, name="table headers")
+        self.cells = ElementCollection(page, locator=self.locators.CELLS, name="table cells")
+        self.search_input = Input(page, locator=self.locators.SEARCH_BOX, name="search field")
+        self.next_button = Button(page, locator=self.locators.NEXT_BUTTON, name="button [Next]")
+        self.page_jump_input = Input(page, locator=self.locators.PAGE_JUMP_INPUT, name="page number field")
+
+    @allure.step("Search table by {text}")
+    def search(self, text: str) -> None:
+        """
+        Фильтрует таблицу по строке поиска.
+
+        :param text: Строка поиска (пустая — сброс фильтра).
+        """
+        self.search_input.fill(text)
+
+    @allure.step("Sort table by {column}")
+    def sort_by(self, column: str) -> None:
+        """
+        Сортирует таблицу по колонке (повторный вызов меняет направление сортировки).
+
+        :param column: Имя колонки из COLUMNS (например, "salary").
+        """
+        self.headers.click(nth=COLUMNS.index(column))
+
+    @allure.step("Set {rows} rows per page")
+    def set_rows_per_page(self, rows: int) -> None:
+        """
+        Задаёт число строк на странице таблицы.
+
+        :param rows: Число строк (одно из значений списка: 5, 10, 20, 25, 50, 100).
+        """
+        self.locators.ROWS_PER_PAGE_SELECT.select_option(str(rows))
+
+    def read_page(self) -> list[dict[str, Any]]:
+        """
+        Читает строки текущей страницы таблицы одним evaluate.
+
+        :return: Разобранные строки (без пустых строк-заполнителей).
+        """
+        columns = self.headers.count()
+        texts = self.cells.texts()
+        rows = (parse_row(texts[start:start + columns]) for start in range(0, len(texts), columns))
+        return [row for row in rows if row is not None]
+
+    def _next_page(self) -> bool:
+        """
+        Переходит на следующую страницу таблицы.
+
+        :return: False, если текущая страница последняя.
+        """
+        if not self.locators.NEXT_BUTTON.is_enabled():
+            return False
+        number = self.locators.PAGE_JUMP_INPUT.input_value()
+        self.next_button.click()
+        with time_budget.wait("next table page") as timeout:
+            expect(self.locators.PAGE_JUMP_INPUT).to_have_value(str(int(number) + 1), timeout=timeout)
+        return True
+
+    def iter_rows(self, rows_per_page: Optional[int] = None) -> Iterator[dict[str, Any]]:
+        """
+        Перебирает строки таблицы по всем страницам пагинации, начиная с текущей.
+
+        Каждая страница таблицы читается одним evaluate, следующая открывается только
+        после того, как строки текущей разобраны потребителем, поэтому большую таблицу
+        можно обрабатывать, не держа её целиком в памяти. Время чтения и перехода по
+        страницам пишется в лог.
+
+        :param rows_per_page: Число строк на странице (None — оставить текущее).
+        :yield: Словарь строки: {"first_name": ..., "last_name": ..., "age": ..., "email": ...,
+                "salary": ..., "department": ...}.
+        """
+        if rows_per_page is not None:
+            self.set_rows_per_page(rows_per_page)
+        pages = total = 0
+        started = time.perf_counter()
+        while True:
+            rows = self.read_page()
+            pages += 1
+            total += len(rows)
+            yield from rows
+            if not self._next_page():
+                break
+        logger.info(f"Read {total} table rows from {pages} pages in {time.perf_counter() - started:.2f} s")
@@ -27,13 +27,44 @@ class Settings(BaseSettings):
     :ivar screenshots_dir: Директория для сохранения скриншотов упавших тестов.
     :ivar expect_timeout: Таймаут для ожиданий Playwright (в миллисекундах).
     :ivar remote_browser: WebSocket-эндпоинт для удалённого браузера (опционально).
+    :ivar request_blocking: Режим блокировки сторонних запросов: off, observe (только подсчёт),
+        deny (блокировать по правилам blocked_*) или allow (пропускать только allowed_domains и домен приложения).
+    :ivar blocked_domains: Домены (вместе с поддоменами), запросы к которым блокируются в режиме deny.
+    :ivar blocked_resource_types: Типы ресурсов, блокируемые в режиме deny (font, image, media, stylesheet).
+    :ivar blocked_url_patterns: Регулярные выражения URL, блокируемых в режиме deny.
+    :ivar allowed_domains: Дополнительные домены, разрешённые в режиме allow.
+    :ivar adaptive_timeouts: Вычислять таймауты ожиданий по истории прошлых запусков вместо жёстких значений.
+    :ivar adaptive_timeout_percentile: Перцентиль истории, от которого считается таймаут.
+    :ivar adaptive_timeout_margin: Множитель запаса к перцентилю.
+    :ivar adaptive_timeout_floor: Минимальный адаптивный таймаут (в миллисекундах).
+    :ivar adaptive_timeout_ceiling: Максимальный адаптивный таймаут (в миллисекундах).
+    :ivar adaptive_timeout_min_samples: Сколько замеров нужно, чтобы перейти от жёсткого таймаута к адаптивному.
+    :ivar test_time_budget: Бюджет времени одного теста в секундах (setup и тело теста; 0 — без ограничения).
+    :ivar web_vitals: Собирать метрики производительности страниц (Navigation Timing, paint, LCP, CLS,
+        длинные задачи, CDP Performance.getMetrics в Chromium) после каждого открытия и перезагрузки.
+    :ivar web_vitals_file: Файл временного ряда метрик страниц (JSON Lines, дописывается каждым прогоном).
+    :ivar network_budgets: Проверка сетевых бюджетов маршрутов (ROUTE_BUDGETS в tools/routes.py):
+        off, warn (предупреждение в логе и Allure) или fail (тест падает).
+    :ivar result_cache_ttl: Срок годности кеша успешных результатов в часах: тест пропускается, если прошёл
+        с тем же кейсом, браузером, исходниками page objects и сборкой приложения (0 — кеш выключен).
+    :ivar step_retries: Дополнительные попытки шага page object (open, reload, click, fill) при кратковременном
+        сбое — таймауте Playwright или сетевой ошибке навигации (0 — без повторов).
+    :ivar test_retries: Дополнительные попытки теста при кратковременном сбое в том же браузере (0 — без повторов).
+    :ivar circuit_breaker_failures: Сколько неудачных или медленных открытий страниц подряд (по всем воркерам)
+        размыкают автомат защиты: остальные тесты пропускаются, пока проверка доступности app_url не пройдёт
+        (0 — автомат выключен).
+    :ivar circuit_breaker_latency: Порог времени открытия страницы и ответа app_url для автомата защиты
+        (в миллисекундах; 0 — не проверяется).
+    :ivar circuit_breaker_cooldown: Интервал повторных проверок доступности app_url разомкнутым автоматом (в секундах).
+    :ivar disable_animations: Отключать CSS-переходы и анимации страниц и эмулировать prefers-reduced-motion.
     """
 
     model_config = SettingsConfigDict(
         env_file='.env',  # Загрузка переменных из файла .env
         env_file_encoding='utf-8',
         env_nested_delimiter='.', # Позволяет использовать вложенные переменные, если потребуется
-        extra='ignore' # Игнорировать лишние переменные в .env
+        extra='ignore', # Игнорировать лишние переменные в .env
+        frozen=True # Настройки только для чтения: один и тот же объект раздаётся всем воркерам
     )
 
     browser_name: str = "chromium"
@@ -48,6 +79,34 @@ class Settings(BaseSettings):
     screenshots_dir: DirectoryPath = Path("screenshots")
     expect_timeout: float = 5000
     remote_browser: Optional[str] = None
+    request_blocking: str = "off"
+    blocked_domains: list[str] = [
+        "googlesyndication.com", "doubleclick.net", "googleadservices.com", "adservice.google.com",
+        "googletagservices.com", "googletagmanager.com", "google-analytics.com", "amazon-adsystem.com",
+        "adsafeprotected.com", "moatads.com", "criteo.com", "pubmatic.com", "rubiconproject.com",
+        "adnxs.com", "taboola.com", "outbrain.com", "scorecardresearch.com", "fonts.googleapis.com",
+        "fonts.gstatic.com",
+    ]
+    blocked_resource_types: list[str] = ["font", "media"]
+    blocked_url_patterns: list[str] = []
+    allowed_domains: list[str] = []
+    adaptive_timeouts: bool = False
+    adaptive_timeout_percentile: float = 95
+    adaptive_timeout_margin: float = 1.5
+    adaptive_timeout_floor: float = 1000
+    adaptive_timeout_ceiling: float = 30000
+    adaptive_timeout_min_samples: int = 5
+    test_time_budget: float = 0
+    disable_animations: bool = False
+    network_budgets: str = "warn"
+    web_vitals: bool = False
+    web_vitals_file: Path = Path("metrics/page_metrics.jsonl")
+    result_cache_ttl: float = 0
+    step_retries: int = 0
+    test_retries: int = 0
+    circuit_breaker_failures: int = 0
+    circuit_breaker_latency: float = 15000
+    circuit_breaker_cooldown: float = 30
 
     @field_validator("videos_dir", "tracing_dir", "screenshots_dir", mode="before")
     def create_directory(cls, v):
@@ -62,6 +121,27 @@ class Settings(BaseSettings):
             raise ValueError(f"browser_name must be one of {valid_browsers}")
         return v
 
+    @field_validator("request_blocking")
+    def validate_request_blocking(cls, v):
+        valid_modes = {"off", "observe", "deny", "allow"}
+        if v not in valid_modes:
+            raise ValueError(f"request_blocking must be one of {valid_modes}")
+        return v
+
+    @field_validator("network_budgets")
+    def validate_network_budgets(cls, v):
+        valid_modes = {"off", "warn", "fail"}
+        if v not in valid_modes:
+            raise ValueError(f"network_budgets must be one of {valid_modes}")
+        return v
+
+    @field_validator("blocked_resource_types")
+    def validate_blocked_resource_types(cls, v):
+        valid_types = {"font", "image", "media", "stylesheet"}
+        if not set(v) <= valid_types:
+            raise ValueError(f"blocked_resource_types must be a subset of {valid_types}")
+        return v
+
     def __init__(self, **data):
         logger.info(f"Current working directory: {os.getcwd()}")
         logger.info(f"Loading .env from: {self.model_config['env_file']}")
@@ -88,4 +168,22 @@ class Settings(BaseSettings):
             return cls(**settings_dict)
         except Exception as e:
             logger.error(f"Failed to initialize Settings: {e}")
-            raise
\ No newline at end of file
+            raise
+
+    @classmethod
+    def from_serialized(cls, data: dict) -> Self:
+        """
+            Восстанавливает настройки из копии, подготовленной на контроллере pytest-xdist.
+
+            В отличие от initialize, не читает .env и переменные окружения, не создаёт
+            директории и не логирует содержимое настроек.
+
+            :param data: Результат `settings.model_dump(mode="json")` на контроллере.
+            :return: Объект Settings
+        """
+        # Данные уже провалидированы на контроллере: восстанавливаем только типы
+        values = dict(data)
+        values["app_url"] = HttpUrl(values["app_url"])
+        for name in ("videos_dir", "tracing_dir", "screenshots_dir", "web_vitals_file"):
+            values[name] = Path(values[name])
+        return cls.model_construct(**values)
@@ -1,5 +1,21 @@
 pytest_plugins = (
+    "fixtures.startup_profile",  # первым: замеряет загрузку остальных плагинов
     "fixtures.page_fixtures",
     "fixtures.settings",
-    "fixtures.data_fixtures"
+    "fixtures.data_fixtures",
+    "fixtures.concurrency",
+    "fixtures.case_batching",
+    "fixtures.locator_cache",
+    "fixtures.request_blocking",
+    "fixtures.adaptive_timeouts",
+    "fixtures.time_budget",
+    "fixtures.timeline",
+    "fixtures.slow_profile",
+    "fixtures.network_budget",
+    "fixtures.page_metrics",
+    "fixtures.result_cache",
+    "fixtures.impact",
+    "fixtures.sharding",
+    "fixtures.retry",
+    "fixtures.circuit_breaker"
 )
\ No newline at end of file
@@ -0,0 +1,170 @@
+import random
+import re
+import string
+from typing import Callable, Iterator, Optional
+
+from data.field_data import AGE_RANGE
+from tools.logger import get_logger
+
+# Инициализация логгера
+logger = get_logger(__name__)
+
+# Поля формы, для которых есть генератор значений и модель ожидаемого результата
+FUZZ_FIELDS = ("first_name", "last_name", "email", "age", "salary", "department")
+
+_LATIN = string.ascii_letters
+_CYRILLIC = "абвгдеёжзийклмнопрстуфхцчшщъыьэюяАБВГДЕЁЖЗИЙКЛМНОПРСТУФХЦЧШЩЪЫЬЭЮЯ"
+_SYMBOLS = "!@#$%^&*()_+-=[]{}|;:,.<>?/\\\"'`~"
+_SPACES = " \t "
+
+# Email: локальная часть без точки и дефиса по краям, домен из меток без дефиса по краям,
+# зона верхнего уровня — только буквы (\w включает кириллицу: "дом@дом.рф" — корректный адрес)
+_EMAIL = re.compile(r"(?!\.)[\w.+-]*[^\W_]@(?:[^\W_](?:[\w-]*[^\W_])?\.)+[^\W\d_]{2,}")
+
+
+def _text_expected(value: str) -> str:
+    """Текстовое поле: не пустое, не длиннее 256 символов и хотя бы с одной буквой или цифрой."""
+    if not value.strip() or len(value) > 256:
+        return "error"
+    return "success" if any(char.isalnum() for char in value) else "error"
+
+
+def _age_expected(value: str) -> str:
+    """Возраст: целое число в границах AGE_RANGE (data/field_data.py)."""
+    if not re.fullmatch(r"\d+", value):
+        return "error"
+    low, high = AGE_RANGE
+    return "success" if low <= int(value) <= high else "error"
+
+
+def _salary_expected(value: str) -> str:
+    """Зарплата: положительное число, до 10 цифр в целой части и до 2 знаков после точки."""
+    if not re.fullmatch(r"\d{1,10}(\.\d{1,2})?", value):
+        return "error"
+    return "success" if float(value) > 0 else "error"
+
+
+def _email_expected(value: str) -> str:
+    """Email: не длиннее 254 символов и вида local@domain.tld."""
+    return "success" if len(value) <= 254 and _EMAIL.fullmatch(value) else "error"
+
+
+# Модель ожидаемого результата по полям (согласована с ручными кейсами data/field_data.py)
+EXPECTED_RESULT: dict[str, Callable[[str], str]] = {
+    "first_name": _text_expected,
+    "last_name": _text_expected,
+    "department": _text_expected,
+    "age": _age_expected,
+    "salary": _salary_expected,
+    "email": _email_expected,
+}
+
+
+def expected_result(field: str, value: str) -> str:
+    """
+    Возвращает ожидаемый результат отправки формы со значением поля.
+
+    :param field: Имя поля (из FUZZ_FIELDS).
+    :param value: Значение поля.
+    :return: "success" или "error".
+    """
+    return EXPECTED_RESULT[field](value)
+
+
+def _random_text(rnd: random.Random) -> str:
+    """Текст: буквы разных алфавитов, цифры, символы и пробелы, длина около границ поля."""
+    alphabet = rnd.choice([_LATIN, _CYRILLIC, _LATIN + " '-", _SYMBOLS, _SPACES, _LATIN + string.digits,
+                           _LATIN + _CYRILLIC + _SYMBOLS + _SPACES + string.digits])
+    length = rnd.choice([0, 1, 2, rnd.randint(3, 30), rnd.randint(24, 26), rnd.randint(255, 258)])
+    text = "".join(rnd.choice(alphabet) for _ in range(length))
+    if text and rnd.random() < 0.2:
+        # Пробелы по краям: значение должно приниматься, если в нём есть буквы
+        text = rnd.choice(["", " "]) + text + rnd.choice(["", " "])
+    return text
+
+
+def _random_number(rnd: random.Random) -> str:
+    """Число: границы диапазонов, знаки, дроби, ведущие нули, экспонента, пробелы и слова."""
+    number = rnd.choice([rnd.randint(-1000, 1000), rnd.randint(0, 120), rnd.randint(15, 20),
+                         rnd.randint(97, 101), rnd.randint(0, 10 ** rnd.randint(1, 12))])
+    form = rnd.randrange(8)
+    if form == 0:
+        return f"{number}.{rnd.randint(0, 10 ** rnd.randint(1, 4) - 1)}"
+    if form == 1:
+        return f"{'0' * rnd.randint(1, 3)}{abs(number)}"
+    if form == 2:
+        return f"{number}e{rnd.randint(0, 3)}"
+    if form == 3:
+        return rnd.choice([" ", "+", ""]) + str(number) + rnd.choice([" ", ""])
+    if form == 4:
+        return "".join(rnd.choice(_LATIN + _CYRILLIC) for _ in range(rnd.randint(1, 8)))
+    if form == 5:
+        return rnd.choice(["", " ", "-", ".", "1,5", "١٢", "NaN", "Infinity"])
+    return str(number)
+
+
+def _random_email(rnd: random.Random) -> str:
+    """Email: корректный адрес из частей и его мутации (без @, без зоны, дефисы и точки по краям)."""
+    def word(alphabet: str, low: int = 1, high: int = 12) -> str:
+        return "".join(rnd.choice(alphabet) for _ in range(rnd.randint(low, high)))
+
+    letters = rnd.choice([_LATIN, _CYRILLIC, _LATIN + string.digits])
+    local = word(letters + rnd.choice(["", ".", "-_+"]))
+    domain = word(letters) + rnd.choice(["", f"-{word(letters)}", f".{word(letters)}"])
+    tld = word(rnd.choice([_LATIN, _CYRILLIC, string.digits]), 1, 6)
+    mutation = rnd.randrange(10)
+    if mutation == 0:
+        return f"{local}{domain}.{tld}"
+    if mutation == 1:
+        return f"{local}@{domain}"
+    if mutation == 2:
+        return f"{local}-@{domain}.{tld}"
+    if mutation == 3:
+        return f"{local}@-{domain}.{tld}"
+    if mutation == 4:
+        return f".{local}@{domain}.{tld}"
+    if mutation == 5:
+        return f"{local}@@{domain}.{tld}"
+    if mutation == 6:
+        return f"{local * rnd.randint(10, 30)}@{domain}.{tld}"
+    if mutation == 7:
+        return f"{local}@{domain}.{tld}" + rnd.choice([" ", "."])
+    return f"{local}@{domain}.{tld}"
+
+
+# Генераторы значений по полям
+_GENERATORS: dict[str, Callable[[random.Random], str]] = {
+    "first_name": _random_text,
+    "last_name": _random_text,
+    "department": _random_text,
+    "age": _random_number,
+    "salary": _random_number,
+    "email": _random_email,
+}
+
+
+def generate_values(field: str, count: int, seed: Optional[int] = None) -> Iterator[str]:
+    """
+    Лениво генерирует различные значения для поля.
+
+    Значения не повторяются; при одном seed последовательность воспроизводима.
+
+    :param field: Имя поля (из FUZZ_FIELDS).
+    :param count: Число значений.
+    :param seed: Сид генератора (None — случайный).
+    :yield: Очередное значение.
+    """
+    if seed is None:
+        seed = random.randint(0, 999999)
+        logger.info(f"Generated fuzz seed: {seed}")
+    # Свой экземпляр Random: генерация не сбивает общий random, которым пользуется PersonInfo
+    rnd = random.Random(f"{field}:{seed}")
+    generator = _GENERATORS[field]
+    seen: set[str] = set()
+    attempts = 0
+    while len(seen) < count and attempts < count * 20:
+        attempts += 1
+        value = generator(rnd)
+        if value not in seen:
+            seen.add(value)
+            yield value
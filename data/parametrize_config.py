@@ -1,3 +1,6 @@
+import json
+import os
+from pathlib import Path
 from typing import Type, List, Tuple, Any
 from data.field_data import Field, TestCaseData
 
@@ -9,6 +12,26 @@ def get_test_cases(data_class: Type[Field]) -> List[Tuple[str, Any, str]]:
         data_class (Type[Field]): Класс данных (например, Name, Department, Salary).
 
     Returns:
-        List[Tuple[str, Any, str]]: Список тест-кейсов [(case_name, value, expected_result), ...].
+        List[Tuple[str, Any, str]]: Список тест-кейсов [(case_name, value, expected_result), ...];
+        значения, генерируемые Faker, — Generated (см. resolve_value в data/field_data.py).
     """
     return data_class.generate_test_case_data().test_cases
+
+
+def get_fuzz_cases(field: str) -> List[Tuple[str, Any, str]]:
+    """
+    Извлекает кейсы поля, переданные фаззингом в UI-тесты (python -m tools.field_fuzz).
+
+    Файл кейсов задаётся переменной окружения FUZZ_CASES; без неё кейсов нет.
+
+    Args:
+        field (str): Имя поля формы (например, "email").
+
+    Returns:
+        List[Tuple[str, Any, str]]: Список тест-кейсов [(case_name, value, expected_result), ...].
+    """
+    path = os.environ.get("FUZZ_CASES")
+    if not path:
+        return []
+    cases = json.loads(Path(path).read_text(encoding="utf-8"))["cases"].get(field, [])
+    return [tuple(case) for case in cases]
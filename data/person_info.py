@@ -2,15 +2,15 @@ import json
 from dataclasses import dataclass
 
 import allure
-from faker import Faker
 from typing import Optional, List
 import random
 from tools.logger import get_logger
+from tools.lazy_faker import LazyFaker
 
 # Инициализация логгера
 logger = get_logger(__name__)
 
-faker = Faker('ru_RU')
+faker = LazyFaker('ru_RU')
 
 @dataclass
 class PersonInfo:
@@ -30,31 +30,42 @@ class PersonInfo:
 
     @staticmethod
     @allure.step("Generate person with seed")
-    def generate_person(seed: Optional[int] = None, extended: bool = False) -> 'PersonInfo':
+    def generate_person(seed: Optional[int] = None, extended: bool = False, fake: Optional[LazyFaker] = None,
+                        rnd: Optional[random.Random] = None) -> 'PersonInfo':
         """
                 Генерирует данные пользователя.
+
+                По умолчанию используются общие для модуля faker и random (seed задаётся глобально).
+                Потоки, генерирующие данные одновременно (например, tools/load.py), передают свои
+                генераторы fake и rnd: их seed задаётся только для экземпляров и не влияет на других.
         """
         if seed is None:
             seed = random.randint(0, 999999)  # Генерируем случайный seed
             msg = f"Generated seed: {seed}"
             logger.info(msg)
             allure.attach(str(seed), name="Faker seed", attachment_type=allure.attachment_type.TEXT)
-        Faker.seed(seed)
-        random.seed(seed)  # Синхронизируем random с Faker
-        passwd = faker.password(length=10, special_chars=True)
+        if fake is None:
+            fake = faker
+            fake.seed(seed)
+        else:
+            fake.seed_instance(seed)
+        if rnd is None:
+            rnd = random
+        rnd.seed(seed)  # Синхронизируем random с Faker
+        passwd = fake.password(length=10, special_chars=True)
         data = {
-            "first_name": faker.first_name(),
-            "last_name": faker.last_name(),
-            "middle_name": faker.middle_name(),
-            "email": faker.email(),
-            "phone": faker.phone_number(),
+            "first_name": fake.first_name(),
+            "last_name": fake.last_name(),
+            "middle_name": fake.middle_name(),
+            "email": fake.email(),
+            "phone": fake.phone_number(),
             "password": passwd,
             "password2": passwd,
-            "address": faker.address(),
-            "age": str(random.randint(10, 99)),
-            "city": faker.city(),
-            "company": faker.company(),
-            "salary": str(random.randint(15000, 180000)),
+            "address": fake.address(),
+            "age": str(rnd.randint(10, 99)),
+            "city": fake.city(),
+            "company": fake.company(),
+            "salary": str(rnd.randint(15000, 180000)),
             "faker_seed": seed,
         }
         person_info = PersonInfo(**data)
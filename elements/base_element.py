@@ -1,7 +1,12 @@
-from typing import Union, List
+import time
+from typing import Union, List, Optional
 
 import allure
 from playwright.sync_api import Page, Locator, expect
+from tools.adaptive_timeouts import adaptive_timeouts
+from tools.locator_cache import locator_cache
+from tools.retry import retry_step
+from tools import time_budget
 from tools.logger import get_logger
 
 # Инициализация логгера
@@ -20,6 +25,7 @@ class BaseElement:
             page: Page,
             locator: Locator,
             name: str,
+            selector: Optional[str] = None,
     ) -> None:
         """Инициализация элемента.
 
@@ -27,10 +33,15 @@ class BaseElement:
             page: Экземпляр страницы Playwright
             locator: Готовый локатор Playwright
             name: Имя элемента (для логов и отчетов)
+            selector: Ключ локатора для кеша селекторов и истории таймаутов
+                (по умолчанию тип и имя элемента, например 'input "age field"')
         """
         self.page: Page = page
-        self.locator: Locator = locator
         self.name: str = name
+        self.selector: str = selector or f'{self.type_of} "{name}"'
+        # С --locator-cache локатор заменяется проверенным более дешёвым селектором, если он известен
+        self.locator: Locator = locator_cache.substitute(self.selector, locator)
+        self.original_locator: Locator = locator
 
     @property
     def type_of(self) -> str:
@@ -55,19 +66,52 @@ class BaseElement:
         """
         step = f'Получение локатора для "{self.name}" (индекс: {nth})'
         with allure.step(step):
+            # Ожидаем появления элемента в DOM (7 секунд или таймаут по истории ожиданий локатора)
+            timeout = adaptive_timeouts.timeout("locator", self.selector, default=7000)
+            started = time.perf_counter()
             try:
-                # Ожидаем появления элемента в DOM в течение 5 секунд
-                self.locator.nth(nth).wait_for(state="attached", timeout=7000)
-                locator = self.locator.nth(nth)
-                logger.info(f"{step}, найдено {locator.count()} элементов")
-                return locator
+                try:
+                    self._wait_attached(nth, timeout)
+                except Exception:
+                    if self.locator is self.original_locator:
+                        raise
+                    # Дешёвый селектор из кеша больше не находит элемент: возвращаемся к исходному
+                    # и ждём только остаток таймаута, а не весь таймаут заново
+                    locator_cache.discard(self.selector)
+                    self.locator = self.original_locator
+                    self._wait_attached(nth, timeout - (time.perf_counter() - started) * 1000)
             except Exception as e:
                 err = f"Ошибка получения локатора для '{self.name}': {str(e)}"
                 logger.error(f"{step}, {err}")
                 raise ValueError(err) from e
+            elapsed = time.perf_counter() - started
+            locator_cache.record(self.selector, self.locator, elapsed)
+            adaptive_timeouts.record("locator", self.selector, elapsed * 1000)
+            locator = self.locator.nth(nth)
+            logger.info(f"{step}, найдено {locator.count()} элементов")
+            return locator
+
+    def _wait_attached(self, nth: int, timeout: float) -> None:
+        """Ждёт появления элемента текущего локатора в DOM.
+
+        Args:
+            nth: Индекс элемента в группе
+            timeout: Таймаут в мс (ограничивается бюджетом теста); если он исчерпан,
+                наличие элемента проверяется без ожидания
+
+        Raises:
+            TimeoutError: Если элемент не появился
+        """
+        with time_budget.wait(f'locator "{self.name}"', max(timeout, 0)) as timeout:
+            if timeout >= 1:
+                self.locator.nth(nth).wait_for(state="attached", timeout=timeout)
+            elif self.locator.count() <= nth:
+                # timeout=0 в Playwright отключает таймаут, поэтому без остатка только проверяем
+                raise TimeoutError(f"Element {self.name} (index {nth}) is not attached")
 
     # --- Основные методы взаимодействия с элементами ---
 
+    @retry_step
     def click(self, nth: int = 0) -> None:
         """Выполняет клик по элементу.
 
@@ -80,7 +124,8 @@ class BaseElement:
                 logger.info(step)
                 locator = self.get_locator(nth)
                 assert locator.is_enabled(), f"Element {self.name} is not enabled"
-                self.locator.click()
+                with time_budget.wait(f'click "{self.name}"', time_budget.ACTION_TIMEOUT) as timeout:
+                    self.locator.click(timeout=timeout)
             except Exception as e:
                 logger.error(f"Error clicking submit button: {e}")
                 raise
@@ -96,7 +141,9 @@ class BaseElement:
 
         with allure.step(step):
             try:
-                expect(self.get_locator(nth)).to_be_visible()
+                locator = self.get_locator(nth)
+                with time_budget.wait(f'visible "{self.name}"') as timeout:
+                    expect(locator).to_be_visible(timeout=timeout)
                 result = f"Element {self.type_of} '{self.name}' is visible"
                 logger.info(result)
                 allure.attach(
@@ -127,7 +174,8 @@ class BaseElement:
         with allure.step(step):
             locator = self.get_locator(nth)
             logger.info(step)
-            expect(locator).to_have_text(text)
+            with time_budget.wait(f'text of "{self.name}"') as timeout:
+                expect(locator).to_have_text(text, timeout=timeout)
 
     def get_css_property(self, css_property, nth: int = 0):
 
@@ -160,7 +208,8 @@ class BaseElement:
 
             Args:
                 nth: Индекс элемента (для одного элемента).
-                all_elements: Если True, возвращает текст всех элементов, иначе — одного.
+                all_elements: Если True, возвращает текст всех элементов, иначе — одного
+                    (для групп с чтением атрибутов и стилей см. ElementCollection).
 
             Returns:
                 str: Текст одного элемента (если all_elements=False).
@@ -174,9 +223,12 @@ class BaseElement:
         logger.info(step)
         try:
             if all_elements:
-                texts = locator.all_inner_texts()
+                # Тексты всей группы, а не одного nth-элемента
+                with time_budget.wait(f'texts from "{self.name}"', time_budget.ACTION_TIMEOUT):
+                    texts = self.locator.all_inner_texts()
             else:
-                texts = locator.inner_text()
+                with time_budget.wait(f'text from "{self.name}"', time_budget.ACTION_TIMEOUT) as timeout:
+                    texts = locator.inner_text(timeout=timeout)
 
             allure.attach(
                 f'Received text from {self.name}: {texts}',
@@ -2,6 +2,7 @@ import allure
 from playwright.sync_api import expect
 
 from elements.base_element import BaseElement
+from tools import time_budget
 from tools.logger import get_logger
 
 logger = get_logger(__name__)
@@ -33,7 +34,9 @@ class Button(BaseElement):
 
         with allure.step(step):
             try:
-                expect(self.get_locator(nth)).to_be_enabled()
+                locator = self.get_locator(nth)
+                with time_budget.wait(f'enabled "{self.name}"') as timeout:
+                    expect(locator).to_be_enabled(timeout=timeout)
                 result = f"Element {self.type_of} '{self.name}' is enabled"
                 logger.info(result)
                 allure.attach(
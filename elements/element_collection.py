@@ -0,0 +1,184 @@
+from typing import Any, Iterable, Iterator, Optional
+
+from elements.base_element import BaseElement
+from tools import time_budget
+from tools.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Скрипт чтения группы элементов: один проход по всем совпадениям локатора в странице.
+# Возвращает срез [start, start + limit) — так большие группы читаются страницами
+_READ_SCRIPT = """
+(elements, { fields, attributes, styles, start, limit }) => {
+    const end = limit === null ? elements.length : Math.min(elements.length, start + limit);
+    const rows = [];
+    for (let i = start; i < end; i++) {
+        const element = elements[i];
+        const row = { index: i };
+        if (fields.includes('text')) row.text = element.innerText;
+        if (fields.includes('value')) row.value = 'value' in element ? String(element.value) : null;
+        if (attributes.length) {
+            row.attributes = {};
+            for (const name of attributes) row.attributes[name] = element.getAttribute(name);
+        }
+        if (styles.length) {
+            const computed = getComputedStyle(element);
+            row.styles = {};
+            for (const name of styles) row.styles[name] = computed.getPropertyValue(name);
+        }
+        rows.push(row);
+    }
+    return { total: elements.length, rows };
+}
+"""
+
+
+class ElementCollection(BaseElement):
+    """
+    Группа элементов, найденных одним локатором (строки таблицы, поля формы, пункты списка).
+
+    В отличие от поэлементных методов BaseElement (nth), читает тексты, значения,
+    атрибуты и вычисленные стили всех совпадений одним evaluate, без отдельного
+    запроса к браузеру на каждый элемент. Большие группы можно читать страницами
+    через iter_pages()/iter_rows().
+
+    Каждая прочитанная строка — словарь вида:
+    {"index": 0, "text": "...", "value": "...", "attributes": {...}, "styles": {...}}
+    (ключи value/attributes/styles присутствуют, только если запрошены).
+    """
+
+    @property
+    def type_of(self) -> str:
+        """Возвращает тип элемента: "collection"."""
+        return "collection"
+
+    def count(self, wait: bool = True) -> int:
+        """
+        Возвращает число элементов группы.
+
+        :param wait: Ждать появления хотя бы одного элемента (иначе пустая группа — 0 без ожидания).
+        :return: Количество найденных элементов.
+        """
+        if wait:
+            self.get_locator(0)
+        return self.locator.count()
+
+    def read(
+            self,
+            text: bool = True,
+            value: bool = False,
+            attributes: Iterable[str] = (),
+            styles: Iterable[str] = (),
+            start: int = 0,
+            limit: Optional[int] = None,
+            wait: bool = True,
+    ) -> list[dict[str, Any]]:
+        """
+        Читает данные всех (или среза) элементов группы одним evaluate.
+
+        :param text: Читать innerText.
+        :param value: Читать value (для полей ввода; для остальных элементов — None).
+        :param attributes: Имена атрибутов для чтения.
+        :param styles: Имена CSS-свойств для чтения через getComputedStyle.
+        :param start: Индекс первого элемента среза.
+        :param limit: Размер среза (None — до конца группы).
+        :param wait: Ждать появления хотя бы одного элемента.
+        :return: Список словарей по одному на элемент.
+        :raises ValueError: Если элементы не найдены (при wait=True) или не удалось прочитать данные.
+        """
+        return self._read_slice(text, value, attributes, styles, start, limit, wait)["rows"]
+
+    def _read_slice(self, text: bool, value: bool, attributes: Iterable[str], styles: Iterable[str],
+                    start: int, limit: Optional[int], wait: bool) -> dict[str, Any]:
+        """
+        Читает срез группы и общее число элементов.
+
+        :return: Словарь {"total": число элементов, "rows": [...]}.
+        """
+        if wait:
+            self.get_locator(0)
+        fields = [name for name, enabled in (("text", text), ("value", value)) if enabled]
+        step = f'Reading {self.type_of} "{self.name}" [{start}:{"" if limit is None else start + limit}]'
+        logger.info(step)
+        try:
+            with time_budget.wait(f'read "{self.name}"', time_budget.ACTION_TIMEOUT):
+                return self.locator.evaluate_all(_READ_SCRIPT, {
+                    "fields": fields,
+                    "attributes": list(attributes),
+                    "styles": list(styles),
+                    "start": start,
+                    "limit": limit,
+                })
+        except Exception as e:
+            err = f'error reading {self.type_of} "{self.name}": {str(e)}'
+            logger.error(err)
+            raise ValueError(err) from e
+
+    def texts(self) -> list[str]:
+        """
+        Возвращает innerText всех элементов группы.
+
+        :return: Список текстов.
+        """
+        return [row["text"] for row in self.read()]
+
+    def values(self) -> list[Optional[str]]:
+        """
+        Возвращает value всех элементов группы (для полей ввода).
+
+        :return: Список значений.
+        """
+        return [row["value"] for row in self.read(text=False, value=True)]
+
+    def attribute_values(self, name: str) -> list[Optional[str]]:
+        """
+        Возвращает значение атрибута всех элементов группы.
+
+        :param name: Имя атрибута.
+        :return: Список значений (None, если атрибута нет).
+        """
+        return [row["attributes"][name] for row in self.read(text=False, attributes=[name])]
+
+    def css_values(self, css_property: str) -> list[str]:
+        """
+        Возвращает вычисленное значение CSS-свойства всех элементов группы.
+
+        :param css_property: Имя CSS-свойства (например, "border-bottom-color").
+        :return: Список значений.
+        """
+        return [row["styles"][css_property] for row in self.read(text=False, styles=[css_property])]
+
+    def iter_pages(self, page_size: int = 100, **fields: Any) -> Iterator[list[dict[str, Any]]]:
+        """
+        Читает группу страницами по page_size элементов.
+
+        Каждая страница — один evaluate; следующие страницы не читаются, пока не нужны,
+        поэтому большую группу можно обрабатывать, не держа её целиком в памяти.
+
+        :param page_size: Число элементов на странице.
+        :param fields: Параметры чтения, как в read() (text, value, attributes, styles).
+        :yield: Список словарей элементов очередной страницы.
+        """
+        start = 0
+        wait = True
+        while True:
+            chunk = self._read_slice(fields.get("text", True), fields.get("value", False),
+                                     fields.get("attributes", ()), fields.get("styles", ()),
+                                     start, page_size, wait)
+            if chunk["rows"]:
+                yield chunk["rows"]
+            start += page_size
+            wait = False
+            if start >= chunk["total"]:
+                return
+
+    def iter_rows(self, page_size: int = 100, **fields: Any) -> Iterator[dict[str, Any]]:
+        """
+        Перебирает элементы группы по одному, читая их страницами (см. iter_pages).
+
+        :param page_size: Число элементов, читаемых за один evaluate.
+        :param fields: Параметры чтения, как в read().
+        :yield: Словарь очередного элемента.
+        """
+        for rows in self.iter_pages(page_size, **fields):
+            yield from rows
@@ -2,7 +2,9 @@ import allure
 from playwright.sync_api import expect, Locator
 
 from elements.base_element import BaseElement
+from tools import time_budget
 from tools.logger import get_logger
+from tools.retry import retry_step
 
 logger = get_logger(__name__)
 
@@ -22,6 +24,7 @@ class Input(BaseElement):
         """
         return "input"
 
+    @retry_step
     def fill(self, value: str, nth: int = 0):
         """
         Заполняет поле ввода заданным значением.
@@ -35,7 +38,22 @@ class Input(BaseElement):
         with allure.step(step):
             locator = self.get_locator(nth)
             logger.info(step)
-            locator.fill(value)
+            with time_budget.wait(f'fill "{self.name}"', time_budget.ACTION_TIMEOUT) as timeout:
+                locator.fill(value, timeout=timeout)
+
+    def clear(self, nth: int = 0):
+        """
+        Очищает поле ввода.
+
+        :param nth: Индекс, если на странице несколько одинаковых элементов.
+        """
+        step = f'Clearing {self.type_of} "{self.name}"'
+
+        with allure.step(step):
+            locator = self.get_locator(nth)
+            logger.info(step)
+            with time_budget.wait(f'clear "{self.name}"', time_budget.ACTION_TIMEOUT) as timeout:
+                locator.clear(timeout=timeout)
 
     def check_have_value(self, value: str, nth: int = 0) -> bool:
         """
@@ -58,7 +76,8 @@ class Input(BaseElement):
             locator = self.get_locator(nth)
             logger.info(step)
             try:
-                expect(locator).to_have_value(value)
+                with time_budget.wait(f'value of "{self.name}"') as timeout:
+                    expect(locator).to_have_value(value, timeout=timeout)
                 allure.attach(
                     f"Value for {self.name} matches: {value}",
                     name=f"Value Check ({self.name})",
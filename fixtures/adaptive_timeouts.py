@@ -0,0 +1,75 @@
+import pytest
+
+from fixtures.settings import read_cache, shared_value, write_cache
+from tools.adaptive_timeouts import AdaptiveTimeouts, adaptive_timeouts
+from tools.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Ключ кеша pytest (.pytest_cache) с историей длительностей ожиданий
+CACHE_KEY = "adaptive_timeouts/history"
+
+# Ключ для хранения истории, загруженной при старте сессии
+HISTORY_KEY = pytest.StashKey[dict[str, list[float]]]()
+
+# Ключ-признак того, что история пополнилась замерами воркеров и её нужно сохранить
+SAVE_KEY = pytest.StashKey[bool]()
+
+
+@pytest.hookimpl
+def pytest_configure(config: pytest.Config) -> None:
+    """
+    Загружает историю длительностей ожиданий из кеша pytest (один раз на прогон).
+
+    :param config: Объект конфигурации pytest.
+    """
+    config.stash[HISTORY_KEY] = shared_value(config, "timeout_history", lambda: read_cache(config, CACHE_KEY, {}))
+
+
+@pytest.fixture(scope="session", autouse=True)
+def enable_adaptive_timeouts(settings, request: pytest.FixtureRequest) -> None:
+    """
+    Включает адаптивные таймауты, если они включены в настройках (ADAPTIVE_TIMEOUTS в .env).
+
+    :param settings: Настройки проекта (экземпляр Settings).
+    :param request: Объект pytest для доступа к конфигурации.
+    """
+    if settings.adaptive_timeouts and not adaptive_timeouts.enabled:
+        history = request.config.stash.get(HISTORY_KEY, {})
+        adaptive_timeouts.enable(settings, history)
+        logger.info(f"Adaptive timeouts enabled with {len(history)} keys of history")
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error) -> None:
+    """
+    Хук pytest-xdist: добавляет новые замеры воркера к истории контроллера.
+
+    :param node: Узел воркера pytest-xdist (WorkerController).
+    :param error: Ошибка воркера, если он завершился аварийно.
+    """
+    samples = getattr(node, "workeroutput", {}).get("timeout_samples")
+    if samples:
+        config = node.config
+        config.stash[HISTORY_KEY] = AdaptiveTimeouts.merge(config.stash[HISTORY_KEY], samples)
+        config.stash[SAVE_KEY] = True
+
+
+@pytest.hookimpl
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    """
+    Передаёт новые замеры воркера контроллеру или сохраняет историю в кеш pytest.
+
+    :param session: Объект сессии pytest.
+    """
+    config = session.config
+    if hasattr(config, "workeroutput"):
+        config.workeroutput["timeout_samples"] = adaptive_timeouts.new_samples
+        return
+    history = config.stash.get(HISTORY_KEY, {})
+    if adaptive_timeouts.new_samples:
+        history = AdaptiveTimeouts.merge(history, adaptive_timeouts.new_samples)
+    elif not config.stash.get(SAVE_KEY, False):
+        return
+    if write_cache(config, CACHE_KEY, history):
+        logger.info(f"Adaptive timeout history saved: {len(history)} keys")
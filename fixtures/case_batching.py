@@ -0,0 +1,194 @@
+import uuid
+from pathlib import Path
+from typing import Generator, Optional, TYPE_CHECKING
+
+import allure
+import pytest
+from _pytest.nodes import Item
+from playwright.sync_api import Browser, BrowserContext
+
+from fixtures.page_fixtures import (TEST_RESULT_KEY, attach_blocked_requests, attach_trace_summary, batch_key,
+                                     create_context, ensure_directory)
+from pages.web_tables_page import WebTablePage
+from tools import time_budget
+from tools.adaptive_timeouts import adaptive_timeouts
+from tools.logger import get_logger
+from tools.network_recorder import start_network_recording
+
+if TYPE_CHECKING:
+    from config import Settings
+
+logger = get_logger(__name__)
+
+
+def pytest_addoption(parser):
+    """Опции режима пакетного выполнения кейсов"""
+    parser.addoption('--batch-cases', action='store_true', default=False,
+                     help="Run consecutive cases of the same form field on one loaded page, "
+                          "resetting the registration form between cases")
+
+
+@pytest.hookimpl
+def pytest_configure(config: pytest.Config) -> None:
+    """
+    Проверяет совместимость --batch-cases с другими режимами.
+
+    :param config: Объект конфигурации pytest.
+    :raises pytest.UsageError: Если одновременно включены --batch-cases и --contexts-per-worker.
+    """
+    if config.getoption("--batch-cases") and config.getoption("--contexts-per-worker") > 1:
+        raise pytest.UsageError("--batch-cases cannot be combined with --contexts-per-worker")
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(session: pytest.Session, config: pytest.Config, items: list[Item]) -> None:
+    """
+    Группирует кейсы одного поля для pytest-xdist.
+
+    С `--dist loadgroup` все кейсы поля попадают на один воркер подряд и делят одну страницу.
+
+    :param session: Объект сессии pytest.
+    :param config: Объект конфигурации pytest.
+    :param items: Список тестовых элементов (Pytest Item).
+    """
+    if not config.getoption("--batch-cases"):
+        return
+    for item in items:
+        key = batch_key(item)
+        if key is not None:
+            item.add_marker(pytest.mark.xdist_group(name=f"{key[0]}[{key[1]}]"))
+
+
+class CaseBatch:
+    """
+    Общая страница Web Tables для последовательных кейсов одного поля.
+
+    Страница создаётся при первом кейсе ключа и переиспользуется, пока ключ не сменится
+    или кейс не упадёт (после падения состояние страницы не гарантировано).
+    Трейс пишется по кускам (chunk) на каждый кейс, поэтому упавший кейс получает
+    только свой трейс. Видео в этом режиме не записывается: оно было бы общим на все кейсы.
+    """
+
+    def __init__(self, browser: Browser, settings: 'Settings'):
+        """
+        :param browser: Браузер, в котором создаются контексты.
+        :param settings: Настройки проекта (экземпляр Settings).
+        """
+        self.browser = browser
+        self.settings = settings
+        self.key: Optional[tuple[str, str]] = None
+        self.context: Optional[BrowserContext] = None
+        self.webtable_page: Optional[WebTablePage] = None
+        self._chunk_open = False
+
+    def acquire(self, key: tuple[str, str]) -> WebTablePage:
+        """
+        Возвращает страницу для ключа, создавая новую при смене ключа.
+
+        :param key: Ключ пакета (см. batch_key).
+        :return: Объект `WebTablePage` общей страницы.
+        """
+        if key != self.key or self.webtable_page is None:
+            self.release()
+            logger.info(f"Starting case batch for {key}")
+            self.context = create_context(self.browser, self.settings)
+            self.context.tracing.start(screenshots=True, snapshots=True, sources=True)
+            self._chunk_open = True
+            self.webtable_page = WebTablePage(page=self.context.new_page())
+            self.key = key
+        elif not self._chunk_open:
+            self.context.tracing.start_chunk()
+            self._chunk_open = True
+        return self.webtable_page
+
+    def finish_case(self, trace_path: Optional[Path] = None) -> None:
+        """
+        Завершает кусок трейса текущего кейса.
+
+        :param trace_path: Куда сохранить трейс (None — не сохранять).
+        """
+        if self.context is None or not self._chunk_open:
+            return
+        self._chunk_open = False
+        self.context.tracing.stop_chunk(**({"path": trace_path} if trace_path else {}))
+
+    def release(self) -> None:
+        """Закрывает контекст текущего пакета."""
+        if self.context is not None:
+            try:
+                self.context.close()
+                logger.info(f"Case batch for {self.key} closed")
+            except Exception as e:
+                logger.error(f"Failed to close case batch context: {e}")
+        self.key = None
+        self.context = None
+        self.webtable_page = None
+        self._chunk_open = False
+
+
+@pytest.fixture(scope="session")
+def case_batch(shared_browser: Browser, settings: 'Settings') -> Generator[CaseBatch, None, None]:
+    """
+    Фикстура хранилища общей страницы для режима --batch-cases.
+
+    :param shared_browser: Общий браузер воркера.
+    :param settings: Настройки проекта (экземпляр Settings).
+    :yield: Объект CaseBatch.
+    """
+    batch = CaseBatch(shared_browser, settings)
+    yield batch
+    batch.release()
+
+
+@pytest.fixture
+def batched_webtable_page(case_batch: CaseBatch, settings: 'Settings',
+                          request: pytest.FixtureRequest) -> Generator[WebTablePage, None, None]:
+    """
+    Фикстура страницы Web Tables, общей для последовательных кейсов одного поля.
+
+    Каждый кейс остаётся отдельным результатом pytest/Allure. Для упавшего кейса
+    прикрепляются его кусок трейса и скриншот, а страница пересоздаётся для следующего.
+
+    :param case_batch: Хранилище общей страницы.
+    :param settings: Настройки проекта (экземпляр Settings).
+    :param request: Объект pytest для доступа к контексту теста (FixtureRequest).
+    :yield: Объект `WebTablePage` с уже загруженной страницей (начиная со второго кейса).
+    """
+    time_budget.set_expect_timeout(adaptive_timeouts.timeout("expect", default=settings.expect_timeout))
+    for directory in (settings.tracing_dir, settings.screenshots_dir):
+        ensure_directory(directory)
+
+    webtable_page = case_batch.acquire(batch_key(request.node))
+    start_network_recording(case_batch.context, request.node)
+    allure.dynamic.parameter("Browser", case_batch.browser.browser_type.name)
+    allure.dynamic.tag(settings.browser_name)
+
+    yield webtable_page
+
+    attach_blocked_requests(case_batch.context)
+    if request.node.stash.get(TEST_RESULT_KEY, "passed") != "failed":
+        try:
+            case_batch.finish_case()
+        except Exception as e:
+            logger.error(f"Failed to stop trace chunk: {e}")
+        return
+
+    tracing_file = settings.tracing_dir.joinpath(f'{uuid.uuid4()}.zip')
+    try:
+        case_batch.finish_case(trace_path=tracing_file)
+        allure.attach.file(source=tracing_file, name='trace', attachment_type='application/zip')
+        attach_trace_summary(tracing_file)
+        logger.info(f"Trace chunk saved and attached for failed case: {tracing_file}")
+    except Exception as e:
+        logger.error(f"Failed to save or attach trace {tracing_file}: {e}")
+
+    screenshot_file = settings.screenshots_dir.joinpath(f'{uuid.uuid4()}.jpeg')
+    try:
+        webtable_page.page.screenshot(path=screenshot_file, type="jpeg", quality=50, full_page=False)
+        allure.attach.file(source=screenshot_file, name='auto_screenshot', attachment_type='image/jpeg')
+        logger.info(f"Screenshot saved and attached for failed case: {screenshot_file}")
+    except Exception as e:
+        logger.error(f"Failed to save or attach screenshot {screenshot_file}: {e}")
+
+    # После падения состояние формы не гарантировано: следующий кейс начнёт с новой страницы
+    case_batch.release()
@@ -0,0 +1,105 @@
+import tempfile
+import uuid
+from pathlib import Path
+
+import pytest
+from _pytest.nodes import Item
+from _pytest.reports import TestReport
+
+from fixtures.settings import get_settings, shared_value
+from tools.circuit_breaker import circuit_breaker
+from tools.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Фикстуры, через которые тест получает браузер (webtable_page запрашивает страницу через
+# getfixturevalue, поэтому её нет в замыкании фикстур теста): тесты без них автомат не пропускает
+BROWSER_FIXTURES = {"page", "shared_browser", "webtable_page", "batched_webtable_page"}
+
+# Тесты, пропущенные из-за недоступности приложения (на контроллере xdist — от всех воркеров)
+_skipped: list[tuple[str, str]] = []
+
+
+@pytest.hookimpl
+def pytest_configure(config: pytest.Config) -> None:
+    """
+    Включает автомат защиты от недоступного приложения (CIRCUIT_BREAKER_FAILURES в .env).
+
+    Журнал событий один на прогон: воркеры pytest-xdist дописывают в него свои события.
+    Доступность приложения проверяется до запуска тестов (кроме воркеров и --collect-only).
+
+    :param config: Объект конфигурации pytest.
+    """
+    settings = get_settings(config)
+    if not settings.circuit_breaker_failures:
+        return
+    journal = shared_value(config, "circuit_breaker", lambda: str(
+        Path(tempfile.gettempdir()) / f"circuit_breaker_{uuid.uuid4().hex[:12]}.jsonl"))
+    workerinput = getattr(config, "workerinput", None)
+    circuit_breaker.enable(Path(journal), str(settings.app_url), settings.circuit_breaker_failures,
+                           settings.circuit_breaker_latency, settings.circuit_breaker_cooldown,
+                           workerinput.get("workerid", "main") if workerinput is not None else "main")
+    if workerinput is None:
+        logger.info(f"Circuit breaker enabled: opens after {settings.circuit_breaker_failures} failed or slow "
+                    f"(> {settings.circuit_breaker_latency:.0f} ms) navigations, re-probes every "
+                    f"{settings.circuit_breaker_cooldown:.0f} s")
+        if not config.option.collectonly:
+            circuit_breaker.probe()
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item: Item) -> None:
+    """
+    Пропускает тест с браузером, пока приложение недоступно (автомат разомкнут).
+
+    Проверка выполняется до запуска браузера и создания страницы, поэтому пропуск
+    занимает миллисекунды вместо таймаутов открытия страниц и ожиданий.
+
+    :param item: Тестовый элемент (Pytest Item).
+    """
+    if not BROWSER_FIXTURES.intersection(item.fixturenames):
+        return
+    reason = circuit_breaker.check()
+    if reason is not None:
+        item.user_properties.append(("circuit_breaker", reason))
+        pytest.skip(f"circuit open: {reason}")
+
+
+@pytest.hookimpl
+def pytest_runtest_logreport(report: TestReport) -> None:
+    """
+    Собирает тесты, пропущенные разомкнутым автоматом.
+
+    :param report: Отчёт фазы теста.
+    """
+    if report.when != "setup" or not report.skipped:
+        return
+    for name, value in report.user_properties:
+        if name == "circuit_breaker":
+            _skipped.append((report.nodeid, value))
+
+
+@pytest.hookimpl
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    """
+    Удаляет журнал событий автомата (только контроллер или процесс без xdist).
+
+    :param session: Объект сессии pytest.
+    """
+    if circuit_breaker.enabled and not hasattr(session.config, "workerinput"):
+        circuit_breaker.path.unlink(missing_ok=True)
+
+
+@pytest.hookimpl
+def pytest_terminal_summary(terminalreporter, config: pytest.Config) -> None:
+    """
+    Выводит число тестов, пропущенных из-за недоступности приложения, и первую причину.
+
+    :param terminalreporter: Плагин вывода в терминал.
+    :param config: Объект конфигурации pytest.
+    """
+    if not _skipped:
+        return
+    terminalreporter.write_sep("=", "circuit breaker")
+    terminalreporter.write_line(f"{len(_skipped)} tests skipped while the app was unavailable")
+    terminalreporter.write_line(f"  first: {_skipped[0][0]}: {_skipped[0][1]}")
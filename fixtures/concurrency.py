@@ -0,0 +1,562 @@
+import abc
+import os
+import threading
+from collections import OrderedDict
+from importlib import metadata
+from typing import Any, Callable, Optional
+
+import pytest
+from _pytest.fixtures import FixtureDef, FixtureManager
+from _pytest.logging import LogCaptureHandler, LoggingPlugin
+from _pytest.nodes import Item
+from _pytest.runner import SetupState
+from allure_commons.reporter import ThreadContextItems
+from greenlet import greenlet, settrace
+from playwright._impl._sync_base import SyncBase
+
+from tools.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Маркер тестов, которые можно выполнять параллельно в контекстах одного браузера
+CONCURRENT_MARKER = "concurrent"
+
+# Версии библиотек, с которыми проверен планировщик (закреплены в requirements.txt).
+# Внутреннее состояние может сохранить имена и поменять поведение, поэтому при обновлении
+# любой из них нужно прогнать tests/test_concurrency_smoke.py и обновить обе записи
+VERIFIED_VERSIONS = {
+    "pytest": "8.3.5",
+    "allure-pytest": "2.14.2",
+    "pytest-xdist": "3.6.1",
+    "playwright": "1.52.0",
+    "greenlet": "3.2.2",
+}
+
+
+def pytest_addoption(parser):
+    """Опции планировщика параллельных контекстов"""
+    parser.addoption('--contexts-per-worker', action='store', type=int, default=1,
+                     help="How many tests marked 'concurrent' one worker runs at once "
+                          "in separate BrowserContexts of a shared browser (1 disables)")
+
+
+def _assigns(function: Optional[Callable], *names: str) -> bool:
+    """Присваивает ли функция (обычно __init__) атрибуты `names` объекта: self.<name> = ..."""
+    code = getattr(function, "__code__", None)
+    return code is not None and all(name in code.co_names for name in names)
+
+
+def _worker_interactor(config: pytest.Config):
+    """
+    Плагин воркера xdist (None вне воркера).
+
+    xdist регистрирует WorkerInteractor без имени, а модуль xdist.remote на воркере исполняется
+    через execnet как отдельный скрипт, поэтому плагин ищется по имени класса, а не через isinstance.
+    """
+    if not hasattr(config, "workerinput"):
+        return None
+    return next(
+        (plugin for plugin in config.pluginmanager.get_plugins() if type(plugin).__name__ == "WorkerInteractor"),
+        None
+    )
+
+
+def _missing_internals(config: pytest.Config) -> list[str]:
+    """
+    Проверяет внутреннее состояние pytest, Allure, pytest-xdist и Playwright, которое подменяет планировщик.
+
+    Публичного API для этого состояния нет, и оно может измениться в любой версии библиотек:
+    проверка при старте даёт понятную ошибку вместо сбоя или перепутанных отчётов посреди прогона.
+
+    :param config: Объект конфигурации pytest.
+    :return: Отсутствующие атрибуты ("библиотека: атрибут").
+    """
+    checks = {
+        "pytest: Session._setupstate": "_setupstate" in getattr(pytest.Session, "__annotations__", {}),
+        "pytest: SetupState.stack/setup/teardown_exact": _assigns(SetupState.__init__, "stack")
+        and hasattr(SetupState, "setup") and hasattr(SetupState, "teardown_exact"),
+        "pytest: FixtureDef.cached_result/_finalizers": _assigns(FixtureDef.__init__, "cached_result", "_finalizers"),
+        "pytest: Function._fixtureinfo": _assigns(pytest.Function.__init__, "_fixtureinfo"),
+        "pytest: FixtureManager._arg2fixturedefs": _assigns(FixtureManager.__init__, "_arg2fixturedefs"),
+        "pytest: LoggingPlugin.caplog_handler/report_handler/formatter": _assigns(
+            LoggingPlugin.__init__, "caplog_handler", "report_handler", "formatter"),
+        "allure-pytest: ThreadContextItems._thread_context": isinstance(
+            getattr(ThreadContextItems, "_thread_context", None), dict),
+        "playwright: SyncBase._loop/_dispatcher_fiber": _assigns(SyncBase.__init__, "_loop", "_dispatcher_fiber"),
+    }
+    listener = config.pluginmanager.get_plugin("allure_listener")
+    if listener is not None:
+        cache = getattr(listener, "_cache", None)
+        checks["allure-pytest: AllureListener._cache._items/pop"] = isinstance(getattr(cache, "_items", None), dict) \
+            and hasattr(cache, "pop")
+        checks["allure-pytest: AllureReporter.drop_test"] = hasattr(getattr(listener, "allure_logger", None),
+                                                                    "drop_test")
+    interactor = _worker_interactor(config)
+    if hasattr(config, "workerinput"):
+        checks["pytest-xdist: WorkerInteractor.item_index"] = interactor is not None and _assigns(
+            getattr(type(interactor), "run_one_test", None), "item_index")
+    return [name for name, present in checks.items() if not present]
+
+
+def _unverified_versions() -> list[str]:
+    """
+    Сравнивает установленные версии библиотек с VERIFIED_VERSIONS.
+
+    :return: Библиотеки с другой версией ("библиотека установленная (verified проверенная)").
+    """
+    unverified = []
+    for package, verified in VERIFIED_VERSIONS.items():
+        try:
+            installed = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            installed = "not installed"
+        if installed != verified:
+            unverified.append(f"{package} {installed} (verified {verified})")
+    return unverified
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_configure(config: pytest.Config) -> None:
+    """
+    Регистрирует планировщик, если задано больше одного контекста на воркер.
+
+    Выполняется после остальных плагинов, чтобы проверить уже зарегистрированный AllureListener.
+
+    :param config: Объект конфигурации pytest.
+    :raises pytest.UsageError: Если --contexts-per-worker меньше 1, установлены не проверенные
+        версии библиотек или в них нет внутреннего состояния, которое подменяет планировщик.
+    """
+    contexts_per_worker = config.getoption("--contexts-per-worker")
+    if contexts_per_worker < 1:
+        raise pytest.UsageError("--contexts-per-worker must be >= 1")
+    if contexts_per_worker == 1:
+        return
+    unverified = _unverified_versions()
+    if unverified:
+        raise pytest.UsageError(
+            "--contexts-per-worker is verified only with the library versions from requirements.txt: "
+            f"{', '.join(unverified)}. Install them or run with --contexts-per-worker=1"
+        )
+    missing = _missing_internals(config)
+    if missing:
+        raise pytest.UsageError(
+            "--contexts-per-worker relies on internals that the installed library versions do not have: "
+            f"{', '.join(missing)}. Install the versions from requirements.txt or run with --contexts-per-worker=1"
+        )
+    scheduler = ContextScheduler(config, contexts_per_worker, _worker_interactor(config))
+    config.pluginmanager.register(scheduler, "context_scheduler")
+
+
+class _Slot(abc.ABC):
+    """
+    Глобальное состояние pytest/allure, которое должно быть своим у каждого теста.
+
+    Планировщик сохраняет значение слота при уходе из гринлета теста и
+    восстанавливает его при возврате, поэтому тесты не видят состояние друг друга.
+    """
+
+    @abc.abstractmethod
+    def get(self) -> Any:
+        """Текущее значение состояния."""
+
+    @abc.abstractmethod
+    def set(self, value: Any) -> None:
+        """Подменяет значение состояния."""
+
+    @abc.abstractmethod
+    def fresh(self, main_value: Any, item: Item, owner: greenlet) -> Any:
+        """Начальное значение для гринлета теста `item` на основе значения главного гринлета."""
+
+    def merge(self, main_value: Any, value: Any) -> None:
+        """Переносит в главный гринлет то, что тест оставил для более широких областей."""
+
+
+class _SetupStateSlot(_Slot):
+    """Стек SetupState: общие узлы session/module/class, собственный узел теста."""
+
+    def __init__(self, session: pytest.Session):
+        self.session = session
+
+    def get(self) -> SetupState:
+        return self.session._setupstate
+
+    def set(self, value: SetupState) -> None:
+        self.session._setupstate = value
+
+    def fresh(self, main_value: SetupState, item: Item, owner: greenlet) -> SetupState:
+        state = SetupState()
+        # Списки финализаторов родительских узлов общие с главным стеком
+        state.stack.update(main_value.stack)
+        return state
+
+
+class _FixtureCacheSlot(_Slot):
+    """Кэш значения function-фикстуры (одна FixtureDef на все тесты класса)."""
+
+    def __init__(self, fixturedef):
+        self.fixturedef = fixturedef
+
+    def get(self) -> tuple:
+        return self.fixturedef.cached_result, self.fixturedef._finalizers
+
+    def set(self, value: tuple) -> None:
+        self.fixturedef.cached_result, self.fixturedef._finalizers = value
+
+    def fresh(self, main_value: tuple, item: Item, owner: greenlet) -> tuple:
+        return None, []
+
+
+class _AllureContextSlot(_Slot):
+    """Стек текущих результатов/шагов Allure, который allure хранит по потокам."""
+
+    def __init__(self, thread):
+        self.thread = thread
+
+    def get(self) -> OrderedDict:
+        return ThreadContextItems._thread_context[self.thread]
+
+    def set(self, value: OrderedDict) -> None:
+        ThreadContextItems._thread_context[self.thread] = value
+
+    def fresh(self, main_value: OrderedDict, item: Item, owner: greenlet) -> OrderedDict:
+        return OrderedDict(main_value)
+
+    def merge(self, main_value: OrderedDict, value: OrderedDict) -> None:
+        for uuid, allure_item in value.items():
+            main_value.setdefault(uuid, allure_item)
+
+
+class _AllureCacheSlot(_Slot):
+    """Соответствие тест/фикстура -> uuid в AllureListener."""
+
+    def __init__(self, listener):
+        self.listener = listener
+
+    def get(self) -> dict:
+        return self.listener._cache._items
+
+    def set(self, value: dict) -> None:
+        self.listener._cache._items = value
+
+    def fresh(self, main_value: dict, item: Item, owner: greenlet) -> dict:
+        return dict(main_value)
+
+    def merge(self, main_value: dict, value: dict) -> None:
+        for key, uuid in value.items():
+            main_value.setdefault(key, uuid)
+
+
+class _CurrentTestSlot(_Slot):
+    """Переменная окружения PYTEST_CURRENT_TEST, которую pytest выставляет на каждую фазу."""
+
+    VAR_NAME = "PYTEST_CURRENT_TEST"
+
+    def get(self) -> Optional[str]:
+        return os.environ.get(self.VAR_NAME)
+
+    def set(self, value: Optional[str]) -> None:
+        if value is None:
+            os.environ.pop(self.VAR_NAME, None)
+        else:
+            os.environ[self.VAR_NAME] = value
+
+    def fresh(self, main_value: Optional[str], item: Item, owner: greenlet) -> Optional[str]:
+        return None
+
+
+class _WorkerItemIndexSlot(_Slot):
+    """Индекс текущего теста воркера xdist, который уходит в каждый отчёт контроллеру."""
+
+    def __init__(self, interactor):
+        self.interactor = interactor
+
+    def get(self) -> int:
+        return self.interactor.item_index
+
+    def set(self, value: int) -> None:
+        self.interactor.item_index = value
+
+    def fresh(self, main_value: int, item: Item, owner: greenlet) -> int:
+        return item.session.items.index(item)
+
+
+class _GreenletFilter:
+    """Пропускает в обработчик только записи, сделанные из гринлета теста."""
+
+    def __init__(self, owner: greenlet):
+        self.owner = owner
+
+    def filter(self, record) -> bool:
+        return greenlet.getcurrent() is self.owner
+
+
+class _LogHandlersSlot(_Slot):
+    """Обработчики логов pytest, из которых собираются секции 'log' отчёта."""
+
+    def __init__(self, logging_plugin):
+        self.logging_plugin = logging_plugin
+
+    def get(self) -> tuple:
+        return self.logging_plugin.caplog_handler, self.logging_plugin.report_handler
+
+    def set(self, value: tuple) -> None:
+        self.logging_plugin.caplog_handler, self.logging_plugin.report_handler = value
+
+    def fresh(self, main_value: tuple, item: Item, owner: greenlet) -> tuple:
+        handlers = []
+        for _ in range(2):
+            handler = LogCaptureHandler()
+            handler.setFormatter(self.logging_plugin.formatter)
+            handler.addFilter(_GreenletFilter(owner))
+            handlers.append(handler)
+        return tuple(handlers)
+
+
+class ContextScheduler:
+    """
+    Планировщик, выполняющий несколько тестов воркера одновременно.
+
+    Тесты с маркером `concurrent` одного класса откладываются в пачку размером
+    --contexts-per-worker. Каждая пачка выполняется в отдельных гринлетах в том же
+    потоке: Playwright Sync API переключает гринлеты на время ожидания браузера,
+    поэтому пока один тест ждёт страницу, другие продолжают работу в своих
+    BrowserContext общего браузера.
+
+    Для каждого теста подменяется глобальное состояние pytest и Allure (стек SetupState,
+    кэши function-фикстур, контекст Allure, обработчики логов), поэтому отчёты,
+    логи и вложения остаются раздельными. Setup тестов выполняется строго по
+    одному, чтобы фикстуры с более широкой областью создавались один раз.
+    Наличие этого состояния проверяется при регистрации (_missing_internals).
+    """
+
+    def __init__(self, config: pytest.Config, contexts_per_worker: int, interactor=None):
+        """
+        :param config: Объект конфигурации pytest.
+        :param contexts_per_worker: Максимальное число одновременно выполняемых тестов.
+        :param interactor: Плагин воркера xdist (None вне воркера).
+        """
+        self.config = config
+        self.contexts_per_worker = contexts_per_worker
+        self.interactor = interactor
+        self._buffer: list[Item] = []
+        self._running: set[Item] = set()
+
+        # Состояние выполняемой пачки
+        self._main: Optional[greenlet] = None
+        self._loop = None
+        self._pending: list[Item] = []
+        self._active: dict[greenlet, Item] = {}
+        self._contexts: dict[greenlet, dict[_Slot, Any]] = {}
+        self._slots: list[_Slot] = []
+        self._in_setup: Optional[Item] = None
+        self._errors: list[BaseException] = []
+        self._previous_trace = None
+
+    @staticmethod
+    def _is_concurrent(item: Optional[Item]) -> bool:
+        return item is not None and item.get_closest_marker(CONCURRENT_MARKER) is not None
+
+    def _fits_batch(self, item: Optional[Item]) -> bool:
+        return self._is_concurrent(item) and (not self._buffer or item.parent is self._buffer[0].parent)
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_protocol(self, item: Item, nextitem: Optional[Item]) -> Optional[bool]:
+        """
+        Откладывает тесты с маркером `concurrent` и запускает их пачкой.
+
+        Пачка запускается, когда набрано --contexts-per-worker тестов или следующий
+        тест в неё не подходит (другой класс, нет маркера, конец очереди воркера).
+
+        :param item: Текущий тест.
+        :param nextitem: Следующий тест воркера (None, если тест последний).
+        :return: True, если тест отложен; None, чтобы pytest выполнил его сам.
+        """
+        if item in self._running or not self._is_concurrent(item):
+            return None
+
+        self._cancel_allure_result(item)
+        self._buffer.append(item)
+        logger.debug(f"Deferred {item.nodeid} into concurrent batch ({len(self._buffer)}/{self.contexts_per_worker})")
+        if len(self._buffer) >= self.contexts_per_worker or not self._fits_batch(nextitem):
+            batch, self._buffer = self._buffer, []
+            self._run_batch(batch, nextitem)
+        return True
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_setup(self, item: Item):
+        """Разрешает запуск следующего теста пачки, когда setup текущего завершён."""
+        yield
+        if item is self._in_setup:
+            self._in_setup = None
+            self._loop.call_soon(self._spawn_next)
+
+    def _cancel_allure_result(self, item: Item) -> None:
+        """
+        Отменяет пустой результат, который allure создаёт на отложенный вызов протокола.
+
+        Настоящий результат будет создан, когда тест выполнится в своём гринлете.
+        """
+        listener = self.config.pluginmanager.get_plugin("allure_listener")
+        if listener is None:
+            return
+        uuid = listener._cache.pop(item.nodeid)
+        if uuid:
+            listener.allure_logger.drop_test(uuid)
+
+    def _run_protocol(self, item: Item) -> None:
+        """
+        Выполняет полный протокол теста, снимая со стека только сам тест.
+
+        nextitem=item.parent: SetupState.teardown_exact снимает узлы, которых нет у следующего
+        теста, поэтому общий для пачки класс остаётся поднятым до конца пачки.
+        """
+        interactor = self.interactor
+        if interactor is not None:
+            # xdist сверяет отчёт с индексом текущего теста воркера
+            item_index, interactor.item_index = interactor.item_index, item.session.items.index(item)
+        self._running.add(item)
+        try:
+            item.ihook.pytest_runtest_protocol(item=item, nextitem=item.parent)
+        finally:
+            self._running.discard(item)
+            if interactor is not None:
+                interactor.item_index = item_index
+
+    def _playwright_fixture(self, item: Item):
+        """Возвращает уже запущенный Playwright сессии или None, если его ещё нет."""
+        fixturedefs = item._fixtureinfo.name2fixturedefs.get("playwright")
+        if not fixturedefs or fixturedefs[-1].cached_result is None:
+            return None
+        return fixturedefs[-1].cached_result[0]
+
+    def _run_batch(self, batch: list[Item], nextitem: Optional[Item]) -> None:
+        """
+        Выполняет пачку тестов одного класса в параллельных гринлетах.
+
+        :param batch: Отложенные тесты.
+        :param nextitem: Настоящий следующий тест воркера, до которого нужно снять стек.
+        """
+        session = batch[0].session
+        try:
+            # Родительские узлы (session/module/class) поднимаются один раз в главном стеке
+            session._setupstate.setup(batch[0].parent)
+        except Exception as e:
+            # Ошибка setup класса/модуля будет показана в отчёте каждого теста
+            logger.error(f"Failed to set up {batch[0].parent.nodeid} for concurrent batch: {e}")
+            for item in batch:
+                self._run_protocol(item)
+            session._setupstate.teardown_exact(nextitem)
+            return
+
+        if self._playwright_fixture(batch[0]) is None:
+            # Первый тест прогревает сессионные фикстуры и запускает Playwright
+            self._run_protocol(batch.pop(0))
+        playwright = self._playwright_fixture(batch[0]) if batch else None
+
+        if len(batch) == 1 or (batch and playwright is None):
+            for item in batch:
+                self._run_protocol(item)
+        elif batch:
+            logger.info(f"Running {len(batch)} tests concurrently in separate browser contexts")
+            self._run_concurrently(batch, playwright)
+
+        try:
+            session._setupstate.teardown_exact(nextitem)
+        except Exception as e:
+            logger.error(f"Failed to tear down after concurrent batch: {e}")
+
+        if self._errors:
+            errors, self._errors = self._errors, []
+            raise errors[0]
+
+    def _run_concurrently(self, batch: list[Item], playwright) -> None:
+        """
+        Запускает тесты пачки в гринлетах и крутит диспетчер Playwright, пока все не завершатся.
+
+        :param batch: Тесты пачки (не меньше двух).
+        :param playwright: Запущенный Playwright, в цикле событий которого работают тесты.
+        """
+        session = batch[0].session
+        self._main = greenlet.getcurrent()
+        self._loop = playwright._loop
+        self._pending = list(batch)
+
+        self._slots = [_SetupStateSlot(session), _CurrentTestSlot(), _AllureContextSlot(threading.current_thread())]
+        listener = self.config.pluginmanager.get_plugin("allure_listener")
+        if listener is not None:
+            self._slots.append(_AllureCacheSlot(listener))
+        if self.interactor is not None:
+            self._slots.append(_WorkerItemIndexSlot(self.interactor))
+        logging_plugin = self.config.pluginmanager.get_plugin("logging-plugin")
+        if logging_plugin is not None:
+            self._slots.append(_LogHandlersSlot(logging_plugin))
+        # Фикстуры из замыкания тестов и все остальные (их можно запросить через getfixturevalue)
+        known_fixturedefs = [item._fixtureinfo.name2fixturedefs.values() for item in batch]
+        known_fixturedefs.append(session._fixturemanager._arg2fixturedefs.values())
+        fixturedefs = {
+            fixturedef
+            for name2fixturedefs in known_fixturedefs
+            for fixturedefs in name2fixturedefs
+            for fixturedef in fixturedefs
+            if fixturedef.scope == "function"
+        }
+        self._slots.extend(_FixtureCacheSlot(fixturedef) for fixturedef in fixturedefs)
+
+        self._contexts = {self._main: {}}
+        self._previous_trace = settrace(self._trace)
+        try:
+            self._loop.call_soon(self._spawn_next)
+            while self._pending or self._active:
+                # Отдаём управление диспетчеру Playwright; возвращаемся, когда завершается тест
+                playwright._dispatcher_fiber.switch()
+        finally:
+            settrace(self._previous_trace)
+            self._contexts.clear()
+            self._slots = []
+
+    def _spawn_next(self) -> None:
+        """Запускает следующий тест пачки, если есть свободный контекст и никто не в setup."""
+        if not self._pending or self._in_setup is not None or len(self._active) >= self.contexts_per_worker:
+            return
+        item = self._pending.pop(0)
+        runner = greenlet(lambda: self._run_in_greenlet(item), parent=self._main)
+        main_values = self._contexts[self._main]
+        self._contexts[runner] = {slot: slot.fresh(main_values[slot], item, runner) for slot in self._slots}
+        self._active[runner] = item
+        self._in_setup = item
+        runner.switch()
+
+    def _run_in_greenlet(self, item: Item) -> None:
+        """Тело гринлета: протокол теста и освобождение места для следующего."""
+        try:
+            self._run_protocol(item)
+        except BaseException as e:
+            logger.error(f"Concurrent run of {item.nodeid} crashed: {e}")
+            self._errors.append(e)
+        finally:
+            runner = greenlet.getcurrent()
+            del self._active[runner]
+            if self._in_setup is item:
+                self._in_setup = None
+            self._loop.call_soon(self._spawn_next)
+
+    def _trace(self, event: str, args: tuple) -> None:
+        """Сохраняет состояние уходящего теста и восстанавливает состояние получающего управление."""
+        if event in ("switch", "throw"):
+            origin, target = args
+            if origin in self._contexts:
+                values = self._contexts[origin]
+                for slot in self._slots:
+                    values[slot] = slot.get()
+                if origin is not self._main and origin not in self._active:
+                    # Тест завершился: переносим в главный гринлет то, что относится к сессии
+                    main_values = self._contexts[self._main]
+                    for slot in self._slots:
+                        slot.merge(main_values[slot], values[slot])
+                    del self._contexts[origin]
+            if target in self._contexts:
+                values = self._contexts[target]
+                for slot in self._slots:
+                    slot.set(values[slot])
+        if self._previous_trace is not None:
+            self._previous_trace(event, args)
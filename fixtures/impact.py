@@ -0,0 +1,165 @@
+from typing import Any, Generator, Optional
+
+import pytest
+from _pytest.nodes import Item
+
+from fixtures.settings import read_cache, shared_value, write_cache
+from tools.impact import DependencyRecorder, changed_files, classify
+from tools.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Ключ кеша pytest (.pytest_cache) с картой зависимостей тестов: {nodeid: [модули]}
+CACHE_KEY = "impact/dependency_map"
+
+# Ключ для хранения данных выбора тестов (изменения и карта зависимостей)
+SELECTION_KEY = pytest.StashKey[Optional[dict[str, Any]]]()
+
+# Ключ для хранения регистратора зависимостей
+RECORDER_KEY = pytest.StashKey[DependencyRecorder]()
+
+# Зависимости тестов, записанные этим процессом
+_recorded: dict[str, list[str]] = {}
+
+
+def pytest_addoption(parser):
+    """Опции выбора тестов по изменениям"""
+    parser.addoption('--record-deps', action='store_true', default=False,
+                     help="Record which page objects, locators, elements and data modules each test "
+                          "executes (dependency map for --changed-since)")
+    parser.addoption('--changed-since', action='store', default=None, metavar="REV",
+                     help="Run only tests affected by changes since the git revision REV "
+                          "(full run if fixtures, tools or config changed or no dependency map exists)")
+
+
+def _selection(config: pytest.Config, rev: str) -> Optional[dict[str, Any]]:
+    """
+    Определяет изменения с ревизии и нужен ли полный прогон.
+
+    :param config: Объект конфигурации pytest.
+    :param rev: Ревизия git.
+    :return: {"tracked": [...], "tests": [...], "map": {...}} или None для полного прогона.
+    """
+    try:
+        files = changed_files(rev, config.rootpath)
+    except RuntimeError as e:
+        logger.warning(f"--changed-since: {e}; running all tests")
+        return None
+    tracked, tests, full = classify(files)
+    if full:
+        logger.info(f"--changed-since {rev}: running all tests, changed {', '.join(full[:5])}"
+                    f"{' ...' if len(full) > 5 else ''} may affect any test")
+        return None
+    dependency_map = read_cache(config, CACHE_KEY, {})
+    if not dependency_map:
+        logger.info(f"--changed-since {rev}: no dependency map (run with --record-deps), running all tests")
+        return None
+    logger.info(f"--changed-since {rev}: {len(tracked)} page object/data modules and {len(tests)} test "
+                f"modules changed")
+    return {"tracked": sorted(tracked), "tests": sorted(tests), "map": dependency_map}
+
+
+@pytest.hookimpl
+def pytest_configure(config: pytest.Config) -> None:
+    """
+    Готовит выбор тестов по изменениям и запись зависимостей.
+
+    git и карта зависимостей читаются один раз на прогон, поэтому все воркеры pytest-xdist
+    отбирают одни и те же тесты.
+
+    :param config: Объект конфигурации pytest.
+    :raises pytest.UsageError: Если --record-deps задан вместе с --contexts-per-worker больше 1.
+    """
+    if config.getoption("--record-deps"):
+        # Регистратор (sys.settrace) один на поток, а тесты пачки --contexts-per-worker
+        # чередуются в гринлетах одного потока: их зависимости перемешались бы
+        if config.getoption("--contexts-per-worker", 1) > 1:
+            raise pytest.UsageError("--record-deps cannot be combined with --contexts-per-worker > 1: "
+                                    "dependencies of interleaved concurrent tests would be mixed up")
+        config.stash[RECORDER_KEY] = DependencyRecorder(config.rootpath)
+    rev = config.getoption("--changed-since")
+    if rev is None:
+        return
+    config.stash[SELECTION_KEY] = shared_value(config, "impact", lambda: _selection(config, rev))
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(session: pytest.Session, config: pytest.Config, items: list[Item]) -> None:
+    """
+    Оставляет только тесты, затронутые изменениями.
+
+    Тест выбирается, если изменён его модуль, если в его зависимостях есть изменённый
+    модуль или если его нет в карте зависимостей (новый или ещё не записанный тест).
+
+    :param session: Объект сессии pytest.
+    :param config: Объект конфигурации pytest.
+    :param items: Список тестовых элементов (Pytest Item).
+    """
+    selection = config.stash.get(SELECTION_KEY, None)
+    if selection is None:
+        return
+    tracked, tests, dependency_map = set(selection["tracked"]), set(selection["tests"]), selection["map"]
+    selected, deselected = [], []
+    for item in items:
+        module = item.path.resolve().relative_to(config.rootpath.resolve()).as_posix()
+        dependencies = dependency_map.get(item.nodeid)
+        if module in tests or dependencies is None or tracked.intersection(dependencies):
+            selected.append(item)
+        else:
+            deselected.append(item)
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+    logger.info(f"--changed-since: {len(selected)} affected tests selected, {len(deselected)} deselected")
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_protocol(item: Item, nextitem: Optional[Item]) -> Generator[None, Any, Any]:
+    """
+    Записывает модули, код которых выполнялся в setup, теле и teardown теста (--record-deps).
+
+    :param item: Тестовый элемент (Pytest Item).
+    :param nextitem: Следующий тестовый элемент.
+    """
+    recorder = item.config.stash.get(RECORDER_KEY, None)
+    if recorder is None:
+        return (yield)
+    recorder.start()
+    try:
+        return (yield)
+    finally:
+        touched = recorder.stop() | recorder.static(getattr(item, "module", None))
+        _recorded[item.nodeid] = sorted(touched)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error) -> None:
+    """
+    Хук pytest-xdist: добавляет зависимости тестов воркера к данным контроллера.
+
+    :param node: Узел воркера pytest-xdist (WorkerController).
+    :param error: Ошибка воркера, если он завершился аварийно.
+    """
+    _recorded.update(getattr(node, "workeroutput", {}).get("impact_deps", {}))
+
+
+@pytest.hookimpl
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    """
+    Передаёт зависимости воркера контроллеру или обновляет карту в кеше pytest.
+
+    Карта обновляется только для выполненных тестов, записи остальных сохраняются.
+
+    :param session: Объект сессии pytest.
+    """
+    config = session.config
+    if not config.getoption("--record-deps"):
+        return
+    if hasattr(config, "workeroutput"):
+        config.workeroutput["impact_deps"] = _recorded
+        return
+    if not _recorded:
+        return
+    dependency_map = {**read_cache(config, CACHE_KEY, {}), **_recorded}
+    if write_cache(config, CACHE_KEY, dependency_map):
+        logger.info(f"Dependency map saved: {len(_recorded)} tests recorded, {len(dependency_map)} total")
@@ -0,0 +1,108 @@
+from typing import Optional
+
+import pytest
+
+from fixtures.settings import get_settings, read_cache, shared_value, write_cache
+from tools.app_build import fetch_build_fingerprint
+from tools.locator_cache import locator_cache
+from tools.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Ключ кеша pytest (.pytest_cache) с проверенными заменами селекторов
+CACHE_KEY = "locator_cache/substitutes"
+
+# Сколько самых медленных селекторов выводить в отчёте
+_REPORT_LIMIT = 10
+
+# Ключ для хранения отпечатка сборки приложения, к которой привязаны замены
+BUILD_KEY = pytest.StashKey[Optional[str]]()
+
+
+def pytest_addoption(parser):
+    """Опции слоя локаторов"""
+    parser.addoption('--locator-cache', action='store_true', default=False,
+                     help="Measure locator resolution time, replace role/text selectors with verified "
+                          "id/data-attribute selectors cached per app build, and report the slowest selectors")
+
+
+def _load_substitutes(config: pytest.Config) -> dict:
+    """
+    Определяет сборку приложения и читает из кеша pytest замены, проверенные на этой сборке.
+
+    :param config: Объект конфигурации pytest.
+    :return: {"build": отпечаток сборки, "substitutes": {ключ локатора: замена}}.
+    """
+    build = fetch_build_fingerprint(str(get_settings(config).app_url))
+    cached = read_cache(config, CACHE_KEY, {}) if build else {}
+    substitutes = cached.get("selectors", {}) if cached.get("build") == build else {}
+    logger.info(f"Locator cache enabled for build {build}: {len(substitutes)} verified selectors loaded")
+    return {"build": build, "substitutes": substitutes}
+
+
+@pytest.hookimpl
+def pytest_configure(config: pytest.Config) -> None:
+    """
+    Включает слой локаторов и загружает проверенные замены для текущей сборки приложения.
+
+    :param config: Объект конфигурации pytest.
+    """
+    if not config.getoption("--locator-cache"):
+        return
+    loaded = shared_value(config, "locator_cache", lambda: _load_substitutes(config))
+    config.stash[BUILD_KEY] = loaded["build"]
+    locator_cache.enable(loaded["substitutes"])
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error) -> None:
+    """
+    Хук pytest-xdist: добавляет замены и статистику воркера к данным контроллера.
+
+    :param node: Узел воркера pytest-xdist (WorkerController).
+    :param error: Ошибка воркера, если он завершился аварийно.
+    """
+    output = getattr(node, "workeroutput", {}).get("locator_cache")
+    if output:
+        locator_cache.merge(output["substitutes"], output["stats"])
+
+
+@pytest.hookimpl
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    """
+    Передаёт данные воркера контроллеру или сохраняет замены в кеш pytest.
+
+    :param session: Объект сессии pytest.
+    """
+    if not locator_cache.enabled:
+        return
+    config = session.config
+    if hasattr(config, "workeroutput"):
+        config.workeroutput["locator_cache"] = {
+            "substitutes": locator_cache.substitutes,
+            "stats": locator_cache.stats,
+        }
+        return
+    build = config.stash.get(BUILD_KEY, None)
+    if build and write_cache(config, CACHE_KEY, {"build": build, "selectors": locator_cache.substitutes}):
+        logger.info(f"Locator cache saved for build {build}: {len(locator_cache.substitutes)} selectors")
+
+
+@pytest.hookimpl
+def pytest_terminal_summary(terminalreporter, config: pytest.Config) -> None:
+    """
+    Выводит отчёт о самых медленных селекторах.
+
+    :param terminalreporter: Плагин вывода в терминал.
+    :param config: Объект конфигурации pytest.
+    """
+    rows = locator_cache.slowest(_REPORT_LIMIT) if locator_cache.enabled else []
+    if not rows:
+        return
+    terminalreporter.write_sep("=", "slowest selectors")
+    terminalreporter.write_line(f"{'mean ms':>9} {'max ms':>9} {'count':>6}  locator")
+    for row in rows:
+        substitute = f"  ->  {row['substitute']}" if row["substitute"] else ""
+        terminalreporter.write_line(
+            f"{row['mean_ms']:9.1f} {row['max_ms']:9.1f} {row['count']:6d}  {row['selector']}{substitute}"
+        )
@@ -0,0 +1,63 @@
+import json
+from contextlib import contextmanager
+from typing import Any, Generator, Iterator
+
+import allure
+import pytest
+from _pytest.nodes import Item
+
+from fixtures.settings import get_settings
+from tools.logger import get_logger
+from tools.network_recorder import NETWORK_RECORDER_KEY
+
+logger = get_logger(__name__)
+
+@contextmanager
+def network_accounting(item: Item, reset: bool = False, name: str = "Network") -> Iterator[None]:
+    """
+    Сохраняет сетевую статистику тела теста и проверяет бюджеты маршрутов после него.
+
+    Статистика прикрепляется к Allure и добавляется в user_properties теста (попадает
+    в junitxml). Превышение бюджетов в режиме NETWORK_BUDGETS=fail роняет тест,
+    в режиме warn — записывается в лог и в Allure.
+
+    :param item: Тестовый элемент (Pytest Item).
+    :param reset: Обнулить счётчики перед телом (повтор теста на той же странице).
+    :param name: Имя вложения Allure.
+    """
+    recorder = item.stash.get(NETWORK_RECORDER_KEY, None)
+    if recorder is None:
+        yield
+        return
+    if reset:
+        recorder.reset()
+    try:
+        yield
+    finally:
+        violations = recorder.finish()
+        stats = recorder.stats
+        item.user_properties.append(("network", stats))
+        allure.attach(json.dumps(stats, indent=2, sort_keys=True), name=name,
+                      attachment_type=allure.attachment_type.JSON)
+        logger.info(f"{name}: {stats['requests']} requests, {stats['bytes'] / 1024:.0f} KiB, "
+                    f"{stats['failed']} failed")
+    mode = get_settings(item.config).network_budgets
+    if violations and mode != "off":
+        message = "Network budget exceeded:\n" + "\n".join(f"  {violation}" for violation in violations)
+        allure.attach(message, name="Network budget", attachment_type=allure.attachment_type.TEXT)
+        if mode == "fail":
+            raise AssertionError(message)
+        logger.warning(message)
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item: Item) -> Generator[None, Any, Any]:
+    """
+    Учитывает сетевые запросы тела теста (см. network_accounting).
+
+    Повторы тела при кратковременном сбое (fixtures/retry.py) учитываются отдельно.
+
+    :param item: Тестовый элемент (Pytest Item).
+    """
+    with network_accounting(item):
+        return (yield)
@@ -1,17 +1,28 @@
+import json
+import time
 import uuid
-from typing import Generator, Any
+from typing import Generator, Any, Optional, TYPE_CHECKING
 import allure
 import pytest
 from _pytest.nodes import Item
 from _pytest.runner import CallInfo
-from playwright.sync_api import Playwright, Page, expect, Browser, BrowserContext
-from config import Settings
+from playwright.sync_api import Playwright, Page, Browser, BrowserContext
 from tools.logger import get_logger
 from pathlib import Path
 from pages.web_tables_page import WebTablePage
-from tenacity import retry, stop_after_attempt, wait_fixed
+from tools import time_budget
+from tools.adaptive_timeouts import adaptive_timeouts
+from tools.animations import disable_animations
+from tools.network_recorder import NetworkRecorder, start_network_recording
+from tools.page_metrics import page_metrics
+from tools.request_router import RequestRouter
+from tools.trace_report import TraceReport
 # from page_fixtures.registration_page import RegistrationPage
 
+if TYPE_CHECKING:
+    # Только для аннотаций: pydantic-settings загружается при первом обращении к фикстуре settings
+    from config import Settings
+
 logger = get_logger(__name__)
 
 # Ключ для хранения результата теста в stash
@@ -39,7 +50,6 @@ def pytest_runtest_makereport(item: Item, call: CallInfo) -> Generator[None, Any
         item.stash[TEST_RESULT_KEY] = rep.outcome
         logger.debug(f"Saved test result for {item.nodeid}: {rep.outcome}")
 
-@retry(stop=stop_after_attempt(3), wait=wait_fixed(1))
 def safe_unlink(video_path: Path) -> None:
     """
     Безопасно удаляет файл с повторными попытками в случае ошибки.
@@ -49,7 +59,11 @@ def safe_unlink(video_path: Path) -> None:
 
     :param video_path: Путь к файлу, который нужно удалить.
     """
-    video_path.unlink(missing_ok=True)
+    # tenacity нужен только при удалении видео, поэтому не импортируется при загрузке плагина
+    from tenacity import Retrying, stop_after_attempt, wait_fixed
+    for attempt in Retrying(stop=stop_after_attempt(3), wait=wait_fixed(1), reraise=True):
+        with attempt:
+            video_path.unlink(missing_ok=True)
 
 
 def attach_video_to_allure(video_path: Path) -> None:
@@ -74,50 +88,40 @@ def attach_video_to_allure(video_path: Path) -> None:
     else:
         logger.info(f"No video to attach or video file not found: {video_path}")
 
-@pytest.fixture
-def page(playwright: Playwright, settings: Settings, request: pytest.FixtureRequest) -> Generator[Page, None, None]:
+# Директории, уже проверенные в этом процессе
+_ensured_directories: set[Path] = set()
+
+
+def ensure_directory(directory: Path) -> None:
     """
-    Фикстура для запуска браузера и создания новой страницы с учётом настроек.
+    Создаёт директорию артефактов, если её ещё нет.
 
-    Инициализирует браузер в зависимости от `settings.browser_name` (chromium, firefox, webkit, remote_browser).
-    Применяет все параметры из `settings`:
-    - `app_url`: Базовый URL для контекста.
-    - `headless`: Режим без графического интерфейса (для локальных браузеров; для remote_browser задаётся на сервере).
-    - `window_size`: Размер окна браузера.
-    - `slow`: Замедление выполнения (для отладки).
-    - `local`: Локаль браузера (например, 'ru-RU').
-    - `videos_dir`: Директория для сохранения видео.
-    - `tracing_dir`: Директория для сохранения трейсов.
-    - `screenshots_dir`: Директория для сохранения скриншотов.
-    - `expect_timeout`: Таймаут для ожиданий Playwright.
+    Проверка выполняется один раз на процесс: повторные вызовы для того же пути
+    ничего не делают, поэтому фикстуры могут вызывать функцию в каждом тесте.
 
-    Включает запись видео и трейсинга (screenshots, snapshots, sources).
-    После теста:
-    - Сохраняет трейс в `settings.tracing_dir`.
-    - Прикрепляет видео и скриншот к Allure только если тест упал (failed).
-    - Удаляет видео для успешных или пропущенных тестов.
-    - Закрывает контекст и браузер.
+    :param directory: Путь к директории.
+    :raises OSError: Если директорию не удалось создать.
+    """
+    if directory in _ensured_directories:
+        return
+    try:
+        directory.mkdir(exist_ok=True, parents=True)
+        logger.debug(f"Directory ensured: {directory}")
+    except Exception as e:
+        logger.error(f"Failed to create directory {directory}: {e}")
+        raise
+    _ensured_directories.add(directory)
+
+
+def launch_browser(playwright: Playwright, settings: 'Settings') -> Browser:
+    """
+    Запускает браузер (или подключается к удалённому) в зависимости от `settings.browser_name`.
 
     :param playwright: Объект Playwright, предоставляемый pytest-playwright.
     :param settings: Настройки проекта (экземпляр Settings).
-    :param request: Объект pytest для доступа к контексту теста (FixtureRequest).
-    :yield: Новый объект `Page` для каждого теста.
+    :return: Запущенный браузер.
     :raises ValueError: Если указан неподдерживаемый browser_name или отсутствует ws_endpoint для remote_browser.
     """
-    logger.info("Starting page fixture setup")
-    # Установка глобального таймаута для ожиданий в Playwright
-    expect.set_options(timeout=settings.expect_timeout)
-
-    # Проверка и создание директорий для видео, трейсов и скриншотов
-    for directory in (settings.videos_dir, settings.tracing_dir, settings.screenshots_dir):
-        try:
-            directory.mkdir(exist_ok=True, parents=True)
-            logger.debug(f"Directory ensured: {directory}")
-        except Exception as e:
-            logger.error(f"Failed to create directory {directory}: {e}")
-            raise
-
-    # Выбор браузера в зависимости от settings.browser_name
     browser: Browser
     if settings.browser_name == "chromium":
         logger.info(f"Launching Chromium browser (headless={settings.headless})")
@@ -141,15 +145,145 @@ def page(playwright: Playwright, settings: Settings, request: pytest.FixtureRequ
         if not hasattr(settings, "remote_browser") or not settings.remote_browser:
             raise ValueError("Missing or invalid ws_endpoint in settings.remote_browser for remote_browser")
         logger.info(f"Connecting to remote browser at {settings.remote_browser} (headless={settings.headless})")
+        started = time.perf_counter()
         browser = playwright.chromium.connect(
             ws_endpoint=settings.remote_browser,
             slow_mo=settings.slow,
-            timeout=30000  # Таймаут для подключения в миллисекундах
+            # Таймаут для подключения в миллисекундах (30 секунд или по истории подключений)
+            timeout=adaptive_timeouts.timeout("connect", default=30000)
         )
+        adaptive_timeouts.record("connect", milliseconds=(time.perf_counter() - started) * 1000)
     else:
         raise ValueError(
             f"Unsupported browser: {settings.browser_name}. Supported: chromium, firefox, webkit, remote_browser"
         )
+    return browser
+
+
+def create_context(browser: Browser, settings: 'Settings', video_dir: Optional[Path] = None) -> BrowserContext:
+    """
+    Создаёт контекст браузера с общими для всех тестов настройками.
+
+    :param browser: Браузер, в котором создаётся контекст.
+    :param settings: Настройки проекта (экземпляр Settings).
+    :param video_dir: Директория для записи видео (используется, если видео включено в .env).
+    :return: Новый контекст браузера.
+    """
+    context = browser.new_context(
+        base_url=str(settings.app_url),
+        viewport=settings.window_size,
+        locale=settings.local,
+        **({"reduced_motion": "reduce"} if settings.disable_animations else {}),
+        **({"record_video_dir": video_dir} if settings.video and video_dir else {}) # добавляем запись видео, если включена в .env
+    )
+    # Блокировка сторонних запросов (реклама, аналитика, шрифты) по правилам из settings
+    RequestRouter.install(context, settings)
+    # Учёт запросов, байтов и времени по типам ресурсов для сетевых бюджетов маршрутов
+    NetworkRecorder.install(context)
+    # PerformanceObserver'ы LCP, CLS и длинных задач для метрик страниц (WEB_VITALS в .env)
+    page_metrics.install(context)
+    # Модальные окна и подсветка полей без анимаций (DISABLE_ANIMATIONS в .env)
+    if settings.disable_animations:
+        disable_animations(context)
+    return context
+
+
+def attach_blocked_requests(context: BrowserContext) -> None:
+    """
+    Прикрепляет к Allure счётчики заблокированных запросов текущего теста и обнуляет их.
+
+    :param context: Контекст браузера теста.
+    """
+    router = RequestRouter.of(context)
+    if router is None:
+        return
+    stats = router.stats
+    router.reset()
+    logger.info(f"Blocked {stats['blocked']} requests ({stats['mode']}), ~{stats['bytes_saved']} bytes saved")
+    allure.attach(
+        json.dumps(stats, ensure_ascii=False, indent=2, sort_keys=True),
+        name="Blocked requests",
+        attachment_type=allure.attachment_type.JSON
+    )
+
+
+def attach_trace_summary(tracing_file: Path) -> None:
+    """
+    Прикрепляет к Allure сводку трейса: самые медленные действия, ожидания и запросы.
+
+    :param tracing_file: Путь к сохранённому архиву трейса.
+    """
+    try:
+        summary = TraceReport.of([tracing_file]).render(top=10)
+    except Exception as e:
+        logger.error(f"Failed to summarize trace {tracing_file}: {e}")
+        return
+    allure.attach(summary, name="Trace summary", attachment_type=allure.attachment_type.TEXT)
+
+
+@pytest.fixture(scope="session")
+def shared_browser(playwright: Playwright, settings: 'Settings') -> Generator[Browser, None, None]:
+    """
+    Фикстура одного браузера на воркер для режима --contexts-per-worker.
+
+    Тесты, которые планировщик выполняет одновременно, создают свои BrowserContext
+    в этом браузере вместо запуска отдельного браузера на каждый тест.
+
+    :param playwright: Объект Playwright, предоставляемый pytest-playwright.
+    :param settings: Настройки проекта (экземпляр Settings).
+    :yield: Запущенный браузер.
+    """
+    browser = launch_browser(playwright, settings)
+    yield browser
+    try:
+        browser.close()
+        logger.info("Shared browser closed")
+    except Exception as e:
+        logger.error(f"Failed to close shared browser: {e}")
+
+
+@pytest.fixture
+def page(playwright: Playwright, settings: 'Settings', request: pytest.FixtureRequest) -> Generator[Page, None, None]:
+    """
+    Фикстура для запуска браузера и создания новой страницы с учётом настроек.
+
+    Инициализирует браузер в зависимости от `settings.browser_name` (chromium, firefox, webkit, remote_browser).
+    При --contexts-per-worker > 1 использует общий браузер воркера (фикстура `shared_browser`).
+    Применяет все параметры из `settings`:
+    - `app_url`: Базовый URL для контекста.
+    - `headless`: Режим без графического интерфейса (для локальных браузеров; для remote_browser задаётся на сервере).
+    - `window_size`: Размер окна браузера.
+    - `slow`: Замедление выполнения (для отладки).
+    - `local`: Локаль браузера (например, 'ru-RU').
+    - `videos_dir`: Директория для сохранения видео.
+    - `tracing_dir`: Директория для сохранения трейсов.
+    - `screenshots_dir`: Директория для сохранения скриншотов.
+    - `expect_timeout`: Таймаут для ожиданий Playwright.
+
+    Включает запись видео и трейсинга (screenshots, snapshots, sources).
+    После теста:
+    - Сохраняет трейс в `settings.tracing_dir`.
+    - Прикрепляет видео и скриншот к Allure только если тест упал (failed).
+    - Удаляет видео для успешных или пропущенных тестов.
+    - Закрывает контекст и браузер.
+
+    :param playwright: Объект Playwright, предоставляемый pytest-playwright.
+    :param settings: Настройки проекта (экземпляр Settings).
+    :param request: Объект pytest для доступа к контексту теста (FixtureRequest).
+    :yield: Новый объект `Page` для каждого теста.
+    :raises ValueError: Если указан неподдерживаемый browser_name или отсутствует ws_endpoint для remote_browser.
+    """
+    logger.info("Starting page fixture setup")
+    # Установка глобального таймаута для ожиданий в Playwright (из .env или по истории ожиданий)
+    time_budget.set_expect_timeout(adaptive_timeouts.timeout("expect", default=settings.expect_timeout))
+
+    # Проверка и создание директорий для видео, трейсов и скриншотов (реально только в первом тесте воркера)
+    for directory in (settings.videos_dir, settings.tracing_dir, settings.screenshots_dir):
+        ensure_directory(directory)
+
+    # Браузер: общий для воркера в режиме --contexts-per-worker, иначе свой на каждый тест
+    shared = request.config.getoption("--contexts-per-worker") > 1
+    browser: Browser = request.getfixturevalue("shared_browser") if shared else launch_browser(playwright, settings)
 
     # Добавляем параметр в Allure
     allure.dynamic.parameter("Browser", browser.browser_type.name) # имя вызванного браузера (в имени
@@ -161,23 +295,14 @@ def page(playwright: Playwright, settings: Settings, request: pytest.FixtureRequ
     if request.config.getoption("--dist") and hasattr(request.config, "workerinput"):
         worker_id = request.config.workerinput.get("workerid", "main")
     video_dir = settings.videos_dir / worker_id
-    try:
-        video_dir.mkdir(exist_ok=True)
-        logger.debug(f"Video directory ensured for worker {worker_id}: {video_dir}")
-    except Exception as e:
-        logger.error(f"Failed to create video directory {video_dir}: {e}")
-        raise
+    ensure_directory(video_dir)
 
     # Создание контекста браузера с настройками
-    context: BrowserContext = browser.new_context(
-        base_url=str(settings.app_url),
-        viewport=settings.window_size,
-        locale=settings.local,
-        **({"record_video_dir": video_dir} if settings.video else {}) # добавляем запись видео, если включена в .env
-    )
+    context: BrowserContext = create_context(browser, settings, video_dir=video_dir)
     # Включение трейсинга (снимки экрана, DOM-снапшоты, исходный код)
     context.tracing.start(screenshots=True, snapshots=True, sources=True)
     logger.info("Browser context created with tracing and video recording")
+    start_network_recording(context, request.node)
 
     # Создание новой страницы
     logger.info("Creating new page")
@@ -193,6 +318,9 @@ def page(playwright: Playwright, settings: Settings, request: pytest.FixtureRequ
     finally:
         logger.info("Cleaning up page fixture")
 
+    # Счётчики заблокированных сторонних запросов
+    attach_blocked_requests(context)
+
     # Сохранение трейсинга
     tracing_file = settings.tracing_dir.joinpath(f'{uuid.uuid4()}.zip')
 
@@ -212,6 +340,7 @@ def page(playwright: Playwright, settings: Settings, request: pytest.FixtureRequ
                 name='trace',
                 attachment_type='application/zip'
             )
+            attach_trace_summary(tracing_file)
             logger.info(f"Trace saved and attached for failed test: {tracing_file}")
         except Exception as e:
             logger.error(f"Failed to save or attach trace {tracing_file}: {e}")
@@ -270,26 +399,48 @@ def page(playwright: Playwright, settings: Settings, request: pytest.FixtureRequ
     except Exception as e:
         logger.error(f"Failed to close context: {e}")
 
-    # Закрытие браузера
-    try:
-        browser.close()
-        logger.info("Browser closed")
-    except Exception as e:
-        logger.error(f"Failed to close browser: {e}")
+    # Закрытие браузера (общий браузер закрывается фикстурой shared_browser)
+    if not shared:
+        try:
+            browser.close()
+            logger.info("Browser closed")
+        except Exception as e:
+            logger.error(f"Failed to close browser: {e}")
+
+def batch_key(item: Item) -> Optional[tuple[str, str]]:
+    """
+    Возвращает ключ, по которому кейсы делят одну страницу в режиме --batch-cases.
+
+    Кейсы одного теста с одинаковым параметром `field` отличаются только значением
+    этого поля, поэтому могут выполняться на одной загруженной странице.
+
+    :param item: Тестовый элемент.
+    :return: (nodeid родителя + имя теста, поле) или None, если тест не параметризован по полю.
+    """
+    callspec = getattr(item, "callspec", None)
+    if callspec is None or "field" not in callspec.params:
+        return None
+    return f"{item.parent.nodeid}::{item.originalname}", callspec.params["field"]
+
 
 @pytest.fixture
-def webtable_page(page: Page) -> WebTablePage:
+def webtable_page(request: pytest.FixtureRequest) -> WebTablePage:
     """
     Фикстура для инициализации страницы Web Tables.
 
-    :param page: Страница браузера, созданная через фикстуру `page`.
-    :param settings: Настройки проекта (экземпляр Settings).
+    В режиме --batch-cases кейсы, параметризованные по полю формы, получают общую
+    уже загруженную страницу из фикстуры `batched_webtable_page`; иначе страница
+    создаётся фикстурой `page` для каждого теста.
+
+    :param request: Объект pytest для доступа к контексту теста (FixtureRequest).
     :return: Объект `WebTablePage` для использования в тестах.
     """
-    return WebTablePage(page=page)
+    if request.config.getoption("--batch-cases") and batch_key(request.node) is not None:
+        return request.getfixturevalue("batched_webtable_page")
+    return WebTablePage(page=request.getfixturevalue("page"))
 
 # @pytest.fixture
-# def registration_page(page: Page, settings: Settings) -> RegistrationPage:
+# def registration_page(page: Page, settings: 'Settings') -> RegistrationPage:
 #     """
 #     Фикстура для инициализации страницы регистрации.
 #
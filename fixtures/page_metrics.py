@@ -0,0 +1,31 @@
+import uuid
+
+import pytest
+
+from fixtures.settings import get_settings, shared_value
+from tools.app_build import fetch_build_fingerprint
+from tools.logger import get_logger
+from tools.page_metrics import page_metrics
+
+logger = get_logger(__name__)
+
+
+@pytest.hookimpl
+def pytest_configure(config: pytest.Config) -> None:
+    """
+    Включает сбор метрик страниц, если он включён в настройках (WEB_VITALS в .env).
+
+    Идентификатор прогона и сборка приложения определяются один раз на прогон: записи всех
+    воркеров одного прогона во временном ряду связаны общим идентификатором.
+
+    :param config: Объект конфигурации pytest.
+    """
+    settings = get_settings(config)
+    if not settings.web_vitals:
+        return
+    run = shared_value(config, "page_metrics", lambda: {
+        "run": uuid.uuid4().hex[:12],
+        "build": fetch_build_fingerprint(str(settings.app_url)),
+    })
+    page_metrics.enable(settings.web_vitals_file, settings.browser_name, run["run"], run["build"])
+    logger.info(f"Page metrics enabled for run {run['run']} (build {run['build']}): {settings.web_vitals_file}")
@@ -0,0 +1,69 @@
+import pytest
+
+from fixtures.settings import read_cache, shared_value, write_cache
+from tools import request_router
+from tools.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Ключ кеша pytest (.pytest_cache) с размерами ответов сторонних запросов
+CACHE_KEY = "request_blocking/sizes"
+
+
+@pytest.hookimpl
+def pytest_configure(config: pytest.Config) -> None:
+    """
+    Загружает размеры ответов, запомненные в режиме observe, для оценки сэкономленного трафика.
+
+    :param config: Объект конфигурации pytest.
+    """
+    request_router.known_sizes.update(shared_value(config, "request_sizes",
+                                                   lambda: read_cache(config, CACHE_KEY, {})))
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error) -> None:
+    """
+    Хук pytest-xdist: добавляет размеры ответов и итоги воркера к данным контроллера.
+
+    :param node: Узел воркера pytest-xdist (WorkerController).
+    :param error: Ошибка воркера, если он завершился аварийно.
+    """
+    output = getattr(node, "workeroutput", {}).get("request_blocking")
+    if output:
+        request_router.known_sizes.update(output["sizes"])
+        for name, value in output["totals"].items():
+            request_router.totals[name] += value
+
+
+@pytest.hookimpl
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    """
+    Передаёт данные воркера контроллеру или сохраняет размеры ответов в кеш pytest.
+
+    :param session: Объект сессии pytest.
+    """
+    config = session.config
+    if hasattr(config, "workeroutput"):
+        config.workeroutput["request_blocking"] = {
+            "sizes": request_router.known_sizes,
+            "totals": request_router.totals,
+        }
+        return
+    if request_router.known_sizes:
+        write_cache(config, CACHE_KEY, request_router.known_sizes)
+
+
+@pytest.hookimpl
+def pytest_terminal_summary(terminalreporter, config: pytest.Config) -> None:
+    """
+    Выводит итог блокировки сторонних запросов за сессию.
+
+    :param terminalreporter: Плагин вывода в терминал.
+    :param config: Объект конфигурации pytest.
+    """
+    totals = request_router.totals
+    if totals["blocked"]:
+        terminalreporter.write_line(
+            f"Third-party requests blocked: {totals['blocked']}, ~{totals['bytes_saved'] / 1024:.0f} KiB saved"
+        )
@@ -0,0 +1,221 @@
+import os
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+import allure
+import pytest
+from _pytest.nodes import Item
+from _pytest.reports import TestReport
+
+from fixtures.settings import get_settings, read_cache, shared_value, write_cache
+from tools.app_build import fetch_build_fingerprint
+from tools.logger import get_logger
+from tools.result_cache import ResultCache, result_cache, source_fingerprint
+
+logger = get_logger(__name__)
+
+# Ключ кеша pytest (.pytest_cache) с успешными результатами тестов
+CACHE_KEY = "result_cache/passed"
+
+# Каталоги page objects и данных кейсов, входящие в отпечаток исходников
+SOURCE_DIRS = ("pages", "components", "elements", "locators", "data")
+
+# Ключ для хранения отпечатка сборки приложения, к которой привязаны результаты
+BUILD_KEY = pytest.StashKey[Optional[str]]()
+
+# Ключ для хранения ключа результата теста в кеше
+RESULT_KEY = pytest.StashKey[str]()
+
+# nodeid -> ключ результата и nodeid тестов, тело которых прошло (ждут успешного teardown)
+_keys: dict[str, str] = {}
+_call_passed: set[str] = set()
+
+
+def pytest_addoption(parser):
+    """Опции кеша результатов"""
+    parser.addoption('--no-cache', action='store_true', default=False,
+                     help="Run every test even if it passed under the same key within RESULT_CACHE_TTL "
+                          "(results are still recorded)")
+
+
+def _load_entries(config: pytest.Config) -> Optional[dict[str, Any]]:
+    """
+    Определяет сборку приложения и читает записи кеша результатов из кеша pytest.
+
+    :param config: Объект конфигурации pytest.
+    :return: {"build": отпечаток сборки, "entries": записи} или None, если сборку определить не удалось.
+    """
+    build = fetch_build_fingerprint(str(get_settings(config).app_url))
+    if build is None:
+        logger.warning("Result cache disabled: app build fingerprint is unknown")
+        return None
+    return {"build": build, "entries": read_cache(config, CACHE_KEY, {})}
+
+
+@pytest.hookimpl
+def pytest_configure(config: pytest.Config) -> None:
+    """
+    Включает кеш результатов, если он включён в настройках (RESULT_CACHE_TTL в .env).
+
+    Если сборку приложения определить не удалось, кеш не используется: без неё нельзя
+    гарантировать, что приложение не изменилось.
+
+    :param config: Объект конфигурации pytest.
+    """
+    settings = get_settings(config)
+    if settings.result_cache_ttl <= 0:
+        return
+    loaded = shared_value(config, "result_cache", lambda: _load_entries(config))
+    if loaded is None:
+        return
+    read = not config.getoption("--no-cache")
+    config.stash[BUILD_KEY] = loaded["build"]
+    result_cache.enable(loaded["entries"], settings.result_cache_ttl, read)
+    if not hasattr(config, "workerinput"):
+        logger.info(f"Result cache enabled for build {loaded['build']}: {len(result_cache.entries)} passed "
+                    f"results within {settings.result_cache_ttl:g} h{'' if read else ' (--no-cache: not used)'}")
+
+
+def case_value(item: Item) -> Any:
+    """
+    Значение кейса теста: параметры теста.
+
+    Для кейсов валидации полей это имя кейса, поле и ожидаемый результат. Сгенерированные
+    данные кейса (TEST_CASES_MAP класса) в ключ не входят: Faker без seed даёт в каждом
+    прогоне новые значения, и ключ бы никогда не совпадал. Источник данных учитывается
+    отпечатком исходников (каталог data и файл FUZZ_CASES, см. data_sources()).
+
+    :param item: Тестовый элемент (Pytest Item).
+    :return: Сериализуемое значение кейса.
+    """
+    return dict(getattr(getattr(item, "callspec", None), "params", {}))
+
+
+def data_sources(root: Path) -> list[Path]:
+    """
+    Исходники page objects и данных кейсов, входящие в отпечаток.
+
+    :param root: Корень проекта (rootdir pytest).
+    :return: Каталоги SOURCE_DIRS и файл кейсов фаззинга (FUZZ_CASES), если он задан.
+    """
+    sources = [root / name for name in SOURCE_DIRS]
+    fuzz_cases = os.environ.get("FUZZ_CASES")
+    if fuzz_cases:
+        sources.append(Path(fuzz_cases))
+    return sources
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(session: pytest.Session, config: pytest.Config, items: list[Item]) -> None:
+    """
+    Вычисляет ключи результатов тестов.
+
+    :param session: Объект сессии pytest.
+    :param config: Объект конфигурации pytest.
+    :param items: Список тестовых элементов (Pytest Item).
+    """
+    if not result_cache.enabled:
+        return
+    page_objects = source_fingerprint(data_sources(config.rootpath), config.rootpath)
+    modules: dict[Path, str] = {}
+    browser = get_settings(config).browser_name
+    build = config.stash[BUILD_KEY]
+    for item in items:
+        if item.path not in modules:
+            modules[item.path] = source_fingerprint([item.path], config.rootpath)
+        sources = f"{page_objects}:{modules[item.path]}"
+        key = ResultCache.key(item.nodeid, case_value(item), browser, sources, build)
+        item.stash[RESULT_KEY] = key
+        _keys[item.nodeid] = key
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item: Item) -> None:
+    """
+    Пропускает тест, прошедший с тем же ключом в пределах RESULT_CACHE_TTL.
+
+    Пропущенный тест помечается в Allure тегом "cached".
+
+    :param item: Тестовый элемент (Pytest Item).
+    """
+    key = item.stash.get(RESULT_KEY, None)
+    entry = result_cache.lookup(key) if key is not None else None
+    if entry is not None:
+        allure.dynamic.tag("cached")
+        hours = (time.time() - entry["time"]) / 3600
+        pytest.skip(f"cached: passed {hours:.1f} h ago with the same case, page objects and app build")
+
+
+@pytest.hookimpl
+def pytest_runtest_logreport(report: TestReport) -> None:
+    """
+    Запоминает результат теста: прошедший — после успешного teardown, упавший — сразу.
+
+    Тесты, прошедшие только после повтора (flaky), как прошедшие не запоминаются.
+
+    :param report: Отчёт фазы теста.
+    """
+    key = _keys.get(report.nodeid)
+    if key is None:
+        return
+    if report.failed:
+        _call_passed.discard(report.nodeid)
+        result_cache.record(key, report.nodeid, passed=False)
+    elif report.when == "call" and report.passed:
+        # Прошедший только после повтора (flaky, fixtures/retry.py) тест должен выполниться снова
+        if not any(name == "retry" for name, _ in report.user_properties):
+            _call_passed.add(report.nodeid)
+    elif report.when == "teardown" and report.nodeid in _call_passed:
+        _call_passed.discard(report.nodeid)
+        result_cache.record(key, report.nodeid, passed=True)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error) -> None:
+    """
+    Хук pytest-xdist: добавляет результаты воркера к результатам контроллера.
+
+    :param node: Узел воркера pytest-xdist (WorkerController).
+    :param error: Ошибка воркера, если он завершился аварийно.
+    """
+    output = getattr(node, "workeroutput", {}).get("result_cache")
+    if output:
+        result_cache.merge(output["passed"], output["failed"])
+        result_cache.hits.extend(output["hits"])
+
+
+@pytest.hookimpl
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    """
+    Передаёт результаты воркера контроллеру или сохраняет записи в кеш pytest.
+
+    :param session: Объект сессии pytest.
+    """
+    if not result_cache.enabled:
+        return
+    config = session.config
+    if hasattr(config, "workeroutput"):
+        config.workeroutput["result_cache"] = {
+            "passed": result_cache.passed,
+            "failed": sorted(result_cache.failed),
+            "hits": result_cache.hits,
+        }
+        return
+    entries = result_cache.updated()
+    if write_cache(config, CACHE_KEY, entries):
+        logger.info(f"Result cache saved: {len(entries)} passed results")
+
+
+@pytest.hookimpl
+def pytest_terminal_summary(terminalreporter, config: pytest.Config) -> None:
+    """
+    Выводит число тестов, пропущенных по кешу результатов.
+
+    :param terminalreporter: Плагин вывода в терминал.
+    :param config: Объект конфигурации pytest.
+    """
+    if result_cache.hits:
+        terminalreporter.write_sep("=", "result cache")
+        terminalreporter.write_line(f"{len(result_cache.hits)} tests skipped: passed within RESULT_CACHE_TTL "
+                                    f"under the same key (run with --no-cache to execute them)")
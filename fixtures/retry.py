@@ -0,0 +1,181 @@
+import json
+import time
+from typing import Any, Generator, Optional
+
+import allure
+import pytest
+from _pytest.nodes import Item
+from _pytest.reports import TestReport
+from playwright.sync_api import Page
+
+from fixtures.network_budget import network_accounting
+from fixtures.page_fixtures import create_context
+from fixtures.settings import get_settings
+from pages.base_page import BasePage
+from tools.logger import get_logger
+from tools.network_recorder import start_network_recording
+from tools.retry import describe, is_transient, retry_policy
+
+logger = get_logger(__name__)
+
+# Итоги повторов по тестам (собираются из отчётов; на контроллере xdist — от всех воркеров)
+_flaky: list[tuple[str, list[dict[str, Any]]]] = []
+_hard: list[tuple[str, list[dict[str, Any]]]] = []
+_step_retries: dict[str, int] = {}
+
+
+@pytest.hookimpl
+def pytest_configure(config: pytest.Config) -> None:
+    """
+    Настраивает политику повторов из настроек (STEP_RETRIES, TEST_RETRIES в .env).
+
+    :param config: Объект конфигурации pytest.
+    """
+    settings = get_settings(config)
+    retry_policy.configure(settings.step_retries, settings.test_retries)
+    if settings.step_retries or settings.test_retries:
+        logger.info(f"Retries on transient failures: {settings.step_retries} per step, "
+                    f"{settings.test_retries} per test")
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item: Item) -> None:
+    """
+    Начинает учёт попыток шагов теста.
+
+    :param item: Тестовый элемент (Pytest Item).
+    """
+    retry_policy.begin_test()
+
+
+def _recover(item: Item) -> bool:
+    """
+    Готовит страницу теста к повтору в том же браузере.
+
+    Если страница теста закрыта (упала или закрыта из-за ошибки), создаётся новый контекст
+    в том же браузере, и фикстуры теста (Page и page objects) переключаются на новую страницу.
+
+    :param item: Тестовый элемент (Pytest Item).
+    :return: False, если повтор невозможен без перезапуска браузера.
+    """
+    funcargs = getattr(item, "funcargs", {})
+    pages = [value for value in funcargs.values() if isinstance(value, Page)]
+    pages += [value.page for value in funcargs.values() if isinstance(value, BasePage)]
+    closed = [page for page in pages if page.is_closed()]
+    if not closed:
+        return True
+    browser = closed[0].context.browser
+    if browser is None or not browser.is_connected():
+        logger.warning(f"Browser of {item.nodeid} is disconnected, not retrying")
+        return False
+    context = create_context(browser, get_settings(item.config))
+    item.addfinalizer(context.close)
+    start_network_recording(context, item)
+    page = context.new_page()
+    for name, value in funcargs.items():
+        if isinstance(value, Page):
+            funcargs[name] = page
+        elif isinstance(value, BasePage):
+            funcargs[name] = type(value)(page)
+    logger.info(f"Page of {item.nodeid} was closed, retrying in a new context")
+    return True
+
+
+def _attempt(number: int, started: float, error: Optional[BaseException]) -> dict[str, Any]:
+    return {"attempt": number, "ms": (time.perf_counter() - started) * 1000,
+            "error": describe(error) if error is not None else None}
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item: Item) -> Generator[None, Any, Any]:
+    """
+    Повторяет тело теста при кратковременном сбое, не перезапуская браузер (TEST_RETRIES).
+
+    Фикстуры не пересоздаются: повтор выполняется на той же странице (или в новом контексте
+    того же браузера, если страница закрылась). Время каждой попытки прикрепляется к Allure
+    ("Attempts"), итог ("flaky" — прошёл после повтора, "failed" — упал во всех попытках)
+    попадает в user_properties теста и в сводку в конце прогона. Сетевая статистика и бюджеты
+    проверяются для каждой попытки отдельно; тест "flaky" не попадает в кеш результатов.
+
+    :param item: Тестовый элемент (Pytest Item).
+    """
+    attempts: list[dict[str, Any]] = []
+    started = time.perf_counter()
+    error: Optional[Exception] = None
+    try:
+        result = yield
+    except Exception as e:
+        error = e
+        attempts.append(_attempt(1, started, e))
+    try:
+        while error is not None and len(attempts) < retry_policy.test_attempts:
+            if not is_transient(error) or not _recover(item):
+                break
+            number = len(attempts) + 1
+            logger.warning(f"Transient failure of {item.nodeid}, attempt {number}/{retry_policy.test_attempts}: "
+                           f"{describe(error)}")
+            started = time.perf_counter()
+            try:
+                # item.runtest() минует обёртки pytest_runtest_call: сетевой учёт попытки ведётся здесь
+                with allure.step(f"Test attempt {number} of {retry_policy.test_attempts}"), \
+                        network_accounting(item, reset=True, name=f"Network (attempt {number})"):
+                    item.runtest()
+            except Exception as e:
+                error = e
+                attempts.append(_attempt(number, started, e))
+            else:
+                error = None
+                attempts.append(_attempt(number, started, None))
+                result = None
+    finally:
+        steps = retry_policy.step_attempts_of_test()
+        if steps:
+            item.user_properties.append(("step_retries", steps))
+        if len(attempts) > 1:
+            outcome = "failed" if error is not None else "flaky"
+            item.user_properties.append(("retry", {"outcome": outcome, "attempts": attempts}))
+            if outcome == "flaky":
+                allure.dynamic.tag("flaky")
+        if len(attempts) > 1 or steps:
+            allure.attach(json.dumps({"test": attempts, "steps": steps}, indent=2), name="Attempts",
+                          attachment_type=allure.attachment_type.JSON)
+    if error is not None:
+        raise error
+    return result
+
+
+@pytest.hookimpl
+def pytest_runtest_logreport(report: TestReport) -> None:
+    """
+    Собирает итоги повторов из отчётов тела тестов.
+
+    :param report: Отчёт фазы теста.
+    """
+    if report.when != "call":
+        return
+    for name, value in report.user_properties:
+        if name == "retry":
+            (_flaky if value["outcome"] == "flaky" else _hard).append((report.nodeid, value["attempts"]))
+        elif name == "step_retries":
+            _step_retries[report.nodeid] = sum(1 for attempt in value if attempt["attempt"] > 1)
+
+
+@pytest.hookimpl
+def pytest_terminal_summary(terminalreporter, config: pytest.Config) -> None:
+    """
+    Выводит сводку повторов: тесты, прошедшие после повтора, и упавшие во всех попытках.
+
+    :param terminalreporter: Плагин вывода в терминал.
+    :param config: Объект конфигурации pytest.
+    """
+    if not (_flaky or _hard or any(_step_retries.values())):
+        return
+    terminalreporter.write_sep("=", "retries")
+    for title, rows in (("flaky (passed after retry)", _flaky), ("hard failures (failed on every attempt)", _hard)):
+        terminalreporter.write_line(f"{title}: {len(rows)}")
+        for nodeid, attempts in rows:
+            timings = ", ".join(f"{attempt['ms'] / 1000:.1f}s" for attempt in attempts)
+            terminalreporter.write_line(f"  {nodeid}  [{len(attempts)} attempts: {timings}]")
+    retried_steps = {nodeid: count for nodeid, count in _step_retries.items() if count}
+    if retried_steps:
+        terminalreporter.write_line(f"step retries: {sum(retried_steps.values())} in {len(retried_steps)} tests")
@@ -1,14 +1,19 @@
 import json
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
 
 import pytest
 from _pytest.nodes import Item
 import allure
-from config import Settings
 from tools.logger import get_logger
 
+if TYPE_CHECKING:
+    from config import Settings
+
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
 
 def pytest_addoption(parser):
     """Пользовательские опции командной строки"""
@@ -17,16 +22,115 @@ def pytest_addoption(parser):
                      help="Browser to use for tests: chromium, firefox, webkit, remote_browser")
 
 
+# Ключ для хранения настроек в config.stash (одни на процесс)
+SETTINGS_KEY = pytest.StashKey["Settings"]()
+
+
+def get_settings(config: pytest.Config) -> 'Settings':
+    """
+    Возвращает настройки сессии, создавая их при первом обращении.
+
+    На воркере pytest-xdist настройки восстанавливаются из копии, которую контроллер
+    передал в `workerinput` (без чтения .env и создания директорий). На контроллере
+    и без xdist настройки строятся из .env один раз и кешируются в `config.stash`.
+
+    :param config: Объект конфигурации pytest.
+    :return: Экземпляр класса Settings.
+    """
+    settings = config.stash.get(SETTINGS_KEY, None)
+    if settings is None:
+        # pydantic-settings загружается только здесь, а не при загрузке плагинов
+        from config import Settings
+        workerinput = getattr(config, "workerinput", {})
+        if "settings" in workerinput:
+            settings = Settings.from_serialized(workerinput["settings"])
+            logger.debug(f"Settings received from controller for worker {workerinput.get('workerid')}")
+        else:
+            settings = Settings.initialize(browser_name=config.getoption("--browser-name"))
+        config.stash[SETTINGS_KEY] = settings
+    return settings
+
+
+# Ключ для значений, которые контроллер вычисляет для воркеров (имя в `workerinput` -> значение)
+SHARED_KEY = pytest.StashKey[dict[str, Any]]()
+
+
+def shared_value(config: pytest.Config, name: str, compute: Callable[[], T]) -> T:
+    """
+    Возвращает значение, общее для контроллера pytest-xdist и всех его воркеров.
+
+    Контроллер (или процесс без xdist) вычисляет значение один раз вызовом `compute`
+    и запоминает его в `config.stash`; pytest_configure_node передаёт запомненные значения
+    каждому воркеру в `workerinput`, и воркер берёт значение оттуда, не вызывая `compute`.
+    Так плагины читают кеш pytest, ходят в сеть и т.п. один раз на прогон.
+
+    :param config: Объект конфигурации pytest.
+    :param name: Имя значения в `workerinput` (обычно имя плагина).
+    :param compute: Вычисление значения; результат должен передаваться через execnet
+        (словари, списки, строки, числа, None).
+    :return: Значение.
+    """
+    workerinput = getattr(config, "workerinput", {})
+    if name in workerinput:
+        return workerinput[name]
+    shared = config.stash.setdefault(SHARED_KEY, {})
+    if name not in shared:
+        shared[name] = compute()
+    return shared[name]
+
+
+def read_cache(config: pytest.Config, key: str, default: T) -> T:
+    """
+    Читает значение из кеша pytest (.pytest_cache).
+
+    :param config: Объект конфигурации pytest.
+    :param key: Ключ кеша.
+    :param default: Значение, если ключа нет или кеш отключён (-p no:cacheprovider).
+    :return: Значение из кеша или default.
+    """
+    cache = getattr(config, "cache", None)
+    return cache.get(key, default) if cache is not None else default
+
+
+def write_cache(config: pytest.Config, key: str, value: Any) -> bool:
+    """
+    Записывает значение в кеш pytest (.pytest_cache).
+
+    :param config: Объект конфигурации pytest.
+    :param key: Ключ кеша.
+    :param value: Значение (сериализуемое в JSON).
+    :return: False, если кеш отключён (-p no:cacheprovider) и значение не записано.
+    """
+    cache = getattr(config, "cache", None)
+    if cache is None:
+        return False
+    cache.set(key, value)
+    return True
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node) -> None:
+    """
+    Хук pytest-xdist: передаёт воркеру настройки и значения shared_value, вычисленные на контроллере.
+
+    Настройки создаются один раз на контроллере и отправляются каждому воркеру
+    в сериализованном виде, поэтому воркеры не повторяют загрузку .env.
+
+    :param node: Узел воркера pytest-xdist (WorkerController).
+    """
+    node.workerinput["settings"] = get_settings(node.config).model_dump(mode="json")
+    node.workerinput.update(node.config.stash.get(SHARED_KEY, {}))
+
+
 @pytest.fixture(scope="session")
-def settings(request) -> Settings:
+def settings(request) -> 'Settings':
     """
-    Фикстура создаёт объект с настройками один раз на всю тестовую сессию.
+    Фикстура возвращает объект с настройками, общий для всей тестовой сессии.
 
-    :param request: Объект pytest для доступа к аргументам командной строки.
+    :param request: Объект pytest для доступа к конфигурации.
     :return: Экземпляр класса Settings с загруженными конфигурациями.
     """
-    browser_name = request.config.getoption("--browser-name")
-    return Settings.initialize(browser_name=browser_name)
+    return get_settings(request.config)
 
 # @pytest.hookimpl(tryfirst=True)
 # def pytest_collection_modifyitems(session: pytest.Session, config: pytest.Config, items: list[Item]) -> None:
@@ -0,0 +1,157 @@
+import argparse
+import hashlib
+import json
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Generator, Optional
+
+import pytest
+from _pytest.nodes import Item
+from _pytest.reports import TestReport
+
+from fixtures.settings import read_cache, shared_value, write_cache
+from tools.logger import get_logger
+from tools.sharding import estimate, parse_shard, partition
+
+logger = get_logger(__name__)
+
+# Ключ кеша pytest (.pytest_cache) с длительностями тестов последних прогонов (секунды)
+CACHE_KEY = "sharding/durations"
+
+# Ключ для хранения длительностей тестов, по которым выравниваются шарды
+DURATIONS_KEY = pytest.StashKey[dict[str, float]]()
+
+# Длительности тестов этого прогона (setup + call + teardown) и пропущенные тесты, собираются контроллером
+_durations: dict[str, float] = defaultdict(float)
+_skipped: set[str] = set()
+
+
+def _shard(value: str) -> tuple[int, int]:
+    """Тип опции --shard."""
+    try:
+        return parse_shard(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e)) from e
+
+
+def pytest_addoption(parser):
+    """Опции разбиения на шарды"""
+    parser.addoption('--shard', action='store', type=_shard, default=None, metavar="i/n",
+                     help="Run only shard i of n: collected tests are split deterministically, balanced by "
+                          "--shard-durations (by count without it)")
+    parser.addoption('--shard-durations', action='store', type=Path, default=None, metavar="FILE",
+                     help="Test durations (JSON {nodeid: seconds}) to balance shards by; every shard must "
+                          "get the same file, e.g. the one written by python -m tools.sharding --durations")
+
+
+def _load_durations(path: Optional[Path]) -> dict[str, float]:
+    """
+    Читает длительности тестов для разбиения на шарды.
+
+    :param path: Файл --shard-durations (None — не задан).
+    :return: {nodeid: секунды}; пустой словарь, если файла нет (разбиение по количеству).
+    """
+    if path is None:
+        logger.info("--shard: no --shard-durations file, balancing shards by test count")
+        return {}
+    if not path.is_file():
+        logger.warning(f"--shard: durations file {path} not found, balancing shards by test count")
+        return {}
+    durations = json.loads(path.read_text(encoding="utf-8"))
+    return {nodeid: float(seconds) for nodeid, seconds in durations.items()}
+
+
+@pytest.hookimpl
+def pytest_configure(config: pytest.Config) -> None:
+    """
+    Загружает длительности тестов для разбиения на шарды (--shard-durations).
+
+    Локальная история длительностей (кеш pytest) для разбиения не используется: у машин
+    CI она разная, и шарды с разной историей пересекались бы или теряли тесты. Файл
+    читается один раз на прогон: все воркеры шарда должны отобрать одни и те же тесты.
+
+    :param config: Объект конфигурации pytest.
+    """
+    if config.getoption("--shard") is None:
+        return
+    config.stash[DURATIONS_KEY] = shared_value(config, "shard_durations",
+                                               lambda: _load_durations(config.getoption("--shard-durations")))
+
+
+def _group(item: Item) -> str:
+    """Единица разбиения: группа xdist_group (кейсы --batch-cases делят страницу) или сам тест."""
+    marker = item.get_closest_marker("xdist_group")
+    if marker is not None:
+        return f"group:{marker.kwargs.get('name', marker.args[0] if marker.args else '')}"
+    return item.nodeid
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_collection_modifyitems(session: pytest.Session, config: pytest.Config,
+                                  items: list[Item]) -> Generator[None, Any, Any]:
+    """
+    Оставляет только тесты своего шарда.
+
+    Выполняется после остальных реализаций хука (после отбора --changed-since и группировки
+    --batch-cases), поэтому разбивается итоговый набор, а группы xdist_group не разрываются.
+
+    :param session: Объект сессии pytest.
+    :param config: Объект конфигурации pytest.
+    :param items: Список тестовых элементов (Pytest Item).
+    """
+    result = yield
+    shard = config.getoption("--shard")
+    if shard is None:
+        return result
+    index, total = shard
+    history = config.stash.get(DURATIONS_KEY, {})
+    durations = estimate(history, [item.nodeid for item in items])
+    weights: dict[str, float] = defaultdict(float)
+    for item in items:
+        weights[_group(item)] += durations[item.nodeid]
+    mine = set(partition(list(weights.items()), total)[index - 1])
+    selected = [item for item in items if _group(item) in mine]
+    deselected = [item for item in items if _group(item) not in mine]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+    balance = "durations" if any(item.nodeid in history for item in selected + deselected) else "count"
+    # Одинаковый отпечаток в логах всех шардов — признак того, что разбиение согласовано
+    digest = hashlib.sha1(json.dumps(history, sort_keys=True).encode()).hexdigest()[:12] if history else "none"
+    logger.info(f"Shard {index}/{total}: {len(selected)} of {len(selected) + len(deselected)} tests, "
+                f"~{sum(durations[item.nodeid] for item in selected):.0f} s estimated (balanced by {balance}, "
+                f"durations digest {digest})")
+    return result
+
+
+@pytest.hookimpl
+def pytest_runtest_logreport(report: TestReport) -> None:
+    """
+    Суммирует длительность фаз теста (на контроллере xdist отчёты приходят от всех воркеров).
+
+    Пропущенные тесты (кеш результатов, разомкнутый автомат защиты, skip) в историю не попадают:
+    их почти нулевая длительность исказила бы разбиение следующих прогонов.
+
+    :param report: Отчёт фазы теста.
+    """
+    if report.skipped:
+        _skipped.add(report.nodeid)
+    _durations[report.nodeid] += report.duration
+
+
+@pytest.hookimpl
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    """
+    Обновляет историю длительностей в кеше pytest (только контроллер или процесс без xdist).
+
+    История — источник файла --shard-durations (см. python -m tools.sharding --durations).
+
+    :param session: Объект сессии pytest.
+    """
+    config = session.config
+    ran = {nodeid: duration for nodeid, duration in _durations.items() if nodeid not in _skipped}
+    if hasattr(config, "workerinput") or not ran:
+        return
+    history: dict[str, float] = {**read_cache(config, CACHE_KEY, {}), **ran}
+    if write_cache(config, CACHE_KEY, history):
+        logger.debug(f"Test durations saved: {len(ran)} updated, {len(history)} total")
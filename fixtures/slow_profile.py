@@ -0,0 +1,148 @@
+from typing import Any, Generator, Optional
+
+import allure
+import pytest
+from _pytest.nodes import Item
+from _pytest.runner import CallInfo
+
+from tools.logger import get_logger
+from tools.profiling import ItemProfiler, merge_hotspots
+
+logger = get_logger(__name__)
+
+# Сколько функций выводить в сводке горячих точек за сессию
+_TOP_HOTSPOTS = 25
+
+# Ключ для хранения профилировщика теста
+PROFILER_KEY = pytest.StashKey[ItemProfiler]()
+
+# Ключ для хранения суммарных горячих точек медленных тестов процесса (и всех воркеров на контроллере)
+HOTSPOTS_KEY = pytest.StashKey[dict[str, dict[str, float]]]()
+
+# Ключ для хранения числа медленных тестов, попавших в сводку
+SLOW_TESTS_KEY = pytest.StashKey[int]()
+
+# Профилировщик, активный в процессе: cProfile не допускает двух одновременно,
+# а в режиме --contexts-per-worker тесты выполняются одновременно в гринлетах
+_active: Optional[ItemProfiler] = None
+
+
+def pytest_addoption(parser):
+    """Опции профилирования медленных тестов"""
+    parser.addoption('--profile-slow', action='store', type=float, default=None, metavar="SECONDS",
+                     help="Profile every test with cProfile and a stack sampler; keep the profile "
+                          "(Allure attachments and a hotspot summary) only for tests slower than SECONDS")
+
+
+def _threshold(config: pytest.Config) -> Optional[float]:
+    """Порог медленного теста в секундах (None — профилирование выключено)."""
+    return config.getoption("--profile-slow")
+
+
+@pytest.hookimpl
+def pytest_configure(config: pytest.Config) -> None:
+    """
+    Подготавливает сводку горячих точек (с --profile-slow).
+
+    :param config: Объект конфигурации pytest.
+    """
+    if _threshold(config) is not None:
+        config.stash[HOTSPOTS_KEY] = {}
+        config.stash[SLOW_TESTS_KEY] = 0
+
+
+@pytest.hookimpl(tryfirst=True, hookwrapper=True)
+def pytest_runtest_setup(item: Item) -> Generator[None, Any, None]:
+    """
+    Запускает профилирование теста до setup его фикстур.
+
+    :param item: Тестовый элемент (Pytest Item).
+    """
+    global _active
+    if _threshold(item.config) is not None and _active is None:
+        profiler = ItemProfiler()
+        try:
+            profiler.start()
+        except ValueError as e:
+            # Профилировщик уже запущен вне плагина (например, python -m cProfile -m pytest)
+            logger.warning(f"Profiling of {item.nodeid} skipped: {e}")
+        else:
+            _active = profiler
+            item.stash[PROFILER_KEY] = profiler
+    yield
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item: Item, call: CallInfo) -> Generator[None, Any, None]:
+    """
+    Останавливает профилирование после teardown и сохраняет профиль медленного теста.
+
+    Профиль прикрепляется к Allure (таблица pstats и стеки в collapsed-формате для
+    flamegraph.pl / speedscope), горячие точки добавляются к сводке сессии.
+
+    :param item: Тестовый элемент (Pytest Item).
+    :param call: Информация о вызове этапа теста.
+    """
+    global _active
+    profiler = item.stash.get(PROFILER_KEY, None)
+    if call.when == "teardown" and profiler is not None:
+        seconds = profiler.stop()
+        _active = None
+        del item.stash[PROFILER_KEY]
+        if seconds >= _threshold(item.config):
+            logger.info(f"Slow test {item.nodeid}: {seconds:.2f}s, profile attached")
+            allure.attach(profiler.stats_text(), name="Profile (cProfile)",
+                          attachment_type=allure.attachment_type.TEXT)
+            allure.attach(profiler.sampler.collapsed(), name="Profile (collapsed stacks)",
+                          attachment_type=allure.attachment_type.TEXT, extension="collapsed")
+            merge_hotspots(item.config.stash[HOTSPOTS_KEY], profiler.hotspots())
+            item.config.stash[SLOW_TESTS_KEY] += 1
+    yield
+
+
+@pytest.hookimpl
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    """
+    Передаёт горячие точки воркера контроллеру.
+
+    :param session: Объект сессии pytest.
+    """
+    config = session.config
+    if hasattr(config, "workeroutput") and HOTSPOTS_KEY in config.stash:
+        config.workeroutput["slow_hotspots"] = config.stash[HOTSPOTS_KEY]
+        config.workeroutput["slow_tests"] = config.stash[SLOW_TESTS_KEY]
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error) -> None:
+    """
+    Хук pytest-xdist: добавляет горячие точки воркера к сводке контроллера.
+
+    :param node: Узел воркера pytest-xdist (WorkerController).
+    :param error: Ошибка воркера, если он завершился аварийно.
+    """
+    output = getattr(node, "workeroutput", {})
+    config = node.config
+    if HOTSPOTS_KEY in config.stash and output.get("slow_hotspots"):
+        merge_hotspots(config.stash[HOTSPOTS_KEY], output["slow_hotspots"])
+        config.stash[SLOW_TESTS_KEY] += output["slow_tests"]
+
+
+@pytest.hookimpl
+def pytest_terminal_summary(terminalreporter, config: pytest.Config) -> None:
+    """
+    Выводит горячие точки медленных тестов за сессию.
+
+    :param terminalreporter: Плагин вывода в терминал.
+    :param config: Объект конфигурации pytest.
+    """
+    hotspots = config.stash.get(HOTSPOTS_KEY, None)
+    if not hotspots:
+        return
+    terminalreporter.write_sep("=", f"hotspots of {config.stash[SLOW_TESTS_KEY]} slow tests "
+                                    f"(> {_threshold(config)}s)")
+    terminalreporter.write_line(f"{'self, s':>9} {'total, s':>9} {'calls':>9} {'tests':>6}  function")
+    for function, row in sorted(hotspots.items(), key=lambda item: item[1]["self"], reverse=True)[:_TOP_HOTSPOTS]:
+        terminalreporter.write_line(
+            f"{row['self']:9.3f} {row['total']:9.3f} {row['calls']:9d} {row['tests']:6d}  {function}"
+        )
@@ -0,0 +1,264 @@
+import builtins
+import sys
+import threading
+import time
+import types
+from typing import Any, Generator, Optional
+
+import pytest
+from _pytest.nodes import Item
+
+from tools.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Момент начала загрузки плагинов из conftest.py (модуль стоит первым в pytest_plugins)
+_STARTED = time.perf_counter()
+
+# Сколько самых медленных модулей выводить в отчёте
+_TOP_MODULES = 15
+
+# Ключ для хранения профилей запуска всех процессов (только с --profile-startup)
+STARTUP_REPORTS_KEY = pytest.StashKey[dict[str, dict[str, Any]]]()
+
+
+def _top_level_packages() -> set[str]:
+    """Возвращает имена пакетов верхнего уровня, уже загруженных в процесс."""
+    return {name.partition(".")[0] for name in list(sys.modules)}
+
+
+class ImportTimer:
+    """
+    Замеряет время импорта модулей, подменяя `builtins.__import__`.
+
+    Для каждого модуля считаются собственное время (без вложенных импортов)
+    и полное время. Учитываются только первые (реальные) импорты в основном потоке.
+    """
+
+    def __init__(self):
+        self.self_times: dict[str, float] = {}
+        self.total_times: dict[str, float] = {}
+        self._stack: list[float] = []
+        self._thread = threading.get_ident()
+        self._original = builtins.__import__
+        self._hook = self._import
+        self._enabled = False
+
+    def install(self) -> None:
+        """Включает замер импортов."""
+        self._original = builtins.__import__
+        builtins.__import__ = self._hook
+        self._enabled = True
+
+    def uninstall(self) -> None:
+        """Выключает замер и, если это возможно, возвращает исходный `__import__`."""
+        self._enabled = False
+        if builtins.__import__ == self._hook:
+            builtins.__import__ = self._original
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        if not self._enabled or level or name in sys.modules or threading.get_ident() != self._thread:
+            return self._original(name, globals, locals, fromlist, level)
+        self._stack.append(0.0)
+        started = time.perf_counter()
+        try:
+            return self._original(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.perf_counter() - started
+            children = self._stack.pop()
+            self.self_times[name] = self.self_times.get(name, 0.0) + elapsed - children
+            self.total_times[name] = self.total_times.get(name, 0.0) + elapsed
+            if self._stack:
+                self._stack[-1] += elapsed
+
+
+class StartupProfile:
+    """
+    Профиль запуска одного процесса pytest (контроллера или воркера).
+
+    Хранит время загрузки каждого плагина из conftest.py, новые пакеты, которые он потянул,
+    время импорта отдельных модулей и отметки этапов до начала первого теста.
+    """
+
+    def __init__(self):
+        self.timer = ImportTimer()
+        self.plugins: list[dict[str, Any]] = []
+        self.milestones: dict[str, float] = {}
+        self._tracking = False
+        self._last = _STARTED
+        self._packages = _top_level_packages()
+
+    def mark(self, name: str) -> None:
+        """
+        Сохраняет отметку этапа (секунды от начала загрузки плагинов).
+
+        :param name: Название этапа.
+        """
+        self.milestones.setdefault(name, time.perf_counter() - _STARTED)
+
+    def plugin_registered(self, plugin: object, plugin_name: str) -> None:
+        """
+        Учитывает загрузку очередного плагина.
+
+        pytest импортирует модули из `pytest_plugins` по очереди и регистрирует каждый сразу
+        после импорта, поэтому время между регистрациями — это время импорта модуля.
+
+        :param plugin: Зарегистрированный плагин.
+        :param plugin_name: Имя плагина.
+        """
+        if plugin is sys.modules[__name__]:
+            self._tracking = True
+            return
+        if not self._tracking or not isinstance(plugin, types.ModuleType):
+            return
+        now = time.perf_counter()
+        packages = _top_level_packages()
+        self.plugins.append({
+            "name": plugin_name,
+            "seconds": now - self._last,
+            "new_packages": sorted(packages - self._packages),
+        })
+        self._last = now
+        self._packages = packages
+
+    def plugins_loaded(self) -> None:
+        """Завершает учёт плагинов: всё, что регистрируется дальше, не относится к conftest.py."""
+        self.mark("plugins_loaded")
+        self._tracking = False
+
+    def stop(self) -> None:
+        """Прекращает замеры (после начала первого теста или если профиль не нужен)."""
+        self._tracking = False
+        self.timer.uninstall()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Сериализует профиль для передачи с воркера на контроллер."""
+        slowest = sorted(self.timer.self_times, key=self.timer.self_times.get, reverse=True)[:_TOP_MODULES]
+        return {
+            "plugins": self.plugins,
+            "milestones": self.milestones,
+            "modules": [
+                {"name": name, "self": self.timer.self_times[name], "total": self.timer.total_times[name]}
+                for name in slowest
+            ],
+        }
+
+
+_profile = StartupProfile()
+_profile.timer.install()
+
+
+def pytest_addoption(parser):
+    """Опции профилирования запуска"""
+    parser.addoption('--profile-startup', action='store_true', default=False,
+                     help="Report import time of conftest plugins and modules and time to the first test")
+
+
+@pytest.hookimpl
+def pytest_plugin_registered(plugin: object, plugin_name: str) -> None:
+    """
+    Хук регистрации плагина: замеряет время импорта плагинов из conftest.py.
+
+    :param plugin: Зарегистрированный плагин.
+    :param plugin_name: Имя плагина.
+    """
+    _profile.plugin_registered(plugin, plugin_name)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config: pytest.Config) -> None:
+    """
+    Завершает замер загрузки плагинов; без --profile-startup выключает замер импортов.
+
+    :param config: Объект конфигурации pytest.
+    """
+    _profile.plugins_loaded()
+    if not config.getoption("--profile-startup"):
+        _profile.stop()
+        return
+    config.stash[STARTUP_REPORTS_KEY] = {}
+
+
+@pytest.hookimpl
+def pytest_collection_finish(session: pytest.Session) -> None:
+    """Отмечает окончание сбора тестов."""
+    _profile.mark("collection_finished")
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_setup(item: Item) -> Generator[None, Any, None]:
+    """
+    Отмечает начало и конец setup первого теста.
+
+    Отложенные импорты (например, pydantic-settings в фикстуре settings) выполняются
+    именно здесь, поэтому замер импортов выключается только после setup первого теста.
+
+    :param item: Тестовый элемент (Pytest Item).
+    """
+    first = "first_test_setup_started" not in _profile.milestones
+    _profile.mark("first_test_setup_started")
+    yield
+    if first:
+        _profile.mark("first_test_started")
+        _profile.stop()
+
+
+@pytest.hookimpl
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    """
+    Сохраняет профиль процесса: на воркере передаёт его контроллеру через workeroutput.
+
+    :param session: Объект сессии pytest.
+    """
+    reports = session.config.stash.get(STARTUP_REPORTS_KEY, None)
+    if reports is None:
+        return
+    _profile.stop()
+    if hasattr(session.config, "workeroutput"):
+        session.config.workeroutput["startup_profile"] = _profile.as_dict()
+    else:
+        reports["controller" if reports else "main"] = _profile.as_dict()
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error) -> None:
+    """
+    Хук pytest-xdist: получает профиль запуска воркера.
+
+    :param node: Узел воркера pytest-xdist (WorkerController).
+    :param error: Ошибка воркера, если он завершился аварийно.
+    """
+    reports = node.config.stash.get(STARTUP_REPORTS_KEY, None)
+    profile = getattr(node, "workeroutput", {}).get("startup_profile")
+    if reports is not None and profile:
+        reports[node.gateway.id] = profile
+
+
+@pytest.hookimpl
+def pytest_terminal_summary(terminalreporter, config: pytest.Config) -> None:
+    """
+    Выводит профиль запуска каждого процесса.
+
+    :param terminalreporter: Плагин вывода в терминал.
+    :param config: Объект конфигурации pytest.
+    """
+    reports = config.stash.get(STARTUP_REPORTS_KEY, None)
+    if not reports:
+        return
+    terminalreporter.write_sep("=", "startup profile")
+    for process, report in reports.items():
+        milestones = ", ".join(f"{name} {seconds:.3f}s" for name, seconds in report["milestones"].items())
+        terminalreporter.write_line(f"[{process}] {milestones}")
+        for plugin in report["plugins"]:
+            packages = ", ".join(plugin["new_packages"]) or "-"
+            terminalreporter.write_line(
+                f"  plugin {plugin['name']:<40} {plugin['seconds'] * 1000:8.1f} ms  new packages: {packages}"
+            )
+        terminalreporter.write_line("  slowest imports (self / total, ms):")
+        for module in report["modules"]:
+            terminalreporter.write_line(
+                f"    {module['name']:<50} {module['self'] * 1000:8.1f} / {module['total'] * 1000:8.1f}"
+            )
+        first_test: Optional[float] = report["milestones"].get("first_test_started")
+        if first_test is not None:
+            logger.info(f"[{process}] time to first test: {first_test:.3f}s")
@@ -0,0 +1,81 @@
+from typing import Any, Generator, Optional
+
+import allure
+import pytest
+from _pytest.nodes import Item
+from _pytest.runner import CallInfo
+
+from fixtures.settings import get_settings
+from tools import time_budget
+from tools.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Ключ для хранения бюджета времени теста в stash
+BUDGET_KEY = pytest.StashKey[time_budget.TimeBudget]()
+
+
+def budget_seconds(item: Item) -> Optional[float]:
+    """
+    Возвращает бюджет времени теста: из маркера time_budget или из настроек (TEST_TIME_BUDGET).
+
+    :param item: Тестовый элемент (Pytest Item).
+    :return: Бюджет в секундах или None, если бюджет не задан.
+    """
+    marker = item.get_closest_marker("time_budget")
+    if marker is not None:
+        seconds = marker.args[0] if marker.args else marker.kwargs["seconds"]
+    else:
+        seconds = get_settings(item.config).test_time_budget
+    return float(seconds) if seconds else None
+
+
+@pytest.hookimpl(tryfirst=True, hookwrapper=True)
+def pytest_runtest_setup(item: Item) -> Generator[None, Any, None]:
+    """
+    Начинает отсчёт бюджета времени до setup фикстур теста.
+
+    Все ожидания page objects (BaseElement, BaseComponent, BasePage) используют
+    min(свой таймаут, остаток бюджета) до начала teardown.
+
+    :param item: Тестовый элемент (Pytest Item).
+    """
+    seconds = budget_seconds(item)
+    if seconds:
+        item.stash[BUDGET_KEY] = time_budget.start(seconds)
+        logger.debug(f"Time budget {seconds}s started for {item.nodeid}")
+    yield
+
+
+@pytest.hookimpl(tryfirst=True, hookwrapper=True)
+def pytest_runtest_teardown(item: Item) -> Generator[None, Any, None]:
+    """
+    Останавливает отсчёт бюджета: teardown (трейсы, скриншоты, закрытие браузера) не ограничивается.
+
+    :param item: Тестовый элемент (Pytest Item).
+    """
+    time_budget.stop()
+    yield
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item: Item, call: CallInfo) -> Generator[None, Any, None]:
+    """
+    Добавляет к отчёту упавшего по бюджету теста разбивку времени.
+
+    Разбивка попадает в секцию отчёта pytest и во вложение Allure "Time budget".
+
+    :param item: Тестовый элемент (Pytest Item).
+    :param call: Информация о вызове этапа теста.
+    """
+    outcome = yield
+    rep = outcome.get_result()
+    budget = item.stash.get(BUDGET_KEY, None)
+    if budget is None or not rep.failed or call.when == "teardown":
+        return
+    if not budget.exhausted and not (call.excinfo and call.excinfo.errisinstance(time_budget.TimeBudgetExceeded)):
+        return
+    breakdown = budget.breakdown()
+    rep.sections.append(("Time budget", breakdown))
+    allure.attach(breakdown, name="Time budget", attachment_type=allure.attachment_type.TEXT)
+    logger.error(f"Time budget exhausted for {item.nodeid}:\n{breakdown}")
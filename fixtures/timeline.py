@@ -0,0 +1,165 @@
+import json
+from pathlib import Path
+from typing import Any, Generator
+
+import allure_commons
+import pytest
+from _pytest.fixtures import FixtureDef, SubRequest
+from _pytest.nodes import Item
+from _pytest.runner import CallInfo
+
+from tools.logger import get_logger
+from tools.timeline import Timeline, now_us, timeline
+
+logger = get_logger(__name__)
+
+# Ключ для хранения событий всех процессов на контроллере
+EVENTS_KEY = pytest.StashKey[list[dict[str, Any]]]()
+
+# Ключ для хранения подключённого к allure слушателя шагов
+LISTENER_KEY = pytest.StashKey["StepListener"]()
+
+# Начало teardown фикстур (finalizer, добавленный последним, выполняется первым)
+_teardown_started: dict[int, int] = {}
+
+
+class StepListener:
+    """
+    Слушатель allure_commons: записывает в таймлайн каждый `allure.step`
+    (шаги BaseElement, компонентов и страниц).
+    """
+
+    def __init__(self, recorder: Timeline):
+        self.timeline = recorder
+        self._started: dict[str, tuple[str, int]] = {}
+
+    @allure_commons.hookimpl
+    def start_step(self, uuid, title, params):
+        self._started[uuid] = (title, now_us())
+
+    @allure_commons.hookimpl
+    def stop_step(self, uuid, exc_type, exc_val, exc_tb):
+        title, started = self._started.pop(uuid, (None, 0))
+        if title is not None:
+            self.timeline.complete(title, "step", started, **({"error": exc_type.__name__} if exc_type else {}))
+
+
+def pytest_addoption(parser):
+    """Опции таймлайна выполнения"""
+    parser.addoption('--timeline', action='store', default=None, metavar="PATH",
+                     help="Write a Chrome trace-event / Perfetto JSON of test phases, fixtures, "
+                          "allure steps and Playwright calls (one process per xdist worker)")
+
+
+@pytest.hookimpl
+def pytest_configure(config: pytest.Config) -> None:
+    """
+    Включает запись таймлайна в каждом процессе (с --timeline).
+
+    :param config: Объект конфигурации pytest.
+    """
+    if not config.getoption("--timeline"):
+        return
+    worker = getattr(config, "workerinput", {}).get("workerid")
+    if worker is None:
+        timeline.enable(0, "controller")
+        config.stash[EVENTS_KEY] = []
+    else:
+        timeline.enable(int(worker.removeprefix("gw")) + 1, f"worker {worker}")
+    listener = StepListener(timeline)
+    allure_commons.plugin_manager.register(listener)
+    config.stash[LISTENER_KEY] = listener
+
+
+@pytest.hookimpl
+def pytest_unconfigure(config: pytest.Config) -> None:
+    """
+    Отключает слушатель шагов и обёртку вызовов Playwright.
+
+    :param config: Объект конфигурации pytest.
+    """
+    listener = config.stash.get(LISTENER_KEY, None)
+    if listener is not None:
+        allure_commons.plugin_manager.unregister(listener)
+        timeline.disable()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item: Item, call: CallInfo) -> Generator[None, Any, None]:
+    """
+    Записывает этап теста (setup, call, teardown) по времени из CallInfo.
+
+    :param item: Тестовый элемент (Pytest Item).
+    :param call: Информация о вызове этапа теста.
+    """
+    outcome = yield
+    if not timeline.enabled:
+        return
+    rep = outcome.get_result()
+    timeline.complete(f"{item.nodeid} [{call.when}]", "test", int(call.start * 1_000_000),
+                      int(call.stop * 1_000_000), outcome=rep.outcome)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_fixture_setup(fixturedef: FixtureDef, request: SubRequest) -> Generator[None, Any, None]:
+    """
+    Записывает setup фикстуры и отмечает начало её teardown.
+
+    :param fixturedef: Описание фикстуры.
+    :param request: Запрос фикстуры.
+    """
+    if not timeline.enabled:
+        yield
+        return
+    started = now_us()
+    yield
+    timeline.complete(f"{fixturedef.argname} [setup]", "fixture", started, scope=fixturedef.scope)
+    # Finalizer'ы выполняются в обратном порядке: этот сработает перед teardown самой фикстуры
+    fixturedef.addfinalizer(lambda: _teardown_started.__setitem__(id(fixturedef), now_us()))
+
+
+@pytest.hookimpl
+def pytest_fixture_post_finalizer(fixturedef: FixtureDef, request: SubRequest) -> None:
+    """
+    Записывает teardown фикстуры.
+
+    :param fixturedef: Описание фикстуры.
+    :param request: Запрос фикстуры.
+    """
+    started = _teardown_started.pop(id(fixturedef), None)
+    if started is not None:
+        timeline.complete(f"{fixturedef.argname} [teardown]", "fixture", started, scope=fixturedef.scope)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error) -> None:
+    """
+    Хук pytest-xdist: получает события таймлайна воркера.
+
+    :param node: Узел воркера pytest-xdist (WorkerController).
+    :param error: Ошибка воркера, если он завершился аварийно.
+    """
+    events = node.config.stash.get(EVENTS_KEY, None)
+    worker_events = getattr(node, "workeroutput", {}).get("timeline")
+    if events is not None and worker_events:
+        events.extend(worker_events)
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    """
+    Передаёт события воркера контроллеру или записывает общий файл таймлайна.
+
+    :param session: Объект сессии pytest.
+    """
+    config = session.config
+    if not timeline.enabled:
+        return
+    if hasattr(config, "workeroutput"):
+        config.workeroutput["timeline"] = timeline.export()
+        return
+    events = config.stash[EVENTS_KEY] + timeline.export()
+    path = Path(config.getoption("--timeline"))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"traceEvents": events, "displayTimeUnit": "ms"}), encoding="utf-8")
+    logger.info(f"Timeline with {len(events)} events written to {path} (open in ui.perfetto.dev)")
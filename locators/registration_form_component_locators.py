@@ -12,5 +12,7 @@ class RegistrationFormComponentsLocators:
         self.AGE_INPUT = self.page.get_by_role("textbox", name="Age")
         self.SALARY_INPUT = self.page.get_by_role("textbox", name="Salary")
         self.DEPARTMENT_INPUT = self.page.get_by_role("textbox", name="Department")
+        self.FORM_INPUTS = self.page.locator("#userForm input")
         self.SUBMIT_BUTTON = self.page.get_by_role("button", name="Submit")
+        self.CLOSE_BUTTON = self.page.get_by_role("button", name="Close")
 
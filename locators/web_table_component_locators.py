@@ -0,0 +1,14 @@
+from playwright.sync_api import Page
+
+
+class WebTableComponentLocators:
+    def __init__(self, page: Page):
+        self.page = page
+
+        self.HEADERS = self.page.locator(".rt-thead.-header .rt-th")
+        self.CELLS = self.page.locator(".rt-tbody .rt-tr-group .rt-td")
+        self.SEARCH_BOX = self.page.locator("#searchBox")
+        self.NEXT_BUTTON = self.page.locator(".-pagination .-next button")
+        self.PAGE_JUMP_INPUT = self.page.locator(".-pagination .-pageJump input")
+        self.TOTAL_PAGES = self.page.locator(".-pagination .-totalPages")
+        self.ROWS_PER_PAGE_SELECT = self.page.locator(".-pagination select")
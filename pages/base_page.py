@@ -1,10 +1,16 @@
-from typing import Pattern
+import time
+from typing import Pattern, Optional
 import re
 import allure
 from playwright.sync_api import Page, expect
+from tools.adaptive_timeouts import adaptive_timeouts
+from tools.circuit_breaker import circuit_breaker
+from tools.network_recorder import NetworkRecorder
+from tools.page_metrics import page_metrics
+from tools.retry import retry_step
 from tools.routes import AppRoute
+from tools import time_budget
 from tools.logger import get_logger
-from config import Settings
 
 logger = get_logger(__name__)
 
@@ -26,7 +32,10 @@ class BasePage:
         :param page: Экземпляр страницы Playwright для взаимодействия с браузером.
         """
         self.page = page
+        # Маршрут, открытый последним через open() (None, если страница ещё не открывалась)
+        self.current_route: Optional[AppRoute] = None
 
+    @retry_step
     def open(self, route: AppRoute) -> None:
         """
         Открывает страницу по указанному маршруту и ждёт полной загрузки.
@@ -38,12 +47,30 @@ class BasePage:
         with allure.step(step):
             logger.info(step)
             try:
-                self.page.goto(route, wait_until='domcontentloaded')
+                # 30 секунд (по умолчанию Playwright) или таймаут по истории открытий маршрута
+                # Запросы до следующего открытия учитываются в сетевом бюджете этого маршрута
+                recorder = NetworkRecorder.of(self.page.context)
+                if recorder is not None:
+                    recorder.begin(route.value)
+                timeout = adaptive_timeouts.timeout("route", route.value, default=30000)
+                started = time.perf_counter()
+                try:
+                    with time_budget.wait(f'open "{route.value}"', timeout) as timeout:
+                        self.page.goto(route, wait_until='domcontentloaded', timeout=timeout)
+                except Exception as e:
+                    circuit_breaker.record(route.value, (time.perf_counter() - started) * 1000, e)
+                    raise
+                elapsed = (time.perf_counter() - started) * 1000
+                circuit_breaker.record(route.value, elapsed)
+                adaptive_timeouts.record("route", route.value, elapsed)
+                self.current_route = route
                 logger.info(f"Opened URL: {self.page.url}")
+                page_metrics.collect(self.page, route.value)
             except Exception as e:
                 logger.error(f"Failed to open {route}: {e}")
                 raise
 
+    @retry_step
     def reload(self) -> None:
         """
         Перезагружает текущую страницу и ждёт полной загрузки.
@@ -52,7 +79,9 @@ class BasePage:
 
         with allure.step(step):
             logger.info(step)
-            self.page.reload(wait_until='domcontentloaded')
+            with time_budget.wait("reload", time_budget.ACTION_TIMEOUT) as timeout:
+                self.page.reload(wait_until='domcontentloaded', timeout=timeout)
+            page_metrics.collect(self.page, self.current_route.value if self.current_route else self.page.url)
 
     def check_current_url(self, expected_url: Pattern[str]) -> None:
         """
@@ -65,4 +94,5 @@ class BasePage:
         with allure.step(step):
             logger.info(step)
             # Проверка соответствия текущего URL
-            expect(self.page).to_have_url(expected_url)
\ No newline at end of file
+            with time_budget.wait(f'url "{expected_url.pattern}"') as timeout:
+                expect(self.page).to_have_url(expected_url, timeout=timeout)
\ No newline at end of file
@@ -1,10 +1,52 @@
 import re
+import time
+from typing import Iterable
 
+import allure
 from playwright.sync_api import Page
-from config import Settings
 from components.registration_form_component import RegistrationFormComponent
+from components.web_table_component import WebTableComponent
+from data.person_info import PersonInfo
 from elements.button import Button
 from pages.base_page import BasePage
+from tools import time_budget
+from tools.logger import get_logger
+from tools.routes import AppRoute
+
+logger = get_logger(__name__)
+
+# Добавление пачки записей внутри страницы: тот же путь, что у пользователя ([Add] -> поля ->
+# [Submit]), но без обращения к Playwright на каждое действие. Значения ставятся нативным
+# сеттером value и событием input (так их видит React), закрытие формы ждётся по кадрам.
+# Возвращает число добавленных записей: при первой неудаче пачка прерывается
+# (timeout — ожидание открытия или закрытия формы для одной записи, в мс)
+_SEED_SCRIPT = """
+async ({ records, timeout }) => {
+    const setValue = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+    const until = async (check) => {
+        const started = performance.now();
+        while (!check()) {
+            if (performance.now() - started > timeout) return false;
+            await new Promise((resolve) => setTimeout(resolve, 0));
+        }
+        return true;
+    };
+    let added = 0;
+    for (const record of records) {
+        document.getElementById('addNewRecordButton').click();
+        if (!await until(() => document.getElementById('userForm'))) break;
+        Object.entries(record).forEach(([id, value]) => {
+            const input = document.getElementById(id);
+            setValue.call(input, value);
+            input.dispatchEvent(new Event('input', { bubbles: true }));
+        });
+        document.getElementById('submit').click();
+        if (!await until(() => !document.getElementById('userForm'))) break;
+        added += 1;
+    }
+    return added;
+}
+"""
 
 
 class WebTablePage(BasePage):
@@ -29,6 +71,7 @@ class WebTablePage(BasePage):
 
         # Компоненты страницы
         self.registration_form = RegistrationFormComponent(page)  # Форма регистрации
+        self.web_table = WebTableComponent(page)  # Таблица записей
 
         # Элементы страницы
         add_button_locator = self.page.get_by_role("button", name="Add")
@@ -43,4 +86,89 @@ class WebTablePage(BasePage):
         # Нажатие на кнопку регистрации
         self.add_button.click()
         # Проверка, что мы перенаправлены на страницу панели управления
-        # self.check_current_url(re.compile(".*/#/dashboard"))
\ No newline at end of file
+        # self.check_current_url(re.compile(".*/#/dashboard"))
+
+    @allure.step("Open registration form")
+    def open_registration_form(self) -> None:
+        """
+        Открывает форму регистрации на странице Web Tables.
+
+        Если страница уже загружена (общая страница в режиме --batch-cases), она не
+        перезагружается: форма закрывается, открывается заново и очищается.
+        """
+        reuse = self.current_route is AppRoute.WEB_TABLES
+        if reuse:
+            self.registration_form.close()
+        else:
+            self.open(AppRoute.WEB_TABLES)
+            self.page.wait_for_timeout(time_budget.cap(2000, "page settle"))
+        self.click_add_button()
+        if reuse:
+            self.registration_form.clear_form()
+
+    def _add_record_via_ui(self, person: PersonInfo) -> None:
+        """
+        Добавляет запись через форму регистрации, как пользователь.
+
+        :param person: Данные записи.
+        :raises AssertionError: Если форма не закрылась после отправки.
+        """
+        self.click_add_button()
+        self.registration_form.fill_form(person)
+        self.registration_form.submit_button.click()
+        if not self.registration_form.wait_closed():
+            raise AssertionError(f"Registration form did not close for {person.email}")
+
+    @allure.step("Seed table with records")
+    def seed_records(self, persons: Iterable[PersonInfo], batch_size: int = 100,
+                     ui_fallback: bool = True) -> int:
+        """
+        Быстро добавляет в таблицу много записей (страница Web Tables должна быть открыта).
+
+        Записи добавляются пачками по batch_size внутри страницы, одним evaluate на пачку.
+        Если пачка добавилась не целиком (форма не открылась или не закрылась — например,
+        значение не прошло валидацию), остаток пачки добавляется через UI по одной записи.
+
+        :param persons: Записи для добавления (генератор читается по пачкам).
+        :param batch_size: Записей в одном evaluate.
+        :param ui_fallback: Добавлять через UI записи, которые не удалось внедрить.
+        :return: Число добавленных записей.
+        :raises AssertionError: Если запись не добавилась и через UI.
+        """
+        form = self.registration_form
+        added = 0
+        started = time.perf_counter()
+        batch: list[PersonInfo] = []
+
+        def flush() -> int:
+            # Запись — {id поля: значение}, по тем же именам полей, что и в fill_form
+            records = []
+            for person in batch:
+                values = form.form_values(person)
+                records.append({field_id: values[name] for field_id, name in form.input_ids.items()})
+            with time_budget.wait("seed batch", 5000) as timeout:
+                try:
+                    injected = self.page.evaluate(_SEED_SCRIPT, {"records": records, "timeout": timeout})
+                except Exception as e:
+                    logger.warning(f"In-page seeding failed: {e}")
+                    injected = 0
+            if injected < len(batch):
+                if not ui_fallback:
+                    return injected
+                logger.warning(f"Seeded {injected} of {len(batch)} records in page, adding the rest via UI")
+                # Форма могла остаться открытой на записи, прервавшей пачку
+                form.close()
+                for person in batch[injected:]:
+                    self._add_record_via_ui(person)
+            return len(batch)
+
+        for person in persons:
+            batch.append(person)
+            if len(batch) >= batch_size:
+                added += flush()
+                batch = []
+        if batch:
+            added += flush()
+        elapsed = time.perf_counter() - started
+        logger.info(f"Seeded {added} records in {elapsed:.2f} s ({added / elapsed if elapsed else 0:.0f} records/s)")
+        return added
@@ -0,0 +1,36 @@
+"""
+Кейсы для tests/test_concurrency_smoke.py: запускаются только явно, с --contexts-per-worker=2
+(имя файла не подходит под python_files, поэтому в обычный прогон они не попадают).
+"""
+import pytest
+from playwright.sync_api import Page
+
+# Тесты пачки, которые уже начали выполняться (общий список: пачка идёт в одном процессе)
+STARTED: list[str] = []
+
+
+def test_warm_up(page: Page):
+    """Запускает Playwright: первый тест пачки без запущенного Playwright выполняется отдельно."""
+    page.set_content("<p id='owner'>warm_up</p>")
+
+
+@pytest.mark.concurrent
+class TestConcurrentBatch:
+
+    @pytest.mark.parametrize("owner", ["first", "second"])
+    def test_isolated_context(self, page: Page, owner: str):
+        """
+        Проверяет, что тесты пачки выполняются одновременно и каждый видит только свою страницу.
+
+        :param page: Страница теста в собственном BrowserContext.
+        :param owner: Имя теста, записываемое на страницу.
+        """
+        page.set_content(f"<p id='owner'>{owner}</p>")
+        STARTED.append(owner)
+        # Ожидание браузера отдаёт управление второму тесту пачки
+        for _ in range(50):
+            if len(STARTED) == 2:
+                break
+            page.wait_for_timeout(100)
+        assert sorted(STARTED) == ["first", "second"], f"Batch did not run concurrently: {STARTED}"
+        assert page.text_content("#owner") == owner, "Page content leaked between contexts"
@@ -0,0 +1,36 @@
+import subprocess
+import sys
+
+import allure
+import pytest
+
+# Кейсы, которые выполняются пачкой во вложенном прогоне
+CASES = "tests/concurrency_smoke_cases.py"
+
+
+@pytest.mark.smoke
+@allure.feature("Concurrent contexts")
+class TestConcurrencySmoke:
+
+    @allure.title("Concurrent contexts | Batch of 2 tests in one worker")
+    @allure.description("Проверка планировщика --contexts-per-worker на установленных версиях библиотек")
+    def test_concurrent_batch(self, pytestconfig: pytest.Config):
+        """
+        Запускает пачку из двух concurrent-тестов во вложенном прогоне pytest с --contexts-per-worker=2.
+
+        Планировщик подменяет внутреннее состояние pytest, allure-pytest, pytest-xdist и Playwright,
+        поэтому этот тест нужно прогонять после обновления любой из них (см. VERIFIED_VERSIONS).
+
+        Args:
+            pytestconfig (pytest.Config): Конфигурация внешнего прогона (корень проекта).
+        """
+        result = subprocess.run(
+            [sys.executable, "-m", "pytest", CASES, "--contexts-per-worker=2", "-n0",
+             "-p", "no:cacheprovider", "-o", "addopts=-s -v -rs"],
+            cwd=pytestconfig.rootpath, capture_output=True, text=True, timeout=300
+        )
+        output = result.stdout + result.stderr
+        allure.attach(output, name="Nested pytest run", attachment_type=allure.attachment_type.TEXT)
+        assert result.returncode == 0, f"Concurrent batch failed:\n{output[-3000:]}"
+        assert "Running 2 tests concurrently" in output, "Tests were not run as a concurrent batch"
+        assert "3 passed" in output, f"Unexpected outcome:\n{output[-3000:]}"
@@ -3,9 +3,8 @@ import pytest
 from typing import Any
 from data.person_info import PersonInfo
 from pages.web_tables_page import WebTablePage
-from tools.routes import AppRoute
-from data.parametrize_config import get_test_cases
-from data.field_data import Name, Department, Salary, Age, Email
+from data.parametrize_config import get_test_cases, get_fuzz_cases
+from data.field_data import Name, Department, Salary, Age, Email, resolve_value
 
 @pytest.mark.smoke
 @allure.feature("Web Tables")
@@ -14,12 +13,13 @@ class TestRegistrationForm:
 
     # Список тест-кейсов: пары (поле формы, список тест-кейсов для поля)
     # Каждый тест-кейс — кортеж (case_name, value, expected_result)
+    # С FUZZ_CASES добавляются расхождения фаззинга (кейсы fuzz_N, см. tools/field_fuzz.py)
     TEST_CASES = [
-        ("first_name", get_test_cases(Name)),
-        # ("department", get_test_cases(Department)),
-        # ("salary", get_test_cases(Salary)),
-        ("age", get_test_cases(Age)),
-        ("email", get_test_cases(Email)),
+        ("first_name", get_test_cases(Name) + get_fuzz_cases("first_name")),
+        # ("department", get_test_cases(Department) + get_fuzz_cases("department")),
+        # ("salary", get_test_cases(Salary) + get_fuzz_cases("salary")),
+        ("age", get_test_cases(Age) + get_fuzz_cases("age")),
+        ("email", get_test_cases(Email) + get_fuzz_cases("email")),
     ]
 
     # Списки для параметризации тестов
@@ -66,11 +66,12 @@ class TestRegistrationForm:
         if not test_case:
             raise ValueError(f"Test case {case_name} not found for field {field}")
         _, value, expected_result = test_case
+        # Сгенерированные значения кейсов создаются Faker только при выполнении теста
+        value = resolve_value(value)
 
         # Шаг 1: Открываем страницу Web Tables и нажимаем кнопку добавления
-        webtable_page.open(AppRoute.WEB_TABLES)
-        webtable_page.page.wait_for_timeout(2000)
-        webtable_page.add_button.click()
+        # (в режиме --batch-cases страница уже загружена предыдущим кейсом, форма сбрасывается)
+        webtable_page.open_registration_form()
         # Проверяем видимость формы регистрации
         form_visible = webtable_page.registration_form.check_visible()
         assert form_visible, "Registration form is not visible"
@@ -85,10 +86,12 @@ class TestRegistrationForm:
         webtable_page.registration_form.submit_button.click()
 
         # Проверяем видимость формы регистрации после отправки формы
-        form_visible = webtable_page.registration_form.check_visible()
+        # (закрытие формы ждём по событиям страницы, а не весь таймаут check_visible)
         if expected_result == "success":
-            assert not form_visible, "Registration form is visible. Expected: not visible (e.g. Validation ok)"
+            form_closed = webtable_page.registration_form.wait_closed()
+            assert form_closed, "Registration form is visible. Expected: not visible (e.g. Validation ok)"
         else:
+            form_visible = webtable_page.registration_form.check_visible()
             assert form_visible, "Registration form is not visible. Expected: visible (e.g. Validation error)"
             expected_border_color = "rgb(220, 53, 69)"
             webtable_page.registration_form.check_field_border_color(field=field, expected_color=expected_border_color)
@@ -0,0 +1,29 @@
+from tools.impact import classify
+
+
+class TestClassify:
+
+    def test_tracked_modules(self):
+        tracked, tests, full = classify(["pages/web_tables_page.py", "data/field_data.py", "elements/button.py"])
+        assert tracked == {"pages/web_tables_page.py", "data/field_data.py", "elements/button.py"}
+        assert tests == set() and full == []
+
+    def test_test_modules(self):
+        tracked, tests, full = classify(["tests/test_web_tables.py"])
+        assert tests == {"tests/test_web_tables.py"}
+        assert tracked == set() and full == []
+
+    def test_ignored_files(self):
+        assert classify(["README.md", "screenshots/fail.png", "allure-results/a-result.json", ".gitignore"]) \
+            == (set(), set(), [])
+
+    def test_full_run_files(self):
+        files = ["fixtures/page_fixtures.py", "tools/sharding.py", "conftest.py", "config.py", ".env",
+                 "requirements.txt", "tests/concurrency_smoke_cases.py", "pages/page.json"]
+        tracked, tests, full = classify(files)
+        assert full == files
+        assert tracked == set() and tests == set()
+
+    def test_top_level_module_named_like_tracked_dir(self):
+        """Файл в корне не попадает в TRACKED_DIRS по совпадению имени."""
+        assert classify(["data.py"]) == (set(), set(), ["data.py"])
@@ -0,0 +1,45 @@
+import time
+
+from tools.result_cache import ResultCache
+
+
+def cache(entries: dict, ttl_hours: float = 1) -> ResultCache:
+    result_cache = ResultCache()
+    result_cache.enable(entries, ttl_hours)
+    return result_cache
+
+
+class TestUpdated:
+
+    def test_keeps_fresh_entries(self):
+        entry = {"nodeid": "t::a", "time": time.time()}
+        assert cache({"a": entry}).updated() == {"a": entry}
+
+    def test_drops_expired_entries(self):
+        entries = {"old": {"nodeid": "t::old", "time": time.time() - 7200},
+                   "new": {"nodeid": "t::new", "time": time.time()}}
+        assert set(cache(entries).updated()) == {"new"}
+
+    def test_drops_failed_and_adds_passed(self):
+        result_cache = cache({"a": {"nodeid": "t::a", "time": time.time()},
+                              "b": {"nodeid": "t::b", "time": time.time()}})
+        result_cache.record("a", "t::a", passed=False)
+        result_cache.record("c", "t::c", passed=True)
+        updated = result_cache.updated()
+        assert set(updated) == {"b", "c"}
+        assert updated["c"]["nodeid"] == "t::c"
+
+    def test_failure_wins_over_pass(self):
+        """Ключ, упавший в одной фазе или на другом воркере, не сохраняется как прошедший."""
+        result_cache = cache({})
+        result_cache.record("a", "t::a", passed=False)
+        result_cache.record("a", "t::a", passed=True)
+        result_cache.merge({"b": {"nodeid": "t::b", "time": time.time()}}, ["c"])
+        assert set(result_cache.updated()) == {"b"}
+
+    def test_write_only_mode(self):
+        """--no-cache: записи не читаются, но обновляются."""
+        result_cache = ResultCache()
+        result_cache.enable({"a": {"nodeid": "t::a", "time": time.time()}}, 1, read=False)
+        assert result_cache.lookup("a") is None
+        assert set(result_cache.updated()) == {"a"}
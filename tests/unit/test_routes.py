@@ -0,0 +1,24 @@
+from tools.routes import RouteBudget
+
+
+def stats(requests: int = 10, bytes_: int = 1000, ms: float = 100.0, by_type: dict = None) -> dict:
+    return {"requests": requests, "bytes": bytes_, "ms": ms, "by_type": by_type or {}}
+
+
+class TestRouteBudget:
+
+    def test_no_limits(self):
+        assert RouteBudget().check(stats(requests=10 ** 6, bytes_=10 ** 9, ms=10 ** 6)) == []
+
+    def test_within_budget(self):
+        budget = RouteBudget(max_requests=10, max_bytes=1000, max_ms=100)
+        assert budget.check(stats()) == []
+
+    def test_exceeded_totals(self):
+        budget = RouteBudget(max_requests=5, max_bytes=500, max_ms=50)
+        assert budget.check(stats()) == ["requests 10 > budget 5", "bytes 1000 > budget 500", "ms 100 > budget 50"]
+
+    def test_exceeded_by_type(self):
+        budget = RouteBudget(max_requests_by_type={"script": 2, "font": 0}, max_bytes_by_type={"image": 100})
+        by_type = {"script": {"requests": 3, "bytes": 10}, "image": {"requests": 1, "bytes": 150}}
+        assert budget.check(stats(by_type=by_type)) == ["script requests 3 > budget 2", "image bytes 150 > budget 100"]
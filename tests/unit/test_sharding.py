@@ -0,0 +1,49 @@
+import pytest
+
+from tools.sharding import parse_shard, partition
+
+
+class TestParseShard:
+
+    def test_valid(self):
+        assert parse_shard("2/3") == (2, 3)
+        assert parse_shard("1/1") == (1, 1)
+
+    @pytest.mark.parametrize("value", ["", "2", "a/3", "2/b", "2/3/4", "1.5/3"])
+    def test_malformed(self, value: str):
+        with pytest.raises(ValueError, match="i/n"):
+            parse_shard(value)
+
+    @pytest.mark.parametrize("value", ["0/3", "4/3", "-1/3", "1/0"])
+    def test_index_out_of_range(self, value: str):
+        with pytest.raises(ValueError, match="between 1 and"):
+            parse_shard(value)
+
+
+class TestPartition:
+
+    UNITS = [(f"tests/test_{i % 4}.py::test_{i}", float(i % 7) + 0.5) for i in range(40)]
+
+    def test_covers_every_unit_once(self):
+        shards = partition(self.UNITS, 3)
+        keys = [key for shard in shards for key in shard]
+        assert sorted(keys) == sorted(key for key, _ in self.UNITS)
+        assert len(keys) == len(set(keys))
+
+    def test_independent_of_input_order(self):
+        """Все машины и воркеры получают одно разбиение, в каком бы порядке ни собрали тесты."""
+        assert partition(self.UNITS, 3) == partition(list(reversed(self.UNITS)), 3)
+        assert partition(self.UNITS, 3) == partition(sorted(self.UNITS, key=lambda unit: unit[1]), 3)
+
+    def test_balances_weight(self):
+        shards = partition(self.UNITS, 3)
+        weights = dict(self.UNITS)
+        loads = [sum(weights[key] for key in shard) for shard in shards]
+        assert max(loads) - min(loads) <= max(weights.values())
+
+    def test_equal_weights_split_by_count(self):
+        shards = partition([(f"t{i}", 1.0) for i in range(10)], 3)
+        assert sorted(len(shard) for shard in shards) == [3, 3, 4]
+
+    def test_more_shards_than_units(self):
+        assert partition([("a", 1.0)], 3) == [["a"], [], []]
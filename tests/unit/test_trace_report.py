@@ -0,0 +1,67 @@
+import json
+import zipfile
+from pathlib import Path
+
+from tools.trace_report import Action, Request, TraceReport, read_trace
+
+
+def write_trace(path: Path, trace_events: list, network_events: list) -> Path:
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr("trace.trace", "\n".join(json.dumps(event) for event in trace_events) + "\nnot json\n")
+        archive.writestr("trace.network", "\n".join(json.dumps(event) for event in network_events))
+    return path
+
+
+BEFORE_AFTER = [
+    {"type": "before", "callId": "call@1", "apiName": "locator.click", "startTime": 100,
+     "params": {"selector": "#submit"}},
+    {"type": "after", "callId": "call@1", "endTime": 350},
+    {"type": "before", "callId": "call@2", "class": "Frame", "method": "waitForSelector", "startTime": 400},
+    {"type": "after", "callId": "call@2", "endTime": 900, "error": {"message": "Timeout 500ms exceeded"}},
+    {"type": "before", "callId": "call@3", "apiName": "page.goto", "startTime": 1000},
+]
+
+LEGACY_ACTION = {"type": "action", "metadata": {"apiName": "expect.toBeVisible", "startTime": 10, "endTime": 60,
+                                                "params": {"selector": "form"},
+                                                "error": {"error": {"message": "not visible"}}}}
+
+RESOURCE = {"type": "resource-snapshot", "snapshot": {
+    "request": {"method": "POST", "url": "https://demoqa.com/api/items?page=2#top"},
+    "response": {"status": 201},
+    "time": 123.5,
+    "timings": {"blocked": -1, "dns": 0, "connect": 12.5, "wait": 100, "receive": 11},
+}}
+
+
+class TestReadTrace:
+
+    def test_before_after_events(self, tmp_path: Path):
+        actions, _ = read_trace(write_trace(tmp_path / "a.zip", BEFORE_AFTER, []))
+        assert actions == [
+            Action(trace="a.zip", api_name="locator.click", duration=250, selector="#submit"),
+            Action(trace="a.zip", api_name="Frame.waitForSelector", duration=500, error="Timeout 500ms exceeded"),
+        ]
+        assert actions[1].is_wait and not actions[0].is_wait
+
+    def test_legacy_action_events(self, tmp_path: Path):
+        actions, _ = read_trace(write_trace(tmp_path / "a.zip", [LEGACY_ACTION], []))
+        assert actions == [Action(trace="a.zip", api_name="expect.toBeVisible", duration=50, selector="form",
+                                  error="not visible")]
+
+    def test_network_events(self, tmp_path: Path):
+        _, requests = read_trace(write_trace(tmp_path / "a.zip", [], [RESOURCE, {"type": "other"}]))
+        assert requests == [Request(trace="a.zip", method="POST", url="https://demoqa.com/api/items?page=2#top",
+                                    status=201, duration=123.5,
+                                    timings={"connect": 12.5, "wait": 100, "receive": 11})]
+        assert requests[0].endpoint == "POST https://demoqa.com/api/items"
+
+
+class TestTraceReport:
+
+    def test_skips_broken_archives(self, tmp_path: Path):
+        write_trace(tmp_path / "a.zip", BEFORE_AFTER, [RESOURCE])
+        (tmp_path / "broken.zip").write_text("not a zip")
+        report = TraceReport.of([tmp_path])
+        assert report.traces == 1
+        assert len(report.errors) == 1 and "broken.zip" in report.errors[0]
+        assert len(report.actions) == 2 and len(report.requests) == 1
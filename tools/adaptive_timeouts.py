@@ -0,0 +1,123 @@
+import math
+from typing import TYPE_CHECKING
+
+from tools.logger import get_logger
+
+if TYPE_CHECKING:
+    from config import Settings
+
+logger = get_logger(__name__)
+
+# Сколько последних замеров хранить на ключ
+_MAX_SAMPLES = 100
+
+
+class AdaptiveTimeouts:
+    """
+    Таймауты ожиданий, вычисляемые по истории наблюдаемых длительностей.
+
+    Длительности успешных ожиданий записываются по ключу вида `<браузер>|<вид>|<имя>`
+    (например, `chromium|locator|internal:role=textbox[name="Age"i]`, `chromium|route|./webtables`,
+    `remote_browser|connect`). Таймаут ожидания — заданный перцентиль истории, умноженный
+    на запас и ограниченный снизу и сверху. Пока замеров меньше минимума, используется
+    прежний жёсткий таймаут.
+
+    По умолчанию выключен (`settings.adaptive_timeouts`): тогда timeout() возвращает
+    переданное значение по умолчанию, а record() ничего не делает.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.browser = ""
+        self.history: dict[str, list[float]] = {}
+        self.new_samples: dict[str, list[float]] = {}
+        self.percentile = 95.0
+        self.margin = 1.5
+        self.floor = 1000.0
+        self.ceiling = 30000.0
+        self.min_samples = 5
+
+    def enable(self, settings: 'Settings', history: dict[str, list[float]]) -> None:
+        """
+        Включает адаптивные таймауты.
+
+        :param settings: Настройки проекта (экземпляр Settings).
+        :param history: Замеры прошлых запусков {ключ: [мс, ...]}.
+        """
+        self.enabled = True
+        self.browser = settings.browser_name
+        self.percentile = settings.adaptive_timeout_percentile
+        self.margin = settings.adaptive_timeout_margin
+        self.floor = settings.adaptive_timeout_floor
+        self.ceiling = settings.adaptive_timeout_ceiling
+        self.min_samples = settings.adaptive_timeout_min_samples
+        for key, samples in history.items():
+            self.history.setdefault(key, []).extend(samples)
+
+    def key(self, kind: str, name: str = "") -> str:
+        """
+        Формирует ключ истории для текущего браузера.
+
+        :param kind: Вид ожидания (locator, route, expect, connect).
+        :param name: Селектор, маршрут и т. п. (пусто для общих ожиданий).
+        :return: Ключ истории.
+        """
+        return "|".join(part for part in (self.browser, kind, name) if part)
+
+    def timeout(self, kind: str, name: str = "", default: float = 5000) -> float:
+        """
+        Возвращает таймаут ожидания в миллисекундах.
+
+        :param kind: Вид ожидания (locator, route, expect, connect).
+        :param name: Селектор, маршрут и т. п.
+        :param default: Жёсткий таймаут, используемый без истории или при выключенном сервисе.
+        :return: Таймаут в миллисекундах.
+        """
+        if not self.enabled:
+            return default
+        samples = self.history.get(self.key(kind, name), [])
+        if len(samples) < self.min_samples:
+            return default
+        ordered = sorted(samples)
+        # Перцентиль по методу ближайшего ранга
+        rank = max(math.ceil(self.percentile / 100 * len(ordered)) - 1, 0)
+        return min(max(ordered[rank] * self.margin, self.floor), self.ceiling)
+
+    def record(self, kind: str, name: str = "", milliseconds: float = 0.0) -> None:
+        """
+        Записывает длительность успешного ожидания.
+
+        Замер попадает и в историю по своему ключу, и в общую историю вида `expect`
+        текущего браузера, по которой считается глобальный таймаут expect().
+
+        :param kind: Вид ожидания (locator, route, connect).
+        :param name: Селектор, маршрут и т. п.
+        :param milliseconds: Длительность в миллисекундах.
+        """
+        if not self.enabled:
+            return
+        keys = [self.key(kind, name)]
+        if kind == "locator":
+            keys.append(self.key("expect"))
+        for key in keys:
+            for samples in (self.history.setdefault(key, []), self.new_samples.setdefault(key, [])):
+                samples.append(round(milliseconds, 1))
+                del samples[:-_MAX_SAMPLES]
+
+    @staticmethod
+    def merge(history: dict[str, list[float]], samples: dict[str, list[float]]) -> dict[str, list[float]]:
+        """
+        Добавляет новые замеры к истории, оставляя последние значения по каждому ключу.
+
+        :param history: История прошлых запусков.
+        :param samples: Новые замеры.
+        :return: Объединённая история.
+        """
+        merged = {key: list(values) for key, values in history.items()}
+        for key, values in samples.items():
+            merged[key] = (merged.get(key, []) + values)[-_MAX_SAMPLES:]
+        return merged
+
+
+# Таймауты процесса: настраивает fixtures/adaptive_timeouts.py, читают элементы и страницы
+adaptive_timeouts = AdaptiveTimeouts()
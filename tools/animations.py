@@ -0,0 +1,64 @@
+import json
+
+from playwright.sync_api import BrowserContext
+
+from tools.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Стили, отключающие CSS-переходы и анимации: модальное окно Bootstrap (.fade, .modal-dialog)
+# появляется и исчезает сразу, цвет бордера полей при валидации меняется без перехода
+_NO_ANIMATIONS_CSS = """
+*, *::before, *::after {
+    transition-property: none !important;
+    transition-duration: 0s !important;
+    transition-delay: 0s !important;
+    animation-duration: 0s !important;
+    animation-delay: 0s !important;
+    animation-iteration-count: 1 !important;
+    scroll-behavior: auto !important;
+}
+.fade, .modal.fade .modal-dialog, .modal-backdrop.fade {
+    transition: none !important;
+    transform: none !important;
+}
+"""
+
+# Init script: добавляет стили до загрузки страницы и выключает переходы jQuery/Bootstrap 3-4,
+# которые ждут transitionend по таймеру (emulateTransitionEnd) даже при нулевой длительности
+_NO_ANIMATIONS_SCRIPT = """
+(() => {
+    const css = %s;
+    const inject = () => {
+        if (document.getElementById('__no_animations')) return;
+        const style = document.createElement('style');
+        style.id = '__no_animations';
+        style.textContent = css;
+        (document.head || document.documentElement).appendChild(style);
+    };
+    if (document.documentElement) inject();
+    document.addEventListener('DOMContentLoaded', inject);
+    const disableJQueryTransitions = () => {
+        if (window.jQuery) {
+            window.jQuery.fx.off = true;
+            if (window.jQuery.support) window.jQuery.support.transition = false;
+        }
+    };
+    document.addEventListener('DOMContentLoaded', disableJQueryTransitions);
+    window.addEventListener('load', disableJQueryTransitions);
+})();
+"""
+
+
+def disable_animations(context: BrowserContext) -> None:
+    """
+    Отключает CSS-переходы и анимации во всех страницах контекста.
+
+    Используется вместе с эмуляцией `reduced_motion="reduce"` при создании контекста
+    (настройка DISABLE_ANIMATIONS): открытие и закрытие формы регистрации и подсветка
+    невалидных полей выполняются без ожидания окончания анимаций.
+
+    :param context: Контекст браузера.
+    """
+    context.add_init_script(_NO_ANIMATIONS_SCRIPT % json.dumps(_NO_ANIMATIONS_CSS))
+    logger.debug("CSS transitions and animations disabled for context")
@@ -0,0 +1,46 @@
+import functools
+import hashlib
+import re
+import urllib.request
+from typing import Optional
+
+from tools.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Ссылки на скрипты и стили в HTML: у собранного приложения имена бандлов меняются с каждой сборкой
+_ASSET_PATTERN = re.compile(rb'<(?:script|link)[^>]+(?:src|href)="([^"]+)"')
+
+
+@functools.lru_cache(maxsize=None)
+def fetch_build_fingerprint(url: str, timeout: float = 5) -> Optional[str]:
+    """
+    Вычисляет отпечаток сборки приложения по его главной странице.
+
+    В отпечаток входят ссылки на скрипты и стили (имена бандлов), а также заголовки
+    ETag и Last-Modified. Если страница недоступна, возвращается None: кеши,
+    привязанные к сборке, в этом случае не используются.
+
+    Результат запоминается на процесс: кеш локаторов, кеш результатов и метрики страниц
+    одного прогона привязываются к одной и той же сборке, а недоступное приложение
+    задерживает запуск на один таймаут, а не на таймаут каждого плагина.
+
+    :param url: URL приложения (обычно `settings.app_url`).
+    :param timeout: Таймаут запроса в секундах.
+    :return: Короткий hex-отпечаток сборки или None.
+    """
+    request = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0"})
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            headers = response.headers
+            body = response.read()
+    except Exception as e:
+        logger.warning(f"Failed to fetch app build fingerprint from {url}: {e}")
+        return None
+
+    marker = b"\n".join(_ASSET_PATTERN.findall(body))
+    for header in ("ETag", "Last-Modified"):
+        marker += b"\n" + (headers.get(header) or "").encode()
+    fingerprint = hashlib.sha1(marker if marker.strip() else body).hexdigest()[:16]
+    logger.info(f"App build fingerprint for {url}: {fingerprint}")
+    return fingerprint
@@ -0,0 +1,179 @@
+import json
+import os
+import time
+import urllib.error
+import urllib.request
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional
+
+from tools.logger import get_logger
+from tools.retry import describe
+
+logger = get_logger(__name__)
+
+# Сколько байт с конца журнала событий читается при проверке состояния: решение зависит
+# только от последних событий, а журнал длинного прогона может быть большим
+_TAIL_BYTES = 64 * 1024
+
+
+class CircuitBreaker:
+    """
+    Автомат защиты от недоступного приложения (`settings.app_url`), общий для воркеров pytest-xdist.
+
+    Открытия страниц (BasePage.open) и проверки доступности приложения (HTTP-запрос к app_url)
+    дописываются событиями в общий журнал (JSON Lines): воркеры — отдельные процессы, и состояние
+    автомата вычисляется по последним событиям всех воркеров. Автомат размыкается после
+    `failures` подряд неудачных или медленных (дольше `latency` мс) открытий или после неудачной
+    проверки; пока он разомкнут, тесты с браузером пропускаются. Не чаще раза в `cooldown` секунд
+    выполняется повторная проверка, и после успешной проверки тесты снова выполняются.
+
+    По умолчанию выключен (CIRCUIT_BREAKER_FAILURES в .env).
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.path: Optional[Path] = None
+        self.url = ""
+        self.failures = 0
+        self.latency = 0.0
+        self.cooldown = 0.0
+        self.worker = "main"
+
+    def enable(self, path: Path, url: str, failures: int, latency: float, cooldown: float, worker: str) -> None:
+        """
+        Включает автомат.
+
+        :param path: Общий для воркеров журнал событий.
+        :param url: URL приложения для проверок доступности.
+        :param failures: Сколько неудачных или медленных открытий подряд размыкают автомат.
+        :param latency: Порог времени открытия и ответа приложения в миллисекундах (0 — не проверяется).
+        :param cooldown: Интервал повторных проверок разомкнутого автомата в секундах.
+        :param worker: Идентификатор воркера (для журнала).
+        """
+        self.enabled = True
+        self.path = path
+        self.url = url
+        self.failures = max(failures, 1)
+        self.latency = latency
+        self.cooldown = cooldown
+        self.worker = worker
+
+    def _append(self, event: dict[str, Any]) -> None:
+        event = {"time": time.time(), "worker": self.worker, **event}
+        # Короткая строка в режиме дозаписи: строки воркеров не перемешиваются
+        with open(self.path, "a", encoding="utf-8") as journal:
+            journal.write(json.dumps(event) + "\n")
+
+    def _events(self) -> list[dict[str, Any]]:
+        """Последние события журнала в порядке записи."""
+        try:
+            with open(self.path, "rb") as journal:
+                size = journal.seek(0, os.SEEK_END)
+                journal.seek(max(size - _TAIL_BYTES, 0))
+                lines = journal.read().splitlines()
+        except FileNotFoundError:
+            return []
+        if size > _TAIL_BYTES:
+            lines = lines[1:]  # первая строка обрезана
+        events = []
+        for line in lines:
+            try:
+                events.append(json.loads(line))
+            except ValueError:
+                continue
+        return events
+
+    def _slow(self, ms: float) -> bool:
+        return bool(self.latency) and ms > self.latency
+
+    def record(self, route: str, ms: float, error: Optional[BaseException] = None) -> None:
+        """
+        Записывает результат открытия страницы.
+
+        :param route: Открытый маршрут.
+        :param ms: Время открытия в миллисекундах.
+        :param error: Ошибка открытия (None — страница открылась).
+        """
+        if not self.enabled:
+            return
+        ok = error is None and not self._slow(ms)
+        self._append({"kind": "navigation", "route": route, "ms": round(ms, 1), "ok": ok,
+                      "error": describe(error) if error is not None else None})
+
+    def probe(self, timeout: float = 10) -> bool:
+        """
+        Проверяет доступность приложения HTTP-запросом к его главной странице и записывает результат.
+
+        Ответ с кодом меньше 500 считается успешным, если он получен не дольше порога `latency`.
+
+        :param timeout: Таймаут запроса в секундах.
+        :return: True, если приложение доступно.
+        """
+        request = urllib.request.Request(self.url, headers={"User-Agent": "Mozilla/5.0"})
+        started = time.perf_counter()
+        error = None
+        try:
+            with urllib.request.urlopen(request, timeout=timeout) as response:
+                response.read(1)
+        except urllib.error.HTTPError as e:
+            if e.code >= 500:
+                error = f"HTTP {e.code}"
+        except Exception as e:
+            error = describe(e)
+        ms = (time.perf_counter() - started) * 1000
+        if error is None and self._slow(ms):
+            error = f"responded in {ms:.0f} ms (threshold {self.latency:.0f} ms)"
+        self._append({"kind": "probe", "ms": round(ms, 1), "ok": error is None, "error": error})
+        if error is None:
+            logger.info(f"Health probe of {self.url}: OK in {ms:.0f} ms")
+        else:
+            logger.warning(f"Health probe of {self.url} failed: {error}")
+        return error is None
+
+    def _open_reason(self, events: list[dict[str, Any]]) -> Optional[str]:
+        """
+        Причина размыкания по последним событиям (None — автомат замкнут).
+
+        Считаются неудачные события после последнего удачного; неудачная проверка
+        размыкает автомат сразу.
+        """
+        weight, failed = 0, []
+        for event in reversed(events):
+            if event["ok"]:
+                break
+            weight += self.failures if event["kind"] == "probe" else 1
+            failed.append(event)
+        if weight < self.failures:
+            return None
+        last = failed[0]
+        since = datetime.fromtimestamp(failed[-1]["time"]).strftime("%H:%M:%S")
+        cause = last["error"] or f"{last['ms']:.0f} ms (threshold {self.latency:.0f} ms)"
+        what = "health probe failed" if last["kind"] == "probe" else \
+            f"{len(failed)} failed or slow navigations in a row"
+        return f"app {self.url} unavailable since {since}: {what}, last: {cause}"
+
+    def check(self) -> Optional[str]:
+        """
+        Проверяет состояние автомата; если он разомкнут дольше `cooldown`, повторяет проверку доступности.
+
+        :return: Причина пропуска теста или None, если тест можно выполнять.
+        """
+        if not self.enabled:
+            return None
+        events = self._events()
+        reason = self._open_reason(events)
+        if reason is None:
+            return None
+        last_probe = max((event["time"] for event in events if event["kind"] == "probe"), default=0)
+        last_failure = max(event["time"] for event in events if not event["ok"])
+        if time.time() - max(last_probe, last_failure) >= self.cooldown:
+            if self.probe():
+                logger.info(f"Circuit closed: {self.url} is available again")
+                return None
+            reason = self._open_reason(self._events()) or reason
+        return reason
+
+
+# BasePage.open пишет открытия страниц сюда; включает автомат fixtures/circuit_breaker.py
+circuit_breaker = CircuitBreaker()
@@ -0,0 +1,103 @@
+import time
+from typing import Optional
+
+from playwright.sync_api import Locator
+
+from tools import time_budget
+from tools.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Ожидание состояния элемента по событиям страницы, без интервального опроса.
+# Условие проверяется сразу и затем только на события, которые могут его изменить:
+# мутации DOM (классы, атрибуты, удаление узлов), transitionend/animationend
+# (цвет бордера и исчезновение модального окна анимируются) и invalid (проверка формы).
+_WAIT_SCRIPT = """
+(element, { condition, timeout }) => new Promise((resolve) => {
+    const started = performance.now();
+    const isVisible = () => {
+        if (!element.isConnected) return false;
+        const style = getComputedStyle(element);
+        return style.visibility !== 'hidden' && style.display !== 'none'
+            && element.getClientRects().length > 0;
+    };
+    const isSettled = () => element.getAnimations().every((animation) => animation.playState !== 'running');
+    const conditions = {
+        visible: () => isVisible(),
+        hidden: () => !isVisible(),
+        invalid: () => element.isConnected && element.matches(':invalid')
+            && element.closest('.was-validated') !== null && isSettled(),
+        valid: () => element.isConnected && element.matches(':valid')
+            && element.closest('.was-validated') !== null && isSettled(),
+    };
+    // Состояния, из которых условие уже не может выполниться (элемент удалён из DOM)
+    const impossible = () => !element.isConnected && condition !== 'hidden';
+
+    const events = ['transitionend', 'transitioncancel', 'animationend', 'invalid'];
+    let observer = null;
+    let timer = null;
+    const finish = (met) => {
+        if (observer) observer.disconnect();
+        events.forEach((name) => document.removeEventListener(name, check, true));
+        clearTimeout(timer);
+        resolve({ met, elapsed: performance.now() - started });
+    };
+    function check() {
+        if (conditions[condition]()) finish(true);
+        else if (impossible()) finish(false);
+    }
+
+    if (conditions[condition]()) return finish(true);
+    if (impossible()) return finish(false);
+    observer = new MutationObserver(check);
+    observer.observe(document.body, { subtree: true, childList: true, attributes: true,
+        attributeFilter: ['class', 'style', 'hidden', 'aria-hidden'] });
+    events.forEach((name) => document.addEventListener(name, check, true));
+    timer = setTimeout(() => finish(false), timeout);
+})
+"""
+
+# Поддерживаемые условия ожидания
+CONDITIONS = ("visible", "hidden", "invalid", "valid")
+
+
+def wait_for_state(locator: Locator, condition: str, timeout: Optional[float], label: str) -> bool:
+    """
+    Ждёт состояния элемента по событиям страницы (MutationObserver, transitionend, invalid).
+
+    В отличие от expect(), который опрашивает страницу с интервалами, ожидание — один
+    вызов evaluate: Promise в странице разрешается при первом событии, после которого
+    условие выполнено, или по таймауту.
+
+    Условия:
+    - visible / hidden — элемент видим / скрыт или удалён из DOM;
+    - invalid / valid — поле не прошло / прошло проверку формы (`.was-validated`)
+      и анимация бордера завершилась.
+
+    :param locator: Локатор элемента (берётся первый найденный элемент; его отсутствие — это hidden).
+        Хэндлы найденных элементов освобождаются после ожидания.
+    :param condition: Условие из CONDITIONS.
+    :param timeout: Таймаут в миллисекундах (None — глобальный таймаут expect()); ограничивается бюджетом теста.
+    :param label: Описание ожидания для логов и разбивки бюджета.
+    :return: True, если условие выполнено, False по таймауту или если оно стало невыполнимым.
+    :raises ValueError: Если условие не поддерживается.
+    """
+    if condition not in CONDITIONS:
+        raise ValueError(f"Unsupported condition '{condition}'. Supported: {', '.join(CONDITIONS)}")
+    started = time.perf_counter()
+    with time_budget.wait(label, timeout) as timeout:
+        handles = locator.element_handles()
+        try:
+            if not handles:
+                met, in_page = condition == "hidden", 0.0
+            else:
+                result = handles[0].evaluate(_WAIT_SCRIPT, {"condition": condition, "timeout": timeout})
+                met, in_page = result["met"], result["elapsed"]
+        finally:
+            # Хэндлы держат узлы в странице (форма после закрытия удалена из DOM):
+            # без освобождения они копятся за длинный прогон на одной странице
+            for handle in handles:
+                handle.dispose()
+    logger.info(f"Event wait '{label}' ({condition}): met={met}, in page {in_page:.0f} ms, "
+                f"total {(time.perf_counter() - started) * 1000:.0f} ms")
+    return met
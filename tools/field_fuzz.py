@@ -0,0 +1,121 @@
+"""
+Фаззинг полей формы регистрации: тысячи значений на поле за секунды, без UI-теста на значение.
+
+Значения поля (data/field_fuzz.py) проверяются пачками на одной открытой форме валидацией
+браузера (validity, checkValidity() и цвет бордера — одним evaluate на пачку, см.
+RegistrationFormComponent.probe_validity). Результат браузера сравнивается с моделью
+ожидаемого результата; только расхождения записываются в файл кейсов и прогоняются полными
+UI-тестами test_field_validation:
+    python -m tools.field_fuzz --count 5000 --seed 42 --output fuzz_cases.json
+    FUZZ_CASES=fuzz_cases.json pytest -k fuzz
+"""
+import argparse
+import json
+import sys
+import time
+from itertools import islice
+from pathlib import Path
+from typing import Any, Optional
+
+from playwright.sync_api import sync_playwright
+
+from components.registration_form_component import RegistrationFormComponent
+from config import Settings
+from data.field_fuzz import FUZZ_FIELDS, expected_result, generate_values
+from fixtures.page_fixtures import create_context, launch_browser
+from pages.web_tables_page import WebTablePage
+from tools import time_budget
+from tools.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Цвет бордера невалидного поля (как в test_field_validation)
+INVALID_BORDER_COLOR = "rgb(220, 53, 69)"
+
+
+def fuzz_field(form: RegistrationFormComponent, field: str, count: int, batch_size: int,
+               seed: int, max_escalations: int) -> dict[str, Any]:
+    """
+    Проверяет значения поля валидацией браузера и сравнивает с моделью ожидаемого результата.
+
+    Расхождение — браузер принимает значение, которое модель отклоняет (или наоборот), либо
+    цвет бордера не соответствует validity.
+
+    :param form: Открытая форма регистрации.
+    :param field: Имя поля.
+    :param count: Число значений.
+    :param batch_size: Значений в одном evaluate.
+    :param seed: Сид генератора значений.
+    :param max_escalations: Сколько расхождений передавать в UI-тесты.
+    :return: Сводка поля: checked, disagreements, ms и cases [(case_name, value, expected_result)].
+    """
+    values = generate_values(field, count, seed)
+    checked = disagreements = 0
+    cases: list[tuple[str, str, str]] = []
+    started = time.perf_counter()
+    while batch := list(islice(values, batch_size)):
+        for value, result in zip(batch, form.probe_validity(field, batch)):
+            expected = expected_result(field, value)
+            actual = "success" if result["valid"] else "error"
+            border_consistent = (result["border"] == INVALID_BORDER_COLOR) != result["valid"]
+            if actual != expected or not border_consistent:
+                disagreements += 1
+                logger.debug(f"Fuzz {field}[{checked}] {value!r}: expected {expected}, browser {actual} "
+                             f"{result['flags']}, border {result['border']}")
+                if len(cases) < max_escalations:
+                    cases.append((f"fuzz_{checked}", value, expected))
+            checked += 1
+    elapsed = time.perf_counter() - started
+    logger.info(f"Fuzzed {field}: {checked} values in {elapsed:.2f} s, {disagreements} disagreements")
+    return {"checked": checked, "disagreements": disagreements, "ms": elapsed * 1000, "cases": cases}
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """
+    Точка входа командной строки фаззинга полей.
+
+    :param argv: Аргументы командной строки (None — sys.argv).
+    :return: Код возврата.
+    """
+    parser = argparse.ArgumentParser(description="Fuzz registration form fields against the browser's "
+                                                 "validation and write disagreements as UI test cases")
+    parser.add_argument("--count", type=int, default=1000, help="Generated values per field")
+    parser.add_argument("--fields", nargs="+", choices=FUZZ_FIELDS, default=list(FUZZ_FIELDS),
+                        help="Fields to fuzz")
+    parser.add_argument("--batch-size", type=int, default=200, help="Values checked per evaluate")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the value generators")
+    parser.add_argument("--max-escalations", type=int, default=50,
+                        help="Disagreements per field passed on to the UI tests")
+    parser.add_argument("--browser-name", default="chromium", help="Browser (as --browser-name of pytest)")
+    parser.add_argument("--output", type=Path, default=Path("fuzz_cases.json"),
+                        help="Escalated cases file (FUZZ_CASES for pytest)")
+    args = parser.parse_args(argv)
+
+    settings = Settings.initialize(args.browser_name)
+    time_budget.set_expect_timeout(settings.expect_timeout)
+    with sync_playwright() as playwright:
+        browser = launch_browser(playwright, settings)
+        try:
+            webtable_page = WebTablePage(create_context(browser, settings).new_page())
+            webtable_page.open_registration_form()
+            fields = {field: fuzz_field(webtable_page.registration_form, field, args.count,
+                                        max(args.batch_size, 1), args.seed, args.max_escalations)
+                      for field in args.fields}
+        finally:
+            browser.close()
+
+    report = {"seed": args.seed, "browser": settings.browser_name,
+              "fields": {field: {key: value for key, value in result.items() if key != "cases"}
+                         for field, result in fields.items()},
+              "cases": {field: result["cases"] for field, result in fields.items()}}
+    args.output.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(f"{'field':<12} {'checked':>8} {'disagree':>8} {'values/s':>9}")
+    for field, row in report["fields"].items():
+        rate = row["checked"] / row["ms"] * 1000 if row["ms"] else 0
+        print(f"{field:<12} {row['checked']:>8} {row['disagreements']:>8} {rate:>9.0f}")
+    logger.info(f"Escalated cases written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,145 @@
+import subprocess
+import sys
+import types
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+from tools.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Каталоги модулей, зависимости от которых записываются по тестам (page objects и данные кейсов)
+TRACKED_DIRS = ("elements", "components", "pages", "locators", "data")
+
+# Каталоги тестов: изменение модуля теста выбирает только его тесты
+TEST_DIRS = ("tests",)
+
+# Изменения, не влияющие на выполнение тестов (остальные файлы вне TRACKED_DIRS и TEST_DIRS —
+# фикстуры, tools, conftest.py, config.py, .env, зависимости (requirements.txt) — ведут к полному прогону)
+IGNORED_SUFFIXES = (".md", ".png", ".jpg", ".svg")
+IGNORED_NAMES = (".gitignore", "LICENSE")
+
+# Каталоги артефактов прогонов (не отслеживаются git, но видны как новые файлы)
+IGNORED_DIRS = ("allure-results", "tracing", "videos", "screenshots", "metrics")
+
+
+class DependencyRecorder:
+    """
+    Запись модулей проекта, код которых выполнялся во время теста.
+
+    На время теста ставится функция трассировки (sys.settrace), которая видит только события
+    вызова функций и не трассирует строки: для каждого нового файла один раз определяется,
+    относится ли он к TRACKED_DIRS, дальше проверка — поиск в словаре. sys.settrace
+    не конфликтует с cProfile (--profile-slow использует sys.setprofile).
+    """
+
+    def __init__(self, root: Path):
+        """
+        :param root: Корень проекта (rootdir pytest).
+        """
+        self.root = root.resolve()
+        self._relevant: dict[str, Optional[str]] = {}
+        self._touched: set[str] = set()
+        self._previous = None
+
+    def relative(self, filename: str) -> Optional[str]:
+        """
+        Путь файла относительно корня, если файл из TRACKED_DIRS.
+
+        :param filename: Имя файла кода (co_filename).
+        :return: POSIX-путь (например, "components/registration_form_component.py") или None.
+        """
+        relevant = self._relevant.get(filename, ...)
+        if relevant is ...:
+            try:
+                path = Path(filename).resolve().relative_to(self.root)
+                relevant = path.as_posix() if path.parts[0] in TRACKED_DIRS else None
+            except (ValueError, IndexError, OSError):
+                relevant = None
+            self._relevant[filename] = relevant
+        return relevant
+
+    def _trace(self, frame, event: str, arg: Any) -> None:
+        relative = self.relative(frame.f_code.co_filename)
+        if relative is not None:
+            self._touched.add(relative)
+        # Без локальной трассировки: события строк внутри функции не нужны
+        return None
+
+    def start(self) -> None:
+        """Начинает запись зависимостей теста."""
+        self._touched = set()
+        self._previous = sys.gettrace()
+        sys.settrace(self._trace)
+
+    def stop(self) -> set[str]:
+        """
+        Заканчивает запись.
+
+        :return: Пути модулей, код которых выполнялся.
+        """
+        sys.settrace(self._previous)
+        self._previous = None
+        return self._touched
+
+    def static(self, module: Optional[types.ModuleType]) -> set[str]:
+        """
+        Модули проекта, объекты которых импортированы в модуль теста.
+
+        Данные кейсов (data/field_data.py) используются при сборе тестов, а не во время
+        их выполнения, поэтому такие зависимости берутся из пространства имён модуля.
+
+        :param module: Модуль теста.
+        :return: Пути модулей из TRACKED_DIRS.
+        """
+        found = set()
+        for value in vars(module).values() if module is not None else ():
+            if isinstance(value, types.ModuleType):
+                source = value
+            else:
+                source = sys.modules.get(getattr(value, "__module__", None) or "")
+            relative = self.relative(getattr(source, "__file__", None) or "")
+            if relative is not None:
+                found.add(relative)
+        return found
+
+
+def changed_files(rev: str, root: Path) -> list[str]:
+    """
+    Файлы, изменённые относительно ревизии: коммиты после неё, незакоммиченные и новые файлы.
+
+    :param rev: Ревизия git (ветка, тег, хеш, HEAD~3).
+    :param root: Корень репозитория.
+    :return: POSIX-пути относительно корня.
+    :raises RuntimeError: Если git недоступен или ревизия не найдена.
+    """
+    files = set()
+    commands = (["git", "diff", "--name-only", "--relative", rev], ["git", "ls-files", "--others", "--exclude-standard"])
+    for command in commands:
+        result = subprocess.run(command, cwd=root, capture_output=True, text=True)
+        if result.returncode != 0:
+            raise RuntimeError(f"{' '.join(command)} failed: {result.stderr.strip()}")
+        files.update(line.strip() for line in result.stdout.splitlines() if line.strip())
+    return sorted(files)
+
+
+def classify(files: Iterable[str]) -> tuple[set[str], set[str], list[str]]:
+    """
+    Разделяет изменённые файлы по влиянию на выбор тестов.
+
+    :param files: Изменённые файлы (POSIX-пути относительно корня).
+    :return: (модули TRACKED_DIRS, модули тестов, файлы, требующие полного прогона).
+    """
+    tracked, tests, full = set(), set(), []
+    for file in files:
+        path = Path(file)
+        top = path.parts[0] if len(path.parts) > 1 else ""
+        if top in TRACKED_DIRS and path.suffix == ".py":
+            tracked.add(file)
+        elif top in TEST_DIRS and path.name.startswith("test_"):
+            tests.add(file)
+        elif path.suffix in IGNORED_SUFFIXES or path.name in IGNORED_NAMES or top in IGNORED_DIRS:
+            continue
+        else:
+            full.append(file)
+    return tracked, tests, full
@@ -0,0 +1,39 @@
+from typing import Any, Optional
+
+
+class LazyFaker:
+    """
+    Обёртка над Faker, которая импортирует библиотеку и создаёт генератор при первом обращении.
+
+    Модули с тестовыми данными импортируются уже при загрузке плагинов (conftest.py)
+    в контроллере и каждом воркере pytest-xdist, а импорт faker с локалью занимает
+    заметное время. Обёртка откладывает эту работу до первой генерации данных.
+
+    Пример:
+        fake = LazyFaker('ru_RU')
+        fake.first_name()  # здесь импортируется faker и создаётся Faker('ru_RU')
+    """
+
+    def __init__(self, locale: str):
+        """
+        :param locale: Локаль генератора (например, 'ru_RU').
+        """
+        self._locale = locale
+        self._faker: Optional[Any] = None
+
+    @staticmethod
+    def seed(seed: int) -> None:
+        """
+        Устанавливает общий seed для всех генераторов Faker (аналог `Faker.seed`).
+
+        :param seed: Значение seed.
+        """
+        from faker import Faker
+        Faker.seed(seed)
+
+    def __getattr__(self, name: str) -> Any:
+        """Создаёт генератор при первом обращении и делегирует ему атрибут."""
+        if self._faker is None:
+            from faker import Faker
+            self._faker = Faker(self._locale)
+        return getattr(self._faker, name)
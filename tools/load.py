@@ -0,0 +1,290 @@
+"""
+Генератор нагрузки на page objects Web Tables: много одновременных пользователей в браузерах.
+
+Каждый пользователь — свой BrowserContext и цикл шагов open -> add -> fill -> submit
+(WebTablePage и RegistrationFormComponent) с паузой на обдумывание между итерациями.
+Браузеры запускаются в отдельных потоках (у каждого свой Playwright), пользователи одного
+браузера работают в гринлетах поверх его диспетчера, как тесты в режиме --contexts-per-worker.
+
+Запуск (браузер и APP_URL — из .env; --app-url направляет нагрузку на другой стенд):
+    python -m tools.load --users 20 --browsers 2 --ramp-up 30 --duration 300
+    python -m tools.load --users 5 --iterations 10 --think-time 1-3 --app-url http://localhost:8000/
+"""
+import argparse
+import json
+import math
+import random
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from greenlet import greenlet
+from playwright.sync_api import Browser, sync_playwright
+from pydantic.networks import HttpUrl
+
+from config import Settings
+from data.person_info import PersonInfo
+from tools.lazy_faker import LazyFaker
+from fixtures.page_fixtures import create_context, launch_browser
+from pages.web_tables_page import WebTablePage
+from tools import time_budget
+from tools.logger import get_logger
+from tools.routes import AppRoute
+
+logger = get_logger(__name__)
+
+# Шаги сценария пользователя в порядке выполнения
+STEPS = ("open", "add", "fill", "submit")
+
+# Перцентили длительности шагов в отчёте
+PERCENTILES = (50, 90, 95, 99)
+
+
+def percentile(values: list[float], rank: float) -> Optional[float]:
+    """
+    Перцентиль по методу ближайшего ранга.
+
+    :param values: Значения.
+    :param rank: Перцентиль (0-100).
+    :return: Значение перцентиля или None для пустого списка.
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[max(math.ceil(rank / 100 * len(ordered)) - 1, 0)]
+
+
+class LoadPlan:
+    """
+    Параметры нагрузки: число пользователей, разгон, длительность и паузы.
+    """
+
+    def __init__(self, users: int, ramp_up: float, duration: Optional[float], iterations: Optional[int],
+                 think_time: tuple[float, float]):
+        """
+        :param users: Число одновременных пользователей.
+        :param ramp_up: За сколько секунд запускаются все пользователи (равномерно).
+        :param duration: Длительность нагрузки в секундах от старта (None — без ограничения).
+        :param iterations: Итераций на пользователя (None — без ограничения).
+        :param think_time: Диапазон паузы между итерациями в секундах (min, max).
+        """
+        self.users = users
+        self.ramp_up = ramp_up
+        self.duration = duration
+        self.iterations = iterations
+        self.think_time = think_time
+        self.started = time.monotonic()
+
+    def start(self) -> None:
+        """Отмечает старт нагрузки: вызывается, когда все браузеры запущены (их запуск не входит в замеры)."""
+        self.started = time.monotonic()
+
+    def start_delay(self, user: int) -> float:
+        """Задержка запуска пользователя с номером user относительно старта (линейный разгон)."""
+        return self.ramp_up * user / self.users if self.users > 1 else 0.0
+
+    def keep_going(self, iteration: int) -> bool:
+        """True, если пользователю нужно начать итерацию с номером iteration (с нуля)."""
+        if self.iterations is not None and iteration >= self.iterations:
+            return False
+        return self.duration is None or time.monotonic() - self.started < self.duration
+
+
+class BrowserWorker:
+    """
+    Поток с одним браузером и пользователями в гринлетах.
+
+    Замеры шагов собираются в samples: (шаг, время завершения от старта в секундах,
+    длительность в секундах, ошибка или None).
+    """
+
+    def __init__(self, number: int, users: list[int], settings: Settings, plan: LoadPlan,
+                 ready: threading.Barrier):
+        """
+        :param number: Номер браузера (для логов).
+        :param users: Номера пользователей этого браузера.
+        :param settings: Настройки проекта.
+        :param plan: Параметры нагрузки.
+        :param ready: Барьер запуска браузеров: пользователи стартуют, когда запущены все браузеры.
+        """
+        self.number = number
+        self.users = users
+        self.settings = settings
+        self.plan = plan
+        self.ready = ready
+        self.samples: list[tuple[str, float, float, Optional[str]]] = []
+        self.error: Optional[BaseException] = None
+        self.thread = threading.Thread(target=self._run, name=f"load-browser-{number}", daemon=True)
+        self._active = 0
+
+    def _measure(self, step: str, action: Callable[[], Any]) -> bool:
+        started = time.perf_counter()
+        error = None
+        try:
+            action()
+        except Exception as e:
+            error = f"{type(e).__name__}: {str(e).splitlines()[0] if str(e) else ''}"
+        finished = time.perf_counter()
+        self.samples.append((step, time.monotonic() - self.plan.started, finished - started, error))
+        return error is None
+
+    def _user(self, browser: Browser, user: int) -> None:
+        """Сценарий одного пользователя: свой контекст и итерации шагов до конца нагрузки."""
+        context = create_context(browser, self.settings)
+        page = context.new_page()
+        webtable_page = WebTablePage(page)
+        form = webtable_page.registration_form
+        # Свои генераторы у каждого пользователя: общие faker и random модуля data.person_info
+        # переустанавливали бы seed друг другу из разных потоков браузеров
+        fake, rnd = LazyFaker('ru_RU'), random.Random(user)
+        try:
+            iteration = 0
+            while self.plan.keep_going(iteration):
+                person = PersonInfo.generate_person(seed=user * 100000 + iteration, fake=fake, rnd=rnd)
+                # Следующий шаг имеет смысл только после успешного предыдущего
+                (self._measure("open", lambda: webtable_page.open(AppRoute.WEB_TABLES))
+                 and self._measure("add", webtable_page.click_add_button)
+                 and self._measure("fill", lambda: form.fill_form(person))
+                 and self._measure("submit", lambda: self._submit(form)))
+                iteration += 1
+                low, high = self.plan.think_time
+                if high > 0:
+                    page.wait_for_timeout(rnd.uniform(low, high) * 1000)
+        finally:
+            context.close()
+
+    @staticmethod
+    def _submit(form) -> None:
+        form.submit_button.click()
+        if not form.wait_closed():
+            raise AssertionError("Registration form did not close after submit")
+
+    def _run(self) -> None:
+        try:
+            with sync_playwright() as playwright:
+                try:
+                    browser = launch_browser(playwright, self.settings)
+                finally:
+                    # Остальные браузеры не ждут браузер, который не удалось запустить
+                    self.ready.wait()
+                try:
+                    self._run_users(playwright, browser)
+                finally:
+                    browser.close()
+        except BaseException as e:
+            logger.error(f"Load browser {self.number} crashed: {e}")
+            self.error = e
+
+    def _run_users(self, playwright, browser: Browser) -> None:
+        """Запускает пользователей по плану разгона и крутит диспетчер Playwright, пока они работают."""
+        main = greenlet.getcurrent()
+        loop = playwright._loop
+
+        def spawn(user: int) -> None:
+            def body() -> None:
+                try:
+                    self._user(browser, user)
+                except Exception as e:
+                    logger.error(f"User {user} stopped: {e}")
+                finally:
+                    self._active -= 1
+            greenlet(body, parent=main).switch()
+
+        for user in self.users:
+            self._active += 1
+            loop.call_later(self.plan.start_delay(user), spawn, user)
+        while self._active:
+            # Отдаём управление диспетчеру Playwright; возвращаемся, когда завершается пользователь
+            playwright._dispatcher_fiber.switch()
+
+
+def report(samples: list[tuple[str, float, float, Optional[str]]], elapsed: float) -> dict[str, Any]:
+    """
+    Сводка по шагам: число, ошибки, пропускная способность и перцентили длительности.
+
+    :param samples: Замеры всех браузеров.
+    :param elapsed: Длительность нагрузки в секундах.
+    :return: {шаг: {...}} с длительностями в миллисекундах.
+    """
+    result: dict[str, Any] = {}
+    for step in STEPS:
+        durations = [duration * 1000 for name, _, duration, error in samples if name == step and error is None]
+        errors = [error for name, _, _, error in samples if name == step and error is not None]
+        result[step] = {
+            "count": len(durations),
+            "errors": len(errors),
+            "throughput_per_s": len(durations) / elapsed if elapsed else None,
+            **{f"p{rank}_ms": percentile(durations, rank) for rank in PERCENTILES},
+            "max_ms": max(durations) if durations else None,
+            "top_errors": sorted(set(errors), key=errors.count, reverse=True)[:3],
+        }
+    return result
+
+
+def _think_time(value: str) -> tuple[float, float]:
+    """Разбирает паузу вида `2` или `1-3` (секунды)."""
+    low, _, high = value.partition("-")
+    return float(low), float(high or low)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """
+    Точка входа командной строки генератора нагрузки.
+
+    :param argv: Аргументы командной строки (None — sys.argv).
+    :return: Код возврата (1, если были ошибки шагов или упал браузер).
+    """
+    parser = argparse.ArgumentParser(description="Drive concurrent simulated users through the Web Tables "
+                                                 "page objects and report per-step latency percentiles")
+    parser.add_argument("--users", type=int, default=10, help="Concurrent users (one BrowserContext each)")
+    parser.add_argument("--browsers", type=int, default=1, help="Browsers to spread the users over")
+    parser.add_argument("--ramp-up", type=float, default=0, help="Seconds to start all users (linear)")
+    parser.add_argument("--duration", type=float, default=None, help="Load duration in seconds")
+    parser.add_argument("--iterations", type=int, default=None, help="Iterations per user")
+    parser.add_argument("--think-time", type=_think_time, default=(0.0, 0.0),
+                        help="Pause between iterations in seconds: N or MIN-MAX")
+    parser.add_argument("--browser-name", default="chromium", help="Browser (as --browser-name of pytest)")
+    parser.add_argument("--app-url", default=None, help="Target URL (default: APP_URL from .env)")
+    parser.add_argument("--output", type=Path, default=None, help="Write the JSON report here")
+    args = parser.parse_args(argv)
+    if args.duration is None and args.iterations is None:
+        parser.error("set --duration and/or --iterations")
+    if args.users < 1 or args.browsers < 1:
+        parser.error("--users and --browsers must be >= 1")
+
+    settings = Settings.initialize(args.browser_name)
+    if args.app_url:
+        settings = settings.model_copy(update={"app_url": HttpUrl(args.app_url)})
+    time_budget.set_expect_timeout(settings.expect_timeout)
+
+    plan = LoadPlan(args.users, args.ramp_up, args.duration, args.iterations, args.think_time)
+    browsers = min(args.browsers, args.users)
+    ready = threading.Barrier(browsers, action=plan.start)
+    workers = [BrowserWorker(number, list(range(number, args.users, browsers)), settings, plan, ready)
+               for number in range(browsers)]
+    for worker in workers:
+        worker.thread.start()
+    for worker in workers:
+        worker.thread.join()
+    elapsed = time.monotonic() - plan.started
+
+    samples = [sample for worker in workers for sample in worker.samples]
+    steps = report(samples, elapsed)
+    result = {"target": str(settings.app_url), "browser": settings.browser_name, "users": args.users,
+              "browsers": browsers, "elapsed_s": elapsed, "steps": steps}
+    print(f"{'step':<8} {'count':>6} {'errors':>6} {'rps':>7} "
+          + " ".join(f"{f'p{rank}, ms':>9}" for rank in PERCENTILES) + f" {'max, ms':>9}")
+    for step, row in steps.items():
+        print(f"{step:<8} {row['count']:>6} {row['errors']:>6} {row['throughput_per_s'] or 0:>7.2f} "
+              + " ".join(f"{row[f'p{rank}_ms'] or 0:>9.0f}" for rank in PERCENTILES) + f" {row['max_ms'] or 0:>9.0f}")
+    if args.output:
+        args.output.write_text(json.dumps(result, indent=2), encoding="utf-8")
+        logger.info(f"Load report written to {args.output}")
+    failed = any(worker.error for worker in workers) or any(row["errors"] for row in steps.values())
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
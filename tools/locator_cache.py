@@ -0,0 +1,158 @@
+from typing import Any, Optional
+
+from playwright.sync_api import Locator
+
+from tools.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Подбирает для найденного элемента более дешёвый CSS-селектор (id, data-атрибуты, name)
+# и проверяет, что он однозначно указывает на тот же элемент
+_CHEAPER_SELECTOR_SCRIPT = """
+(element) => {
+    const isUnique = (selector) => {
+        try {
+            const found = document.querySelectorAll(selector);
+            return found.length === 1 && found[0] === element;
+        } catch (e) {
+            return false;
+        }
+    };
+    const tag = element.tagName.toLowerCase();
+    const candidates = [];
+    if (element.id) {
+        candidates.push('#' + CSS.escape(element.id));
+    }
+    for (const attribute of ['data-testid', 'data-test', 'data-qa', 'name']) {
+        const value = element.getAttribute(attribute);
+        if (value) {
+            candidates.push(`${tag}[${attribute}="${CSS.escape(value)}"]`);
+        }
+    }
+    return candidates.find(isUnique) || null;
+}
+"""
+
+
+class LocatorCache:
+    """
+    Слой над локаторами элементов: замер времени разрешения и замена селекторов на более дешёвые.
+
+    Локаторы различаются по ключу, который задаёт page object (BaseElement.selector):
+    Playwright не публикует селектор собранного локатора.
+
+    По умолчанию выключен. Когда включён (опция --locator-cache):
+    - каждое разрешение локатора в BaseElement.get_locator замеряется по ключу;
+    - при первом разрешении селектора за сессию для элемента подбирается эквивалентный
+      селектор по id или data-атрибуту и проверяется, что он находит тот же единственный элемент;
+    - элементы, создаваемые позже, получают проверенный дешёвый селектор вместо
+      get_by_role / text=, которые требуют обхода дерева доступности или всего текста страницы.
+
+    Проверенные замены сохраняются между запусками плагином fixtures.locator_cache
+    (в кеше pytest, с привязкой к сборке приложения).
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.substitutes: dict[str, str] = {}
+        self.stats: dict[str, dict[str, float]] = {}
+        self._checked: set[str] = set()
+
+    def enable(self, substitutes: Optional[dict[str, str]] = None) -> None:
+        """
+        Включает слой.
+
+        :param substitutes: Проверенные ранее замены {ключ локатора: дешёвый селектор}.
+        """
+        self.enabled = True
+        self.substitutes.update(substitutes or {})
+
+    def substitute(self, key: str, locator: Locator) -> Locator:
+        """
+        Возвращает локатор с проверенным дешёвым селектором, если он известен.
+
+        :param key: Ключ локатора.
+        :param locator: Исходный локатор.
+        :return: Локатор с дешёвым селектором или исходный локатор.
+        """
+        if not self.enabled:
+            return locator
+        cheaper = self.substitutes.get(key)
+        return locator.page.locator(cheaper) if cheaper else locator
+
+    def discard(self, key: str) -> None:
+        """
+        Удаляет замену локатора (например, если дешёвый селектор перестал находить элемент).
+
+        :param key: Ключ локатора.
+        """
+        cheaper = self.substitutes.pop(key, None)
+        if cheaper:
+            logger.warning(f"Cheaper selector {cheaper} discarded for {key}")
+
+    def record(self, key: str, locator: Locator, seconds: float) -> None:
+        """
+        Учитывает время разрешения локатора и при первом разрешении подбирает дешёвый селектор.
+
+        :param key: Ключ локатора.
+        :param locator: Разрешённый локатор (без nth).
+        :param seconds: Время разрешения в секундах.
+        """
+        if not self.enabled:
+            return
+        stat = self.stats.setdefault(key, {"count": 0, "total": 0.0, "max": 0.0})
+        stat["count"] += 1
+        stat["total"] += seconds
+        stat["max"] = max(stat["max"], seconds)
+
+        if key in self._checked or key in self.substitutes:
+            return
+        self._checked.add(key)
+        try:
+            # Замена допустима только для локатора ровно одного элемента
+            if locator.count() != 1:
+                return
+            cheaper = locator.evaluate(_CHEAPER_SELECTOR_SCRIPT)
+        except Exception as e:
+            logger.debug(f"Failed to find cheaper selector for {key}: {e}")
+            return
+        if cheaper:
+            self.substitutes[key] = cheaper
+            logger.info(f"Cheaper selector verified: {key} -> {cheaper}")
+
+    def merge(self, substitutes: dict[str, str], stats: dict[str, dict[str, float]]) -> None:
+        """
+        Добавляет замены и статистику другого процесса (воркера pytest-xdist).
+
+        :param substitutes: Замены воркера.
+        :param stats: Статистика воркера по ключам локаторов.
+        """
+        self.substitutes.update(substitutes)
+        for selector, other in stats.items():
+            stat = self.stats.setdefault(selector, {"count": 0, "total": 0.0, "max": 0.0})
+            stat["count"] += other["count"]
+            stat["total"] += other["total"]
+            stat["max"] = max(stat["max"], other["max"])
+
+    def slowest(self, limit: int = 10) -> list[dict[str, Any]]:
+        """
+        Возвращает самые медленные селекторы по среднему времени разрешения.
+
+        :param limit: Сколько селекторов вернуть.
+        :return: Список словарей: селектор, число разрешений, среднее и максимум (мс), замена.
+        """
+        rows = [
+            {
+                "selector": selector,
+                "count": int(stat["count"]),
+                "mean_ms": stat["total"] / stat["count"] * 1000,
+                "max_ms": stat["max"] * 1000,
+                "substitute": self.substitutes.get(selector),
+            }
+            for selector, stat in self.stats.items() if stat["count"]
+        ]
+        return sorted(rows, key=lambda row: row["mean_ms"], reverse=True)[:limit]
+
+
+# Слой локаторов процесса, включается опцией --locator-cache (fixtures/locator_cache.py)
+locator_cache = LocatorCache()
@@ -0,0 +1,169 @@
+from typing import Any, Optional
+from weakref import WeakKeyDictionary
+
+import pytest
+from _pytest.nodes import Item
+from playwright.sync_api import BrowserContext, Request, Response
+
+from tools.logger import get_logger
+from tools.routes import ROUTE_BUDGETS, RouteBudget
+
+logger = get_logger(__name__)
+
+# Регистраторы контекстов (для получения статистики в фикстурах и page objects)
+_recorders: "WeakKeyDictionary[BrowserContext, NetworkRecorder]" = WeakKeyDictionary()
+
+
+def _empty() -> dict[str, Any]:
+    """Пустые счётчики: запросы, байты, время (мс), упавшие запросы и разбивка по типам ресурсов."""
+    return {"requests": 0, "bytes": 0, "ms": 0.0, "failed": 0, "by_type": {}}
+
+
+def _add(stats: dict[str, Any], resource_type: str, requests: int = 0, size: int = 0,
+         ms: float = 0.0, failed: int = 0) -> None:
+    """Добавляет замер к счётчикам и к разбивке по типу ресурса."""
+    by_type = stats["by_type"].setdefault(resource_type, {"requests": 0, "bytes": 0, "ms": 0.0})
+    for target in (stats, by_type):
+        target["requests"] += requests
+        target["bytes"] += size
+        target["ms"] += ms
+    stats["failed"] += failed
+
+
+class NetworkRecorder:
+    """
+    Учёт сетевых запросов страниц контекста: число, переданные байты и время по типам ресурсов.
+
+    Счётчики ведутся за тест целиком и за каждое открытие маршрута (BasePage.open): окно маршрута
+    длится от открытия до следующего открытия или конца теста, поэтому в него попадают и запросы,
+    отправленные после domcontentloaded. Окна маршрутов сравниваются с бюджетами ROUTE_BUDGETS
+    (tools/routes.py).
+
+    Байты — размер тела ответа, полученного по сети (Request.sizes(): после сжатия, в том числе
+    для ответов без Content-Length — chunked и сжатых), по завершении запроса; если браузер
+    не вернул размеры, используется заголовок Content-Length. Время — от начала запроса
+    до конца ответа по Resource Timing.
+    """
+
+    def __init__(self):
+        self.test = _empty()
+        self.routes: list[dict[str, Any]] = []
+        self._route: Optional[dict[str, Any]] = None
+        # Content-Length ответов на незавершённые запросы (запасной размер, если sizes() недоступен)
+        self._content_lengths: dict[Request, int] = {}
+
+    @classmethod
+    def install(cls, context: BrowserContext) -> 'NetworkRecorder':
+        """
+        Подключает учёт запросов к контексту.
+
+        :param context: Контекст браузера.
+        :return: Регистратор контекста.
+        """
+        recorder = cls()
+        context.on("response", recorder._on_response)
+        context.on("requestfinished", recorder._on_finished)
+        context.on("requestfailed", recorder._on_failed)
+        _recorders[context] = recorder
+        return recorder
+
+    @staticmethod
+    def of(context: BrowserContext) -> Optional['NetworkRecorder']:
+        """
+        Возвращает регистратор контекста.
+
+        :param context: Контекст браузера.
+        :return: Регистратор или None, если учёт не подключён.
+        """
+        return _recorders.get(context)
+
+    def reset(self) -> None:
+        """Обнуляет счётчики (в начале очередного теста)."""
+        self.test = _empty()
+        self.routes = []
+        self._route = None
+        self._content_lengths.clear()
+
+    def begin(self, route: str) -> None:
+        """
+        Начинает окно учёта маршрута (предыдущее окно закрывается).
+
+        :param route: Открываемый маршрут (значение AppRoute).
+        """
+        self.end()
+        self._route = {"route": route, **_empty()}
+
+    def end(self) -> None:
+        """Закрывает текущее окно маршрута."""
+        if self._route is not None:
+            self.routes.append(self._route)
+            self._route = None
+
+    def _targets(self) -> list[dict[str, Any]]:
+        return [self.test] if self._route is None else [self.test, self._route]
+
+    def _on_response(self, response: Response) -> None:
+        self._content_lengths[response.request] = int(response.headers.get("content-length") or 0)
+        for stats in self._targets():
+            _add(stats, response.request.resource_type, requests=1)
+
+    def _size(self, request: Request) -> int:
+        """Размер тела ответа, полученного по сети, в байтах."""
+        content_length = self._content_lengths.pop(request, 0)
+        try:
+            return max(request.sizes()["responseBodySize"], 0)
+        except Exception as e:
+            # Страница или контекст уже закрыты: остаётся заголовок ответа
+            logger.debug(f"Request sizes unavailable for {request.url}: {e}")
+            return content_length
+
+    def _on_finished(self, request: Request) -> None:
+        timing = request.timing
+        ms = max(timing.get("responseEnd", -1), 0)
+        size = self._size(request)
+        for stats in self._targets():
+            _add(stats, request.resource_type, size=size, ms=ms)
+
+    def _on_failed(self, request: Request) -> None:
+        self._content_lengths.pop(request, None)
+        for stats in self._targets():
+            _add(stats, request.resource_type, requests=1, failed=1)
+
+    def finish(self) -> list[str]:
+        """
+        Закрывает окно маршрута и проверяет окна маршрутов теста по бюджетам.
+
+        :return: Описания превышений бюджетов (пустой список, если бюджеты соблюдены).
+        """
+        self.end()
+        violations = []
+        for window in self.routes:
+            budget: Optional[RouteBudget] = ROUTE_BUDGETS.get(window["route"])
+            if budget is not None:
+                violations.extend(f'{window["route"]}: {violation}' for violation in budget.check(window))
+        return violations
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Счётчики теста и окон маршрутов."""
+        return {**self.test, "routes": self.routes + ([self._route] if self._route else [])}
+
+
+# Ключ для хранения регистратора сетевых запросов контекста теста (проверяет fixtures/network_budget.py)
+NETWORK_RECORDER_KEY = pytest.StashKey[NetworkRecorder]()
+
+
+def start_network_recording(context: BrowserContext, node: Item) -> None:
+    """
+    Обнуляет учёт запросов контекста и связывает его с тестом.
+
+    Находится здесь, а не в плагине fixtures/network_budget.py: фикстуры страницы загружаются
+    раньше плагина, и импорт плагина из них лишал бы его перезаписи assert в pytest.
+
+    :param context: Контекст браузера теста.
+    :param node: Тестовый элемент (Pytest Item).
+    """
+    recorder = NetworkRecorder.of(context)
+    if recorder is not None:
+        recorder.reset()
+        node.stash[NETWORK_RECORDER_KEY] = recorder
@@ -0,0 +1,181 @@
+import json
+import time
+from pathlib import Path
+from typing import Any, Optional
+from weakref import WeakKeyDictionary
+
+import allure
+from playwright.sync_api import BrowserContext, CDPSession, Page
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+from tools import time_budget
+from tools.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Init script: PerformanceObserver'ы LCP, сдвигов макета (CLS) и длинных задач.
+# Наблюдатели с buffered: true получают и записи, появившиеся до их создания
+_OBSERVERS_SCRIPT = """
+(() => {
+    if (window.__pageMetrics) return;
+    const metrics = window.__pageMetrics = { lcp: null, cls: 0, longTasks: 0, longTasksMs: 0 };
+    const observe = (type, callback) => {
+        try {
+            new PerformanceObserver((list) => list.getEntries().forEach(callback)).observe({ type, buffered: true });
+        } catch (e) {
+            // Тип записей не поддерживается браузером (например, LCP в WebKit и Firefox)
+        }
+    };
+    observe('largest-contentful-paint', (entry) => { metrics.lcp = entry.startTime; });
+    observe('layout-shift', (entry) => { if (!entry.hadRecentInput) metrics.cls += entry.value; });
+    observe('longtask', (entry) => { metrics.longTasks += 1; metrics.longTasksMs += entry.duration; });
+})();
+"""
+
+# Сбор метрик страницы: Navigation Timing, paint timings и значения наблюдателей
+_COLLECT_SCRIPT = """
+() => {
+    const navigation = performance.getEntriesByType('navigation')[0];
+    const timing = navigation ? {
+        type: navigation.type,
+        ttfb: navigation.responseStart,
+        dom_interactive: navigation.domInteractive,
+        dom_content_loaded: navigation.domContentLoadedEventEnd,
+        load: navigation.loadEventEnd || null,
+        transfer_size: navigation.transferSize,
+    } : {};
+    const paints = Object.fromEntries(performance.getEntriesByType('paint')
+        .map((entry) => [entry.name.replace(/-/g, '_'), entry.startTime]));
+    const observed = window.__pageMetrics || {};
+    return {
+        navigation: timing,
+        paint: paints,
+        lcp: observed.lcp ?? null,
+        cls: observed.cls ?? null,
+        long_tasks: observed.longTasks ?? null,
+        long_tasks_ms: observed.longTasksMs ?? null,
+    };
+}
+"""
+
+# Сколько ждать события load перед сбором метрик (мс): страницы открываются до domcontentloaded,
+# а loadEventEnd, LCP и длинные задачи до load ещё не известны или не окончательны
+LOAD_TIMEOUT = 10000
+
+# Метрики CDP Performance.getMetrics, попадающие в отчёт
+_CDP_METRICS = (
+    "Nodes", "JSEventListeners", "JSHeapUsedSize", "JSHeapTotalSize", "LayoutCount", "RecalcStyleCount",
+    "LayoutDuration", "RecalcStyleDuration", "ScriptDuration", "TaskDuration", "Documents", "Frames",
+)
+
+
+class PageMetrics:
+    """
+    Метрики производительности страниц после каждого открытия и перезагрузки (BasePage.open/reload).
+
+    Собираются Navigation Timing, paint timings (first-paint, first-contentful-paint), LCP, CLS
+    и длинные задачи (PerformanceObserver из init script контекста), а в Chromium — ещё
+    CDP Performance.getMetrics (узлы DOM, обработчики, JS heap, время layout и скриптов).
+    Метрики прикрепляются к Allure и дописываются строкой JSON во временной ряд
+    (`settings.web_vitals_file`) с идентификатором прогона, сборкой приложения и браузером.
+
+    По умолчанию выключен (WEB_VITALS в .env).
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.path: Optional[Path] = None
+        self.browser = ""
+        self.run = ""
+        self.build: Optional[str] = None
+        self._cdp: "WeakKeyDictionary[Page, CDPSession]" = WeakKeyDictionary()
+
+    def enable(self, path: Path, browser: str, run: str, build: Optional[str]) -> None:
+        """
+        Включает сбор метрик.
+
+        :param path: Файл временного ряда (JSON Lines).
+        :param browser: Имя браузера из настроек.
+        :param run: Идентификатор прогона (общий для всех воркеров).
+        :param build: Отпечаток сборки приложения (None, если не удалось определить).
+        """
+        self.enabled = True
+        self.path = path
+        self.browser = browser
+        self.run = run
+        self.build = build
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+    def install(self, context: BrowserContext) -> None:
+        """
+        Подключает PerformanceObserver'ы ко всем страницам контекста.
+
+        :param context: Контекст браузера.
+        """
+        if self.enabled:
+            context.add_init_script(_OBSERVERS_SCRIPT)
+
+    def _cdp_metrics(self, page: Page) -> Optional[dict[str, float]]:
+        """Возвращает метрики CDP Performance.getMetrics (только Chromium)."""
+        if page.context.browser is None or page.context.browser.browser_type.name != "chromium":
+            return None
+        try:
+            session = self._cdp.get(page)
+            if session is None:
+                session = page.context.new_cdp_session(page)
+                session.send("Performance.enable")
+                self._cdp[page] = session
+            metrics = session.send("Performance.getMetrics")["metrics"]
+        except Exception as e:
+            logger.debug(f"CDP metrics unavailable: {e}")
+            return None
+        return {metric["name"]: metric["value"] for metric in metrics if metric["name"] in _CDP_METRICS}
+
+    def collect(self, page: Page, route: str) -> Optional[dict[str, Any]]:
+        """
+        Собирает метрики страницы, прикрепляет их к Allure и дописывает во временной ряд.
+
+        Перед сбором ждёт события load (не дольше LOAD_TIMEOUT и оставшегося бюджета теста);
+        если страница не загрузилась, запись помечается "loaded": false.
+
+        :param page: Страница после навигации.
+        :param route: Маршрут страницы (значение AppRoute или URL при перезагрузке).
+        :return: Собранные метрики или None, если сбор выключен или не удался.
+        """
+        if not self.enabled:
+            return None
+        loaded = True
+        try:
+            with time_budget.wait(f'page metrics load "{route}"', LOAD_TIMEOUT) as timeout:
+                page.wait_for_load_state("load", timeout=timeout)
+        except PlaywrightTimeoutError:
+            # Записываем то, что есть, с пометкой: такие записи не сравнимы с полными
+            loaded = False
+            logger.warning(f"Page {route} did not fire load within {LOAD_TIMEOUT} ms, collecting partial metrics")
+        try:
+            metrics = page.evaluate(_COLLECT_SCRIPT)
+        except Exception as e:
+            logger.warning(f"Failed to collect page metrics for {route}: {e}")
+            return None
+        cdp = self._cdp_metrics(page)
+        if cdp is not None:
+            metrics["cdp"] = cdp
+        record = {
+            "time": time.time(),
+            "run": self.run,
+            "build": self.build,
+            "browser": self.browser,
+            "route": route,
+            "loaded": loaded,
+            **metrics,
+        }
+        allure.attach(json.dumps(record, indent=2), name=f"Page metrics ({route})",
+                      attachment_type=allure.attachment_type.JSON)
+        # Одна короткая строка за запись: дописывание из нескольких воркеров не перемешивает строки
+        with open(self.path, "a", encoding="utf-8") as series:
+            series.write(json.dumps(record) + "\n")
+        return record
+
+
+# Метрики страниц процесса: собирает BasePage, включает fixtures/page_metrics.py
+page_metrics = PageMetrics()
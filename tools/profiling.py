@@ -0,0 +1,148 @@
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Optional
+
+from tools.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Интервал сэмплирования стеков, секунды
+_SAMPLE_INTERVAL = 0.005
+
+
+def _frame_name(frame) -> str:
+    """Имя кадра стека для collapsed-формата: `модуль:функция`."""
+    code = frame.f_code
+    module = os.path.splitext(os.path.basename(code.co_filename))[0]
+    return f"{module}:{code.co_name}"
+
+
+class StackSampler:
+    """
+    Сэмплирующий профилировщик: раз в несколько миллисекунд снимает стек основного потока.
+
+    Результат — стеки в collapsed-формате (`a;b;c <число сэмплов>`), который читают
+    flamegraph.pl, speedscope и Perfetto. В отличие от cProfile, сохраняет полные цепочки
+    вызовов, но не считает вызовы.
+    """
+
+    def __init__(self, interval: float = _SAMPLE_INTERVAL):
+        """
+        :param interval: Интервал сэмплирования в секундах.
+        """
+        self.interval = interval
+        self.stacks: Counter[str] = Counter()
+        self._thread_id = threading.get_ident()
+        self._stop = threading.Event()
+        self._sampler: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Запускает сэмплирование стеков текущего потока."""
+        self._thread_id = threading.get_ident()
+        self._stop.clear()
+        self._sampler = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._sampler.start()
+
+    def stop(self) -> None:
+        """Останавливает сэмплирование."""
+        self._stop.set()
+        if self._sampler is not None:
+            self._sampler.join()
+            self._sampler = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._thread_id)
+            names = []
+            while frame is not None:
+                names.append(_frame_name(frame))
+                frame = frame.f_back
+            if names:
+                self.stacks[";".join(reversed(names))] += 1
+
+    def collapsed(self) -> str:
+        """
+        Возвращает стеки в collapsed-формате.
+
+        :return: Текст по строке на стек: `frame;frame;frame count`.
+        """
+        return "\n".join(f"{stack} {count}" for stack, count in self.stacks.most_common())
+
+
+class ItemProfiler:
+    """
+    Профилирование одного теста: cProfile (время по функциям) и StackSampler (полные стеки).
+    """
+
+    def __init__(self):
+        self.profile = cProfile.Profile()
+        self.sampler = StackSampler()
+        self.started = 0.0
+        self.seconds = 0.0
+
+    def start(self) -> None:
+        """
+        Запускает профилирование.
+
+        :raises ValueError: Если в процессе уже активен другой профилировщик.
+        """
+        self.profile.enable()
+        self.sampler.start()
+        self.started = time.perf_counter()
+
+    def stop(self) -> float:
+        """
+        Останавливает профилирование.
+
+        :return: Длительность профилирования в секундах.
+        """
+        self.profile.disable()
+        self.sampler.stop()
+        self.seconds = time.perf_counter() - self.started
+        return self.seconds
+
+    def stats_text(self, limit: int = 30) -> str:
+        """
+        Возвращает таблицу pstats самых затратных функций (по собственному времени).
+
+        :param limit: Сколько функций вывести.
+        :return: Текст таблицы.
+        """
+        stream = io.StringIO()
+        pstats.Stats(self.profile, stream=stream).sort_stats(pstats.SortKey.TIME).print_stats(limit)
+        return stream.getvalue()
+
+    def hotspots(self, limit: int = 50) -> dict[str, dict[str, float]]:
+        """
+        Возвращает самые затратные функции теста.
+
+        :param limit: Сколько функций вернуть (по собственному времени).
+        :return: {"файл:строка(функция)": {"calls": ..., "self": секунды, "total": секунды}}.
+        """
+        stats = pstats.Stats(self.profile).stats
+        rows = sorted(stats.items(), key=lambda item: item[1][2], reverse=True)[:limit]
+        return {
+            f"{os.path.basename(filename)}:{line}({name})": {"calls": calls, "self": self_time, "total": total_time}
+            for (filename, line, name), (_, calls, self_time, total_time, _) in rows
+        }
+
+
+def merge_hotspots(total: dict[str, dict[str, float]], hotspots: dict[str, dict[str, float]]) -> None:
+    """
+    Добавляет горячие точки теста (или процесса) к сумме.
+
+    :param total: Накопленные горячие точки (изменяется на месте).
+    :param hotspots: Горячие точки для добавления.
+    """
+    for function, values in hotspots.items():
+        row = total.setdefault(function, {"calls": 0, "self": 0.0, "total": 0.0, "tests": 0})
+        row["calls"] += values["calls"]
+        row["self"] += values["self"]
+        row["total"] += values["total"]
+        row["tests"] += values.get("tests", 1)
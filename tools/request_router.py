@@ -0,0 +1,189 @@
+import re
+from functools import lru_cache
+from typing import Any, Optional, Pattern, TYPE_CHECKING
+from urllib.parse import urlsplit
+from weakref import WeakKeyDictionary
+
+from playwright.sync_api import BrowserContext, Route
+
+from tools.logger import get_logger
+
+if TYPE_CHECKING:
+    from config import Settings
+
+logger = get_logger(__name__)
+
+# Расширения файлов для типов ресурсов: тип ресурса не виден в URL, а фильтр по URL
+# выполняется в браузере, и неподходящие запросы не проходят через Python
+_TYPE_EXTENSIONS = {
+    "font": r"woff2?|ttf|otf|eot",
+    "image": r"png|jpe?g|gif|webp|avif|svg|ico|bmp",
+    "media": r"mp4|webm|mp3|ogg|wav|m4a|m3u8",
+    "stylesheet": r"css",
+}
+
+# Для этих типов вместо обрыва запроса отдаётся пустой ответ: страница не получает ошибок загрузки
+_STUB_CONTENT_TYPES = {
+    "script": "application/javascript",
+    "stylesheet": "text/css",
+    "xhr": "application/json",
+    "fetch": "application/json",
+}
+
+# Сколько размеров ответов хранить между запусками
+_MAX_KNOWN_SIZES = 5000
+
+# Размеры ответов (байт) по URL без query: пополняются в режиме observe и используются для оценки
+# сэкономленного трафика в режимах deny/allow
+known_sizes: dict[str, int] = {}
+
+# Итоги по процессу для отчёта в конце сессии
+totals: dict[str, int] = {"blocked": 0, "bytes_saved": 0}
+
+# Роутеры контекстов (для получения статистики в фикстурах)
+_routers: "WeakKeyDictionary[BrowserContext, RequestRouter]" = WeakKeyDictionary()
+
+
+def _domains_pattern(domains: tuple[str, ...]) -> str:
+    """Регулярное выражение URL на любом из доменов (включая поддомены)."""
+    alternatives = "|".join(re.escape(domain.lower()) for domain in domains)
+    return rf"^[a-z]+://(?:[^/?#]*\.)?(?:{alternatives})(?::\d+)?(?:[/?#]|$)"
+
+
+@lru_cache(maxsize=None)
+def compile_rules(mode: str, blocked_domains: tuple[str, ...], blocked_resource_types: tuple[str, ...],
+                  blocked_url_patterns: tuple[str, ...], allowed_domains: tuple[str, ...]) -> Optional[Pattern[str]]:
+    """
+    Собирает правила блокировки в одно регулярное выражение (один раз на процесс для набора правил).
+
+    :param mode: Режим блокировки (observe, deny или allow).
+    :param blocked_domains: Блокируемые домены.
+    :param blocked_resource_types: Блокируемые типы ресурсов.
+    :param blocked_url_patterns: Регулярные выражения блокируемых URL.
+    :param allowed_domains: Разрешённые домены (для режима allow).
+    :return: Регулярное выражение URL, которые нужно перехватывать, или None, если правил нет.
+    """
+    if mode == "allow":
+        return re.compile(rf"^(?!{_domains_pattern(allowed_domains)[1:]})[a-z]+://", re.IGNORECASE)
+
+    alternatives = []
+    if blocked_domains:
+        alternatives.append(_domains_pattern(blocked_domains))
+    extensions = "|".join(_TYPE_EXTENSIONS[resource_type] for resource_type in blocked_resource_types)
+    if extensions:
+        alternatives.append(rf"\.(?:{extensions})(?:[?#]|$)")
+    alternatives.extend(blocked_url_patterns)
+    if not alternatives:
+        return None
+    return re.compile("|".join(f"(?:{alternative})" for alternative in alternatives), re.IGNORECASE)
+
+
+def rules_for(settings: 'Settings') -> Optional[Pattern[str]]:
+    """
+    Возвращает скомпилированные правила блокировки для настроек.
+
+    :param settings: Настройки проекта (экземпляр Settings).
+    :return: Регулярное выражение перехватываемых URL или None.
+    """
+    allowed = (urlsplit(str(settings.app_url)).hostname or "",) + tuple(settings.allowed_domains)
+    return compile_rules(
+        settings.request_blocking,
+        tuple(settings.blocked_domains),
+        tuple(settings.blocked_resource_types),
+        tuple(settings.blocked_url_patterns),
+        tuple(domain for domain in allowed if domain),
+    )
+
+
+def _size_key(url: str) -> str:
+    """Ключ размера ответа: URL без query и fragment."""
+    return url.split("#", 1)[0].split("?", 1)[0]
+
+
+class RequestRouter:
+    """
+    Блокировка сторонних запросов (реклама, аналитика, шрифты) на уровне контекста браузера.
+
+    Режимы (`settings.request_blocking`):
+    - observe — запросы проходят, но считаются, как если бы были заблокированы, и запоминаются их размеры;
+    - deny — запросы по правилам blocked_* обрываются или получают пустой ответ;
+    - allow — пропускаются только запросы к домену приложения и allowed_domains (герметичный прогон).
+
+    Главный документ страницы не блокируется никогда.
+    """
+
+    def __init__(self, mode: str, rules: Pattern[str]):
+        """
+        :param mode: Режим блокировки.
+        :param rules: Скомпилированное регулярное выражение перехватываемых URL.
+        """
+        self.mode = mode
+        self.rules = rules
+        self.stats: dict[str, Any] = {}
+        self.reset()
+
+    @classmethod
+    def install(cls, context: BrowserContext, settings: 'Settings') -> Optional['RequestRouter']:
+        """
+        Подключает блокировку к контексту, если она включена в настройках.
+
+        :param context: Контекст браузера.
+        :param settings: Настройки проекта (экземпляр Settings).
+        :return: Роутер контекста или None, если блокировка выключена или правил нет.
+        """
+        if settings.request_blocking == "off":
+            return None
+        rules = rules_for(settings)
+        if rules is None:
+            return None
+        router = cls(settings.request_blocking, rules)
+        context.route(rules, router._handle)
+        _routers[context] = router
+        return router
+
+    @staticmethod
+    def of(context: BrowserContext) -> Optional['RequestRouter']:
+        """
+        Возвращает роутер контекста.
+
+        :param context: Контекст браузера.
+        :return: Роутер или None, если блокировка не подключена.
+        """
+        return _routers.get(context)
+
+    def reset(self) -> None:
+        """Обнуляет счётчики (в начале очередного теста)."""
+        self.stats = {"mode": self.mode, "blocked": 0, "bytes_saved": 0, "by_type": {}, "by_host": {}}
+
+    def _count(self, route: Route, size: int) -> None:
+        request = route.request
+        host = urlsplit(request.url).hostname or request.url
+        self.stats["blocked"] += 1
+        self.stats["bytes_saved"] += size
+        self.stats["by_type"][request.resource_type] = self.stats["by_type"].get(request.resource_type, 0) + 1
+        self.stats["by_host"][host] = self.stats["by_host"].get(host, 0) + 1
+        totals["blocked"] += 1
+        totals["bytes_saved"] += size
+
+    def _handle(self, route: Route) -> None:
+        request = route.request
+        if request.is_navigation_request() and request.frame.parent_frame is None:
+            route.fallback()
+            return
+
+        key = _size_key(request.url)
+        if self.mode == "observe":
+            response = route.fetch()
+            body = response.body()
+            if key in known_sizes or len(known_sizes) < _MAX_KNOWN_SIZES:
+                known_sizes[key] = len(body)
+            self._count(route, len(body))
+            route.fulfill(response=response, body=body)
+            return
+
+        self._count(route, known_sizes.get(key, 0))
+        content_type = _STUB_CONTENT_TYPES.get(request.resource_type)
+        if content_type:
+            route.fulfill(status=200, body="", content_type=content_type)
+        else:
+            route.abort("blockedbyclient")
@@ -0,0 +1,138 @@
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+from tools.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def source_fingerprint(paths: Iterable[Path], root: Path) -> str:
+    """
+    Вычисляет отпечаток исходников: содержимое всех .py файлов в путях (каталоги — рекурсивно).
+
+    Пути файлов хешируются относительно root (файлы вне root — по имени), поэтому отпечаток
+    не зависит от того, куда склонирован репозиторий (локально, в CI, в другом чекауте).
+
+    :param paths: Файлы и каталоги.
+    :param root: Корень проекта.
+    :return: Короткий hex-отпечаток.
+    """
+    root = root.resolve()
+    digest = hashlib.sha1()
+    for path in paths:
+        files = sorted(path.rglob("*.py")) if path.is_dir() else [path]
+        for file in files:
+            if file.is_file():
+                file = file.resolve()
+                name = file.relative_to(root).as_posix() if file.is_relative_to(root) else file.name
+                digest.update(name.encode() + b"\0" + file.read_bytes() + b"\0")
+    return digest.hexdigest()[:16]
+
+
+class ResultCache:
+    """
+    Кеш успешных результатов тестов.
+
+    Тест пропускается, если он прошёл с тем же ключом не раньше, чем ttl назад. Ключ
+    (см. key()) включает nodeid, параметры кейса, браузер, отпечаток исходников page objects
+    и отпечаток сборки приложения, поэтому любое изменение кейса, кода страниц или самого
+    приложения делает запись недействительной.
+
+    Записи — {ключ: {"nodeid": ..., "time": unix-время прохождения}}.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.read = False
+        self.ttl = 0.0
+        self.entries: dict[str, dict[str, Any]] = {}
+        # Результаты этого процесса: прошедшие ключи и ключи упавших тестов (запись удаляется)
+        self.passed: dict[str, dict[str, Any]] = {}
+        self.failed: set[str] = set()
+        self.hits: list[str] = []
+
+    def enable(self, entries: dict[str, dict[str, Any]], ttl_hours: float, read: bool = True) -> None:
+        """
+        Включает кеш.
+
+        :param entries: Записи из прошлых прогонов.
+        :param ttl_hours: Срок годности записи в часах.
+        :param read: Пропускать тесты по записям (False — только обновлять кеш, --no-cache).
+        """
+        self.enabled = True
+        self.read = read
+        self.ttl = ttl_hours * 3600
+        self.entries = self.prune(entries)
+
+    @staticmethod
+    def key(nodeid: str, case: Any, browser: str, sources: str, build: str) -> str:
+        """
+        Ключ записи.
+
+        :param nodeid: Идентификатор теста.
+        :param case: Значение кейса (параметры теста).
+        :param browser: Имя браузера.
+        :param sources: Отпечаток исходников page objects, данных кейсов и модуля теста.
+        :param build: Отпечаток сборки приложения.
+        :return: hex-ключ.
+        """
+        payload = json.dumps([nodeid, case, browser, sources, build], sort_keys=True, default=repr,
+                             ensure_ascii=False)
+        return hashlib.sha1(payload.encode()).hexdigest()
+
+    def prune(self, entries: dict[str, dict[str, Any]]) -> dict[str, dict[str, Any]]:
+        """Отбрасывает записи старше ttl."""
+        deadline = time.time() - self.ttl
+        return {key: entry for key, entry in entries.items() if entry["time"] >= deadline}
+
+    def lookup(self, key: str) -> Optional[dict[str, Any]]:
+        """
+        Возвращает запись, по которой тест можно пропустить.
+
+        :param key: Ключ теста.
+        :return: Запись или None (нет записи, истёк срок или чтение кеша выключено).
+        """
+        if not self.read:
+            return None
+        entry = self.entries.get(key)
+        if entry is None or entry["time"] < time.time() - self.ttl:
+            return None
+        self.hits.append(entry["nodeid"])
+        return entry
+
+    def record(self, key: str, nodeid: str, passed: bool) -> None:
+        """
+        Запоминает результат теста.
+
+        :param key: Ключ теста.
+        :param nodeid: Идентификатор теста.
+        :param passed: Тест прошёл (setup, тело и teardown).
+        """
+        if passed and key not in self.failed:
+            self.passed[key] = {"nodeid": nodeid, "time": time.time()}
+        else:
+            self.passed.pop(key, None)
+            self.failed.add(key)
+
+    def merge(self, passed: dict[str, dict[str, Any]], failed: Iterable[str]) -> None:
+        """
+        Добавляет результаты воркера к результатам контроллера.
+
+        :param passed: Прошедшие ключи воркера.
+        :param failed: Ключи упавших тестов воркера.
+        """
+        self.passed.update(passed)
+        self.failed.update(failed)
+
+    def updated(self) -> dict[str, dict[str, Any]]:
+        """Записи для сохранения: непросроченные старые без упавших плюс новые прохождения."""
+        entries = {key: entry for key, entry in self.prune(self.entries).items() if key not in self.failed}
+        entries.update(self.passed)
+        return entries
+
+
+# Результаты собирают хуки fixtures/result_cache.py, в кеш pytest их сохраняет контроллер
+result_cache = ResultCache()
@@ -0,0 +1,129 @@
+import functools
+import re
+import time
+from contextlib import nullcontext
+from contextvars import ContextVar
+from typing import Any, Callable, Optional, TypeVar
+
+import allure
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+from tools.logger import get_logger
+
+logger = get_logger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Признаки кратковременных сбоев в тексте ошибок: таймауты Playwright (в том числе внутри
+# AssertionError от expect и ValueError page objects), сетевые ошибки навигации
+_TRANSIENT_PATTERN = re.compile(r"Timeout \d+ms exceeded|net::ERR_|Navigation failed because page crashed")
+
+# Попытки шагов page objects текущего теста (каждый тест и гринлет — свой список)
+_attempts: ContextVar[Optional[list[dict[str, Any]]]] = ContextVar("step_attempts", default=None)
+
+
+def is_transient(error: BaseException) -> bool:
+    """
+    Проверяет, вызвана ли ошибка кратковременным сбоем (таймаут, сетевая ошибка).
+
+    Просматривается вся цепочка исключений: page objects оборачивают ошибки Playwright
+    в ValueError/AssertionError (`raise ... from e`).
+
+    :param error: Исключение.
+    :return: True, если повтор может помочь.
+    """
+    seen = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        if isinstance(error, PlaywrightTimeoutError) or _TRANSIENT_PATTERN.search(str(error)):
+            return True
+        error = error.__cause__ or error.__context__
+    return False
+
+
+def describe(error: BaseException) -> str:
+    """Короткое описание ошибки: тип и первая строка сообщения."""
+    message = str(error).strip().splitlines()
+    return f"{type(error).__name__}: {message[0] if message else ''}"
+
+
+class RetryPolicy:
+    """
+    Политика повторов при кратковременных сбоях: для шагов page objects и для тестов целиком.
+
+    Повторы выполняются в том же браузере: шаг — на той же странице, тест — с теми же
+    фикстурами (новый контекст создаётся, только если страница теста закрылась или упала).
+    Повторяются только ошибки, для которых is_transient() истинно.
+
+    По умолчанию выключена (STEP_RETRIES и TEST_RETRIES в .env).
+    """
+
+    def __init__(self):
+        self.step_attempts = 1
+        self.test_attempts = 1
+
+    def configure(self, step_retries: int, test_retries: int) -> None:
+        """
+        Задаёт число повторов.
+
+        :param step_retries: Дополнительные попытки шага page object.
+        :param test_retries: Дополнительные попытки теста.
+        """
+        self.step_attempts = max(step_retries, 0) + 1
+        self.test_attempts = max(test_retries, 0) + 1
+
+    @staticmethod
+    def begin_test() -> None:
+        """Начинает учёт попыток шагов нового теста."""
+        _attempts.set([])
+
+    @staticmethod
+    def step_attempts_of_test() -> list[dict[str, Any]]:
+        """Попытки шагов текущего теста, завершившиеся ошибкой или повтором."""
+        return list(_attempts.get() or [])
+
+
+# Политика повторов шагов page objects; параметры задаёт fixtures/retry.py
+retry_policy = RetryPolicy()
+
+
+def _record(label: str, attempt: int, started: float, error: Optional[BaseException]) -> None:
+    attempts = _attempts.get()
+    if attempts is not None:
+        attempts.append({"step": label, "attempt": attempt, "ms": (time.perf_counter() - started) * 1000,
+                         "error": describe(error) if error is not None else None})
+
+
+def retry_step(method: F) -> F:
+    """
+    Декоратор шага page object: повторяет шаг при кратковременном сбое (retry_policy.step_attempts).
+
+    Каждый повтор — отдельный шаг Allure "Retry N of ...", время и ошибка каждой попытки
+    попадают в сводку попыток теста.
+
+    :param method: Метод page object (элемента, компонента или страницы).
+    :return: Обёрнутый метод.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        attempts = retry_policy.step_attempts
+        label = f'{method.__name__} "{getattr(self, "name", type(self).__name__)}"'
+        for attempt in range(1, attempts + 1):
+            started = time.perf_counter()
+            step = allure.step(f"Retry {attempt - 1} of {label}") if attempt > 1 else nullcontext()
+            try:
+                with step:
+                    result = method(self, *args, **kwargs)
+            except Exception as e:
+                if attempts > 1:
+                    _record(label, attempt, started, e)
+                if attempt == attempts or not is_transient(e):
+                    raise
+                logger.warning(f"Transient failure of {label} (attempt {attempt}/{attempts}), retrying: "
+                               f"{describe(e)}")
+                continue
+            if attempt > 1:
+                _record(label, attempt, started, None)
+                logger.info(f"{label} passed on attempt {attempt}/{attempts}")
+            return result
+    return wrapper  # type: ignore[return-value]
@@ -1,4 +1,6 @@
+from dataclasses import dataclass, field
 from enum import Enum
+from typing import Any, Optional
 
 
 class AppRoute(str, Enum):
@@ -12,4 +14,46 @@ class AppRoute(str, Enum):
     - редиректы.
     """
 
-    WEB_TABLES = "./webtables" # Страница для тестирования таблицы
\ No newline at end of file
+    WEB_TABLES = "./webtables" # Страница для тестирования таблицы
+
+@dataclass(frozen=True)
+class RouteBudget:
+    """
+    Сетевой бюджет открытия маршрута: запросы, переданные байты и суммарное время запросов.
+
+    Ограничения задаются для всей страницы и, при необходимости, по типам ресурсов
+    (document, script, stylesheet, image, font, xhr, fetch и т. п.). None — без ограничения.
+    """
+    max_requests: Optional[int] = None
+    max_bytes: Optional[int] = None
+    max_ms: Optional[float] = None
+    max_requests_by_type: dict[str, int] = field(default_factory=dict)
+    max_bytes_by_type: dict[str, int] = field(default_factory=dict)
+
+    def check(self, stats: dict[str, Any]) -> list[str]:
+        """
+        Сравнивает счётчики открытия маршрута с бюджетом.
+
+        :param stats: Счётчики окна маршрута (NetworkRecorder).
+        :return: Описания превышений.
+        """
+        limits = [("requests", stats["requests"], self.max_requests),
+                  ("bytes", stats["bytes"], self.max_bytes),
+                  ("ms", stats["ms"], self.max_ms)]
+        for resource_type, limit in self.max_requests_by_type.items():
+            limits.append((f"{resource_type} requests", stats["by_type"].get(resource_type, {}).get("requests", 0), limit))
+        for resource_type, limit in self.max_bytes_by_type.items():
+            limits.append((f"{resource_type} bytes", stats["by_type"].get(resource_type, {}).get("bytes", 0), limit))
+        return [f"{name} {value:.0f} > budget {limit}" for name, value, limit in limits
+                if limit is not None and value > limit]
+
+
+# Сетевые бюджеты маршрутов (ключ — значение AppRoute). Режим проверки — NETWORK_BUDGETS в .env
+ROUTE_BUDGETS: dict[str, RouteBudget] = {
+    AppRoute.WEB_TABLES.value: RouteBudget(
+        max_requests=120,
+        max_bytes=5 * 1024 * 1024,
+        max_requests_by_type={"script": 40},
+        max_bytes_by_type={"image": 1024 * 1024},
+    ),
+}
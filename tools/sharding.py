@@ -0,0 +1,159 @@
+"""
+Разбиение набора тестов на шарды (--shard=i/n) и слияние результатов Allure шардов.
+
+Каждая машина CI запускает свой шард с общим файлом длительностей, например
+`pytest -n 4 --shard=2/3 --shard-durations shard_durations.json`, и сохраняет свой каталог
+allure-results. Затем каталоги шардов сливаются в один для общего отчёта, а длительности
+шардов — в файл для следующего прогона:
+    python -m tools.sharding shard-1/allure-results shard-2/allure-results shard-3/allure-results \\
+        --output allure-results --durations shard-*/.pytest_cache/v/sharding/durations
+"""
+import argparse
+import json
+import shutil
+import statistics
+import sys
+from pathlib import Path
+from typing import Hashable, Optional, Sequence
+
+from tools.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Файлы allure-results, общие для прогона (а не для отдельного теста): при слиянии не копируются
+# как есть, а собираются из всех шардов
+_SHARED_FILES = ("executor.json", "environment.properties", "categories.json")
+
+
+def parse_shard(value: str) -> tuple[int, int]:
+    """
+    Разбирает номер шарда вида `i/n` (i от 1 до n).
+
+    :param value: Значение опции --shard.
+    :return: (i, n).
+    :raises ValueError: Если значение некорректно.
+    """
+    index, _, total = value.partition("/")
+    try:
+        index, total = int(index), int(total)
+    except ValueError:
+        raise ValueError(f"shard must look like i/n, got {value!r}") from None
+    if not 1 <= index <= total:
+        raise ValueError(f"shard index must be between 1 and {total}, got {index}")
+    return index, total
+
+
+def partition(units: Sequence[tuple[Hashable, float]], total: int) -> list[list[Hashable]]:
+    """
+    Детерминированно распределяет единицы по шардам с выравниванием суммарного веса.
+
+    Жадный алгоритм LPT: единицы по убыванию веса (при равенстве — по ключу) попадают
+    в шард с наименьшей текущей нагрузкой (при равенстве — с меньшим номером). При равных
+    весах это равномерное распределение по количеству. Результат зависит только от набора
+    единиц, поэтому все машины и воркеры получают одно и то же разбиение.
+
+    :param units: Пары (ключ единицы, вес — например, длительность в секундах).
+    :param total: Число шардов.
+    :return: Ключи единиц каждого шарда (по номеру шарда с нуля).
+    """
+    shards: list[list[Hashable]] = [[] for _ in range(total)]
+    loads = [0.0] * total
+    for key, weight in sorted(units, key=lambda unit: (-unit[1], str(unit[0]))):
+        target = min(range(total), key=lambda shard: (loads[shard], shard))
+        shards[target].append(key)
+        loads[target] += weight
+    return shards
+
+
+def estimate(durations: dict[str, float], nodeids: Sequence[str]) -> dict[str, float]:
+    """
+    Оценка длительности тестов по истории.
+
+    :param durations: Длительности прошлых прогонов по nodeid в секундах.
+    :param nodeids: Тесты для оценки.
+    :return: {nodeid: длительность}; тестам без истории — медиана известных, без истории
+             вообще — 1 (разбиение по количеству).
+    """
+    known = [durations[nodeid] for nodeid in nodeids if nodeid in durations]
+    default = statistics.median(known) if known else 1.0
+    return {nodeid: durations.get(nodeid, default) for nodeid in nodeids}
+
+
+def merge_results(shards: Sequence[Path], output: Path) -> int:
+    """
+    Сливает каталоги allure-results шардов в один.
+
+    Файлы результатов, вложений и history копируются (имена уникальны в пределах прогона);
+    executor.json берётся из первого шарда, где он есть, environment.properties объединяется
+    по ключам, categories.json — первый найденный.
+
+    :param shards: Каталоги allure-results шардов.
+    :param output: Каталог результата (создаётся при необходимости).
+    :return: Число скопированных файлов результатов.
+    """
+    output.mkdir(parents=True, exist_ok=True)
+    copied = 0
+    environment: dict[str, str] = {}
+    shared: dict[str, Path] = {}
+    for shard in shards:
+        for path in sorted(shard.rglob("*")):
+            if not path.is_file():
+                continue
+            relative = path.relative_to(shard)
+            if relative.as_posix() == "environment.properties":
+                for line in path.read_text(encoding="utf-8").splitlines():
+                    key, separator, value = line.partition("=")
+                    if separator and key.strip() not in environment:
+                        environment[key.strip()] = value.strip()
+            elif relative.as_posix() in _SHARED_FILES:
+                shared.setdefault(relative.as_posix(), path)
+            else:
+                target = output / relative
+                if target.exists() and relative.parts[0] != "history":
+                    logger.warning(f"Duplicate result file {relative} in {shard}, overwriting")
+                target.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(path, target)
+                copied += 1
+    for name, path in shared.items():
+        shutil.copy2(path, output / name)
+    if environment:
+        (output / "environment.properties").write_text(
+            "".join(f"{key}={value}\n" for key, value in environment.items()), encoding="utf-8")
+    logger.info(f"Merged {copied} result files from {len(shards)} shards into {output}")
+    return copied
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """
+    Точка входа командной строки слияния результатов шардов.
+
+    :param argv: Аргументы командной строки (None — sys.argv).
+    :return: Код возврата (1, если какого-то каталога шарда нет).
+    """
+    parser = argparse.ArgumentParser(description="Merge per-shard allure-results (and executor.json) "
+                                                 "into one directory for a single report")
+    parser.add_argument("shards", nargs="+", type=Path, help="allure-results directories of the shards")
+    parser.add_argument("--output", type=Path, default=Path("allure-results"), help="Merged results directory")
+    parser.add_argument("--durations", nargs="*", type=Path, default=[],
+                        help="Per-shard duration histories (.pytest_cache/v/sharding/durations) to merge")
+    parser.add_argument("--durations-output", type=Path, default=Path("shard_durations.json"),
+                        help="Where to write the merged duration history (--shard-durations of the next run)")
+    args = parser.parse_args(argv)
+
+    missing = [shard for shard in args.shards if not shard.is_dir()]
+    for shard in missing:
+        logger.error(f"Shard results not found: {shard}")
+    merge_results([shard for shard in args.shards if shard.is_dir()], args.output)
+    if args.durations:
+        durations: dict[str, float] = {}
+        for path in args.durations:
+            if path.is_file():
+                durations.update(json.loads(path.read_text(encoding="utf-8")))
+        args.durations_output.parent.mkdir(parents=True, exist_ok=True)
+        args.durations_output.write_text(json.dumps(durations, indent=2, sort_keys=True), encoding="utf-8")
+        logger.info(f"Merged durations of {len(durations)} tests into {args.durations_output}")
+    return 1 if missing else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
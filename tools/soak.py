@@ -0,0 +1,194 @@
+"""
+Длительный прогон (soak) Web Tables: поиск утечек при добавлении большого числа записей.
+
+На одной странице в цикле выполняется сценарий [Add] -> fill_form -> [Submit], с заданным
+интервалом снимаются размер JS heap, число узлов DOM и обработчиков событий. В отчёте —
+наклон роста этих величин на итерацию и дрейф длительности итерации.
+
+Запуск (настройки браузера и APP_URL — из .env, как у тестов):
+    python -m tools.soak --iterations 500
+    python -m tools.soak --minutes 30 --sample-every 20 --output soak.json
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from playwright.sync_api import Page, sync_playwright
+
+from config import Settings
+from data.person_info import PersonInfo
+from fixtures.page_fixtures import create_context, launch_browser
+from pages.web_tables_page import WebTablePage
+from tools import time_budget
+from tools.logger import get_logger
+from tools.routes import AppRoute
+
+logger = get_logger(__name__)
+
+# Запасной замер памяти без CDP (Firefox, WebKit): performance.memory есть только в Chromium,
+# поэтому в остальных браузерах heap будет None, а число обработчиков событий недоступно
+_MEMORY_FALLBACK_SCRIPT = """
+() => ({
+    heap: performance.memory ? performance.memory.usedJSHeapSize : null,
+    nodes: document.getElementsByTagName('*').length,
+    listeners: null,
+})
+"""
+
+
+class MemoryProbe:
+    """
+    Замер памяти страницы: CDP в Chromium (после сборки мусора), иначе performance.memory.
+    """
+
+    def __init__(self, page: Page):
+        """
+        :param page: Страница, память которой замеряется.
+        """
+        self.page = page
+        self.cdp = None
+        if page.context.browser is not None and page.context.browser.browser_type.name == "chromium":
+            try:
+                self.cdp = page.context.new_cdp_session(page)
+                self.cdp.send("Performance.enable")
+            except Exception as e:
+                logger.warning(f"CDP unavailable, falling back to performance.memory: {e}")
+                self.cdp = None
+
+    def sample(self) -> dict[str, Optional[float]]:
+        """
+        Снимает замер.
+
+        :return: {"heap": байт JS heap, "nodes": узлов DOM, "listeners": обработчиков событий}.
+        """
+        if self.cdp is None:
+            return self.page.evaluate(_MEMORY_FALLBACK_SCRIPT)
+        # Сборка мусора перед замером: в наклон попадает удерживаемая память, а не мусор
+        self.cdp.send("HeapProfiler.collectGarbage")
+        metrics = {metric["name"]: metric["value"]
+                   for metric in self.cdp.send("Performance.getMetrics")["metrics"]}
+        return {
+            "heap": metrics.get("JSHeapUsedSize"),
+            "nodes": metrics.get("Nodes"),
+            "listeners": metrics.get("JSEventListeners"),
+        }
+
+
+def slope(points: list[tuple[float, float]]) -> Optional[float]:
+    """
+    Наклон линейной регрессии (метод наименьших квадратов).
+
+    :param points: Точки (x, y).
+    :return: Прирост y на единицу x или None, если точек меньше двух.
+    """
+    points = [(x, y) for x, y in points if y is not None]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    denominator = sum((x - mean_x) ** 2 for x, _ in points)
+    if not denominator:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / denominator
+
+
+def summarize(latencies: list[float], samples: list[dict[str, Any]]) -> dict[str, Any]:
+    """
+    Сводка прогона: наклоны роста памяти и дрейф длительности итерации.
+
+    :param latencies: Длительности итераций в секундах.
+    :param samples: Замеры памяти с номером итерации (`iteration`).
+    :return: Сводка для отчёта.
+    """
+    tenth = max(len(latencies) // 10, 1)
+    first, last = latencies[:tenth], latencies[-tenth:]
+    summary: dict[str, Any] = {
+        "iterations": len(latencies),
+        "latency_first_ms": sum(first) / len(first) * 1000 if first else None,
+        "latency_last_ms": sum(last) / len(last) * 1000 if last else None,
+        "latency_drift_ms_per_iteration": (slope(list(enumerate(latencies))) or 0) * 1000 if latencies else None,
+    }
+    for metric in ("heap", "nodes", "listeners"):
+        summary[f"{metric}_per_iteration"] = slope([(sample["iteration"], sample[metric]) for sample in samples])
+    if samples:
+        summary["first_sample"] = samples[0]
+        summary["last_sample"] = samples[-1]
+    return summary
+
+
+def run_soak(page: Page, iterations: Optional[int], minutes: Optional[float], sample_every: int) -> dict[str, Any]:
+    """
+    Выполняет soak-прогон на открытой странице.
+
+    :param page: Страница браузера.
+    :param iterations: Число итераций (None — без ограничения).
+    :param minutes: Длительность прогона в минутах (None — без ограничения).
+    :param sample_every: Замер памяти каждые N итераций.
+    :return: Отчёт: сводка, длительности итераций и замеры памяти.
+    """
+    webtable_page = WebTablePage(page)
+    webtable_page.open(AppRoute.WEB_TABLES)
+    form = webtable_page.registration_form
+    probe = MemoryProbe(page)
+    samples = [{"iteration": 0, **probe.sample()}]
+    latencies: list[float] = []
+    deadline = time.monotonic() + minutes * 60 if minutes else None
+
+    iteration = 0
+    while (iterations is None or iteration < iterations) and (deadline is None or time.monotonic() < deadline):
+        iteration += 1
+        person = PersonInfo.generate_person(seed=iteration)
+        started = time.perf_counter()
+        webtable_page.click_add_button()
+        form.fill_form(person)
+        form.submit_button.click()
+        if not form.wait_closed():
+            raise AssertionError(f"Registration form did not close on iteration {iteration}")
+        latencies.append(time.perf_counter() - started)
+        if iteration % sample_every == 0:
+            samples.append({"iteration": iteration, **probe.sample()})
+            logger.info(f"Soak iteration {iteration}: {latencies[-1] * 1000:.0f} ms, {samples[-1]}")
+    return {"summary": summarize(latencies, samples), "latencies_ms": [value * 1000 for value in latencies],
+            "samples": samples}
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """
+    Точка входа командной строки soak-прогона.
+
+    :param argv: Аргументы командной строки (None — sys.argv).
+    :return: Код возврата.
+    """
+    parser = argparse.ArgumentParser(description="Loop the Web Tables add-record flow and track heap, "
+                                                 "DOM and listener growth")
+    parser.add_argument("--iterations", type=int, default=None, help="Number of add-record iterations")
+    parser.add_argument("--minutes", type=float, default=None, help="Run for this many minutes")
+    parser.add_argument("--sample-every", type=int, default=10, help="Sample memory every N iterations")
+    parser.add_argument("--browser-name", default="chromium", help="Browser (as --browser-name of pytest)")
+    parser.add_argument("--output", type=Path, default=Path("soak.json"), help="JSON report path")
+    args = parser.parse_args(argv)
+    if args.iterations is None and args.minutes is None:
+        parser.error("set --iterations and/or --minutes")
+
+    settings = Settings.initialize(args.browser_name)
+    time_budget.set_expect_timeout(settings.expect_timeout)
+    with sync_playwright() as playwright:
+        browser = launch_browser(playwright, settings)
+        try:
+            context = create_context(browser, settings)
+            report = run_soak(context.new_page(), args.iterations, args.minutes, max(args.sample_every, 1))
+        finally:
+            browser.close()
+
+    report["browser"] = settings.browser_name
+    args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(json.dumps(report["summary"], indent=2))
+    logger.info(f"Soak report written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
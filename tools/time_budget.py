@@ -0,0 +1,169 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+from playwright.sync_api import expect
+
+from tools.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Таймаут действий Playwright по умолчанию (click, fill и т. п.), мс
+ACTION_TIMEOUT = 30000
+
+# Сколько самых долгих ожиданий показывать в разбивке
+_BREAKDOWN_LIMIT = 10
+
+
+class TimeBudgetExceeded(BaseException):
+    """
+    Бюджет времени теста исчерпан.
+
+    Наследуется от BaseException (как исключения pytest.fail/pytest.skip), чтобы его не
+    перехватывали обработчики `except Exception` в page objects, которые возвращают False.
+    """
+
+
+class TimeBudget:
+    """
+    Бюджет времени одного теста: сколько осталось и на что ушло.
+
+    Учитываются ожидания page objects (локаторы, expect, навигация) с их длительностью.
+    """
+
+    def __init__(self, seconds: float):
+        """
+        :param seconds: Бюджет теста в секундах.
+        """
+        self.seconds = seconds
+        self.started = time.perf_counter()
+        self.waits: list[tuple[str, float]] = []
+
+    @property
+    def remaining_ms(self) -> float:
+        """Оставшееся время бюджета в миллисекундах."""
+        return (self.seconds - (time.perf_counter() - self.started)) * 1000
+
+    @property
+    def exhausted(self) -> bool:
+        """True, если бюджет израсходован."""
+        return self.remaining_ms <= 0
+
+    def breakdown(self) -> str:
+        """
+        Возвращает разбивку времени теста: всего, на ожидания и самые долгие ожидания.
+
+        :return: Многострочный текст для отчёта.
+        """
+        elapsed = time.perf_counter() - self.started
+        totals: dict[str, list[float]] = {}
+        for label, seconds in self.waits:
+            total = totals.setdefault(label, [0, 0.0])
+            total[0] += 1
+            total[1] += seconds
+        waited = sum(seconds for _, seconds in self.waits)
+        lines = [
+            f"Budget: {self.seconds:.1f}s, elapsed: {elapsed:.1f}s, "
+            f"in waits: {waited:.1f}s, outside waits: {elapsed - waited:.1f}s",
+        ]
+        for label, (count, seconds) in sorted(totals.items(), key=lambda item: item[1][1], reverse=True)[:_BREAKDOWN_LIMIT]:
+            lines.append(f"  {seconds:7.2f}s  x{count:<3} {label}")
+        return "\n".join(lines)
+
+
+# Бюджет текущего теста. ContextVar, а не глобальная переменная: тесты, выполняемые
+# одновременно в гринлетах (--contexts-per-worker), видят каждый свой бюджет
+_current: ContextVar[Optional[TimeBudget]] = ContextVar("time_budget", default=None)
+
+# Глобальный таймаут expect(), установленный фикстурой страницы
+_expect_timeout = 5000.0
+
+
+def start(seconds: float) -> TimeBudget:
+    """
+    Начинает отсчёт бюджета времени текущего теста.
+
+    :param seconds: Бюджет в секундах.
+    :return: Объект бюджета.
+    """
+    budget = TimeBudget(seconds)
+    _current.set(budget)
+    return budget
+
+
+def stop() -> Optional[TimeBudget]:
+    """
+    Завершает отсчёт бюджета текущего теста.
+
+    :return: Объект бюджета или None, если бюджета не было.
+    """
+    budget = _current.get()
+    _current.set(None)
+    return budget
+
+
+def current() -> Optional[TimeBudget]:
+    """Возвращает бюджет текущего теста (None, если бюджет не задан)."""
+    return _current.get()
+
+
+def set_expect_timeout(milliseconds: float) -> None:
+    """
+    Устанавливает глобальный таймаут expect() и запоминает его для ограничения бюджетом.
+
+    :param milliseconds: Таймаут в миллисекундах.
+    """
+    global _expect_timeout
+    _expect_timeout = milliseconds
+    expect.set_options(timeout=milliseconds)
+
+
+def cap(timeout: float, label: str = "wait") -> float:
+    """
+    Ограничивает таймаут ожидания оставшимся бюджетом теста.
+
+    :param timeout: Собственный таймаут ожидания в миллисекундах.
+    :param label: Описание ожидания (для сообщения об ошибке).
+    :return: min(timeout, оставшийся бюджет) или timeout, если бюджет не задан.
+    :raises TimeBudgetExceeded: Если бюджет уже исчерпан.
+    """
+    budget = _current.get()
+    if budget is None:
+        return timeout
+    remaining = budget.remaining_ms
+    if remaining <= 0:
+        raise TimeBudgetExceeded(f"Time budget of {budget.seconds:.1f}s exhausted before {label}\n{budget.breakdown()}")
+    return min(timeout, remaining)
+
+
+@contextmanager
+def wait(label: str, timeout: Optional[float] = None) -> Iterator[float]:
+    """
+    Ожидание в рамках бюджета: отдаёт ограниченный таймаут и записывает длительность.
+
+    Пример:
+        with time_budget.wait(f'locator "{name}"', 7000) as timeout:
+            locator.wait_for(timeout=timeout)
+
+    :param label: Описание ожидания (для разбивки времени).
+    :param timeout: Собственный таймаут в мс (None — глобальный таймаут expect()).
+    :yield: Таймаут, ограниченный оставшимся бюджетом.
+    :raises TimeBudgetExceeded: Если бюджет исчерпан до или во время ожидания.
+    """
+    capped = cap(_expect_timeout if timeout is None else timeout, label)
+    budget = _current.get()
+    started = time.perf_counter()
+    try:
+        yield capped
+    except Exception as e:
+        if budget is not None:
+            budget.waits.append((label, time.perf_counter() - started))
+            # Ожидание, урезанное бюджетом, упало по таймауту: прерываем тест с разбивкой времени
+            if budget.exhausted:
+                raise TimeBudgetExceeded(f"Time budget of {budget.seconds:.1f}s exhausted during {label}\n"
+                                         f"{budget.breakdown()}") from e
+        raise
+    else:
+        if budget is not None:
+            budget.waits.append((label, time.perf_counter() - started))
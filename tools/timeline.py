@@ -0,0 +1,174 @@
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional
+
+from tools.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Дорожка (tid) вызовов Playwright внутри процесса; тесты и шаги получают дорожки начиная с 1
+PLAYWRIGHT_TRACK = 0
+
+
+def now_us() -> int:
+    """Текущее время в микросекундах от эпохи: общая шкала для контроллера и всех воркеров."""
+    return time.time_ns() // 1000
+
+
+def _current_task() -> Any:
+    """
+    Возвращает текущую задачу исполнения: гринлет в режиме --contexts-per-worker, иначе поток.
+
+    Одновременные тесты одного воркера выполняются в разных гринлетах одного потока,
+    поэтому дорожки различаются по гринлету.
+    """
+    try:
+        import greenlet
+    except ImportError:
+        import threading
+        return threading.current_thread()
+    return greenlet.getcurrent()
+
+
+class Timeline:
+    """
+    Запись событий для Chrome trace-event / Perfetto (chrome://tracing, ui.perfetto.dev).
+
+    Каждое событие — завершённый интервал (`"ph": "X"`) с временем начала и длительностью
+    в микросекундах. Процесс pytest (контроллер или воркер) — отдельный процесс трейса (pid),
+    одновременно выполняемые тесты — отдельные дорожки (tid), вызовы Playwright — своя дорожка.
+
+    По умолчанию выключен (опция --timeline): тогда span() и complete() ничего не делают.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.pid = 0
+        self.process_name = "main"
+        self.events: list[dict[str, Any]] = []
+        self._tracks: dict[int, int] = {}
+        self._playwright_send = None
+
+    def enable(self, pid: int, process_name: str) -> None:
+        """
+        Включает запись событий.
+
+        :param pid: Номер процесса трейса (0 — контроллер, n + 1 — воркер gw<n>).
+        :param process_name: Имя процесса в трейсе.
+        """
+        self.enabled = True
+        self.pid = pid
+        self.process_name = process_name
+        self._instrument_playwright()
+
+    def disable(self) -> None:
+        """Выключает запись событий и снимает обёртку вызовов Playwright."""
+        self.enabled = False
+        if self._playwright_send is not None:
+            from playwright._impl._connection import Channel
+            Channel._inner_send = self._playwright_send
+            self._playwright_send = None
+
+    def track(self) -> int:
+        """Возвращает дорожку (tid) текущего гринлета или потока."""
+        task = id(_current_task())
+        if task not in self._tracks:
+            self._tracks[task] = len(self._tracks) + 1
+        return self._tracks[task]
+
+    def complete(self, name: str, category: str, start_us: int, end_us: Optional[int] = None,
+                 track: Optional[int] = None, **args: Any) -> None:
+        """
+        Записывает завершённый интервал.
+
+        :param name: Название интервала.
+        :param category: Категория (test, fixture, step, playwright).
+        :param start_us: Начало в микросекундах от эпохи.
+        :param end_us: Конец в микросекундах от эпохи (None — сейчас).
+        :param track: Дорожка (None — дорожка текущего гринлета или потока).
+        :param args: Дополнительные данные события (показываются в панели деталей).
+        """
+        if not self.enabled:
+            return
+        end_us = now_us() if end_us is None else end_us
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": start_us,
+            "dur": max(end_us - start_us, 0),
+            "pid": self.pid,
+            "tid": self.track() if track is None else track,
+        }
+        if args:
+            event["args"] = args
+        self.events.append(event)
+
+    @contextmanager
+    def span(self, name: str, category: str, **args: Any) -> Iterator[None]:
+        """
+        Записывает интервал выполнения блока кода.
+
+        Пример:
+            with timeline.span("fill form", "step"):
+                ...
+
+        :param name: Название интервала.
+        :param category: Категория интервала.
+        :param args: Дополнительные данные события.
+        """
+        started = now_us()
+        try:
+            yield
+        finally:
+            self.complete(name, category, started, **args)
+
+    def export(self) -> list[dict[str, Any]]:
+        """
+        Возвращает события процесса вместе с метаданными имён процесса и дорожек.
+
+        :return: Список событий trace-event.
+        """
+        metadata = [
+            {"name": "process_name", "ph": "M", "pid": self.pid, "tid": 0, "args": {"name": self.process_name}},
+            {"name": "process_sort_index", "ph": "M", "pid": self.pid, "tid": 0, "args": {"sort_index": self.pid}},
+            {"name": "thread_name", "ph": "M", "pid": self.pid, "tid": PLAYWRIGHT_TRACK, "args": {"name": "playwright"}},
+        ]
+        for number in self._tracks.values():
+            metadata.append({"name": "thread_name", "ph": "M", "pid": self.pid, "tid": number,
+                             "args": {"name": "tests" if number == 1 else f"tests #{number}"}})
+        return metadata + self.events
+
+    def _instrument_playwright(self) -> None:
+        """
+        Оборачивает отправку команд Playwright драйверу, чтобы записывать каждый вызов API.
+
+        Публичного механизма для этого у Playwright нет, поэтому оборачивается внутренний
+        `Channel._inner_send` (один вызов — одна команда протокола, например `Frame.click`).
+        """
+        if self._playwright_send is not None:
+            return
+        try:
+            from playwright._impl._connection import Channel
+        except ImportError:
+            logger.warning("Playwright internals not found: browser calls are not recorded in the timeline")
+            return
+        original = Channel._inner_send
+        timeline = self
+
+        async def _inner_send(channel, method, params, return_as_dict):
+            if channel._is_internal_type:
+                return await original(channel, method, params, return_as_dict)
+            started = now_us()
+            try:
+                return await original(channel, method, params, return_as_dict)
+            finally:
+                timeline.complete(f"{type(channel._object).__name__}.{method}", "playwright", started,
+                                  track=PLAYWRIGHT_TRACK)
+
+        Channel._inner_send = _inner_send
+        self._playwright_send = original
+
+
+# Хронология шагов и вызовов Playwright процесса (включает fixtures/timeline.py)
+timeline = Timeline()
@@ -0,0 +1,283 @@
+"""
+Отчёт по трейсам Playwright: самые медленные действия, локаторы, ожидания и запросы.
+
+Архивы трейсов читаются потоково (zipfile, построчно), без распаковки на диск.
+
+Запуск из командной строки по всем трейсам прогона:
+    python -m tools.trace_report tracing
+    python -m tools.trace_report tracing/abc.zip --top 10 --json
+"""
+import argparse
+import json
+import sys
+import zipfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional
+from urllib.parse import urlsplit
+
+from tools.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Сколько строк выводить в каждом разделе отчёта по умолчанию
+DEFAULT_TOP = 15
+
+# Части HAR-таймингов запроса, которые попадают в отчёт
+_TIMING_PHASES = ("blocked", "dns", "connect", "ssl", "send", "wait", "receive")
+
+
+@dataclass
+class Action:
+    """Вызов API Playwright из трейса."""
+    trace: str
+    api_name: str
+    duration: float
+    selector: Optional[str] = None
+    error: Optional[str] = None
+
+    @property
+    def is_wait(self) -> bool:
+        """True для ожиданий: expect(), wait_for_*, wait_for_timeout."""
+        name = self.api_name.lower()
+        return name.startswith("expect") or "wait" in name
+
+
+@dataclass
+class Request:
+    """Сетевой запрос из трейса (HAR-запись)."""
+    trace: str
+    method: str
+    url: str
+    status: int
+    duration: float
+    timings: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def endpoint(self) -> str:
+        """URL без query-строки и фрагмента: запросы к одному ресурсу группируются вместе."""
+        parts = urlsplit(self.url)
+        return f"{self.method} {parts.scheme}://{parts.netloc}{parts.path}"
+
+
+def _read_lines(archive: zipfile.ZipFile, name: str) -> Iterator[dict[str, Any]]:
+    """Построчно читает JSONL-файл архива, пропуская повреждённые строки."""
+    with archive.open(name) as stream:
+        for line in stream:
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+
+def read_trace(path: Path) -> tuple[list[Action], list[Request]]:
+    """
+    Читает действия и запросы из архива трейса.
+
+    Поддерживаются события before/after (новые версии Playwright) и action (старые).
+
+    :param path: Путь к zip-архиву трейса.
+    :return: Кортеж (действия, запросы).
+    :raises zipfile.BadZipFile: Если файл не является архивом.
+    """
+    actions: list[Action] = []
+    requests: list[Request] = []
+    trace = path.name
+    with zipfile.ZipFile(path) as archive:
+        for name in archive.namelist():
+            if name.endswith(".trace"):
+                started: dict[str, dict[str, Any]] = {}
+                for event in _read_lines(archive, name):
+                    kind = event.get("type")
+                    if kind == "before":
+                        started[event["callId"]] = event
+                    elif kind == "after" and event.get("callId") in started:
+                        before = started.pop(event["callId"])
+                        error = event.get("error")
+                        actions.append(Action(
+                            trace=trace,
+                            api_name=before.get("apiName") or f"{before.get('class')}.{before.get('method')}",
+                            duration=event.get("endTime", 0) - before.get("startTime", 0),
+                            selector=(before.get("params") or {}).get("selector"),
+                            error=(error.get("message") if isinstance(error, dict) else error) or None,
+                        ))
+                    elif kind == "action":
+                        metadata = event.get("metadata", {})
+                        actions.append(Action(
+                            trace=trace,
+                            api_name=metadata.get("apiName") or f"{metadata.get('type')}.{metadata.get('method')}",
+                            duration=metadata.get("endTime", 0) - metadata.get("startTime", 0),
+                            selector=(metadata.get("params") or {}).get("selector"),
+                            error=(metadata.get("error") or {}).get("error", {}).get("message"),
+                        ))
+            elif name.endswith(".network"):
+                for event in _read_lines(archive, name):
+                    if event.get("type") != "resource-snapshot":
+                        continue
+                    snapshot = event.get("snapshot", {})
+                    request = snapshot.get("request", {})
+                    timings = snapshot.get("timings", {})
+                    requests.append(Request(
+                        trace=trace,
+                        method=request.get("method", "GET"),
+                        url=request.get("url", ""),
+                        status=snapshot.get("response", {}).get("status", 0),
+                        duration=snapshot.get("time", 0) or 0,
+                        timings={phase: timings[phase] for phase in _TIMING_PHASES
+                                 if isinstance(timings.get(phase), (int, float)) and timings[phase] > 0},
+                    ))
+    return actions, requests
+
+
+def _group(items: Iterable[Any], key) -> list[dict[str, Any]]:
+    """Группирует замеры по ключу: число, сумма, максимум и среднее, по убыванию суммы."""
+    groups: dict[str, dict[str, Any]] = {}
+    for item in items:
+        name = key(item)
+        if name is None:
+            continue
+        group = groups.setdefault(name, {"name": name, "count": 0, "total": 0.0, "max": 0.0})
+        group["count"] += 1
+        group["total"] += item.duration
+        group["max"] = max(group["max"], item.duration)
+    for group in groups.values():
+        group["mean"] = group["total"] / group["count"]
+    return sorted(groups.values(), key=lambda group: group["total"], reverse=True)
+
+
+class TraceReport:
+    """
+    Сводный отчёт по одному или нескольким трейсам.
+
+    Разделы: самые медленные действия, локаторы (суммарное время действий по селектору),
+    ожидания (expect, wait_for_*), эндпоинты (суммарное время запросов по URL без query)
+    и самые медленные отдельные запросы с разбивкой HAR-таймингов.
+    """
+
+    def __init__(self):
+        self.traces = 0
+        self.actions: list[Action] = []
+        self.requests: list[Request] = []
+        self.errors: list[str] = []
+
+    @classmethod
+    def of(cls, paths: Iterable[Path]) -> "TraceReport":
+        """
+        Строит отчёт по архивам и каталогам с архивами (*.zip).
+
+        :param paths: Пути к архивам трейсов или каталогам.
+        :return: Отчёт.
+        """
+        report = cls()
+        for path in paths:
+            path = Path(path)
+            for archive in sorted(path.glob("*.zip")) if path.is_dir() else [path]:
+                report.add(archive)
+        return report
+
+    def add(self, path: Path) -> None:
+        """
+        Добавляет трейс к отчёту; повреждённые архивы пропускаются с записью в errors.
+
+        :param path: Путь к zip-архиву трейса.
+        """
+        try:
+            actions, requests = read_trace(path)
+        except (OSError, zipfile.BadZipFile) as e:
+            self.errors.append(f"{path}: {e}")
+            logger.warning(f"Trace {path} skipped: {e}")
+            return
+        self.traces += 1
+        self.actions.extend(actions)
+        self.requests.extend(requests)
+
+    def as_dict(self, top: int = DEFAULT_TOP) -> dict[str, Any]:
+        """
+        Возвращает разделы отчёта.
+
+        :param top: Сколько строк оставить в каждом разделе.
+        :return: Словарь с разделами отчёта (длительности в миллисекундах).
+        """
+        slowest_actions = sorted(self.actions, key=lambda action: action.duration, reverse=True)[:top]
+        slowest_requests = sorted(self.requests, key=lambda request: request.duration, reverse=True)[:top]
+        return {
+            "traces": self.traces,
+            "actions": len(self.actions),
+            "requests": len(self.requests),
+            "slowest_actions": [
+                {"api": action.api_name, "selector": action.selector, "ms": action.duration,
+                 "error": action.error, "trace": action.trace}
+                for action in slowest_actions
+            ],
+            "slowest_locators": _group(self.actions, lambda action: action.selector)[:top],
+            "slowest_waits": _group((action for action in self.actions if action.is_wait),
+                                    lambda action: f"{action.api_name} {action.selector or ''}".strip())[:top],
+            "slowest_endpoints": _group(self.requests, lambda request: request.endpoint)[:top],
+            "slowest_requests": [
+                {"request": f"{request.method} {request.url}", "status": request.status,
+                 "ms": request.duration, "timings": request.timings, "trace": request.trace}
+                for request in slowest_requests
+            ],
+            "errors": self.errors,
+        }
+
+    def render(self, top: int = DEFAULT_TOP) -> str:
+        """
+        Возвращает отчёт в виде текста.
+
+        :param top: Сколько строк выводить в каждом разделе.
+        :return: Многострочный текст отчёта.
+        """
+        data = self.as_dict(top)
+        lines = [f"Traces: {data['traces']}, actions: {data['actions']}, requests: {data['requests']}"]
+
+        lines.append("\nSlowest actions (ms):")
+        for row in data["slowest_actions"]:
+            error = "  ERROR" if row["error"] else ""
+            lines.append(f"  {row['ms']:9.0f}  {row['api']:<28} {row['selector'] or ''}{error}  [{row['trace']}]")
+
+        for title, key in (("Slowest locators", "slowest_locators"), ("Slowest waits", "slowest_waits"),
+                           ("Slowest endpoints", "slowest_endpoints")):
+            lines.append(f"\n{title} (total / max / mean ms, count):")
+            for row in data[key]:
+                lines.append(f"  {row['total']:9.0f} / {row['max']:7.0f} / {row['mean']:7.0f}  "
+                             f"x{row['count']:<4} {row['name']}")
+
+        lines.append("\nSlowest requests (ms):")
+        for row in data["slowest_requests"]:
+            timings = ", ".join(f"{phase} {ms:.0f}" for phase, ms in row["timings"].items())
+            lines.append(f"  {row['ms']:9.0f}  {row['status']:>3}  {row['request']}  ({timings})")
+
+        if data["errors"]:
+            lines.append("\nUnreadable traces:")
+            lines.extend(f"  {error}" for error in data["errors"])
+        return "\n".join(lines)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """
+    Точка входа командной строки: печатает отчёт по трейсам.
+
+    :param argv: Аргументы командной строки (None — sys.argv).
+    :return: Код возврата (1, если не прочитан ни один трейс).
+    """
+    parser = argparse.ArgumentParser(description="Rank the slowest actions, locators, waits and requests "
+                                                 "across Playwright trace archives")
+    parser.add_argument("paths", nargs="*", type=Path, default=[Path("tracing")],
+                        help="Trace archives or directories with *.zip (default: tracing)")
+    parser.add_argument("--top", type=int, default=DEFAULT_TOP, help="Rows per section")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args(argv)
+
+    report = TraceReport.of(args.paths)
+    if args.json:
+        print(json.dumps(report.as_dict(args.top), indent=2, ensure_ascii=False))
+    else:
+        print(report.render(args.top))
+    return 0 if report.traces else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
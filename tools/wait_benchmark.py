@@ -0,0 +1,159 @@
+"""
+Сравнение задержки ожиданий формы регистрации: по событиям страницы (tools/dom_waits.py)
+и через опрос expect() Playwright.
+
+Сценарии (каждый прогон — на одной странице Web Tables, методы чередуются):
+- close — [Add] -> fill_form -> [Submit], затем ожидание закрытия формы:
+  wait_closed() против expect(...).to_be_hidden();
+- invalid — [Add] -> [Submit] пустой формы, затем ожидание невалидного поля first_name:
+  wait_field_invalid() против expect(...).to_have_css() с цветом бордера ошибки.
+Время — от возврата click() кнопки [Submit] до возврата ожидания, в миллисекундах.
+
+Запуск (настройки браузера и APP_URL — из .env, как у тестов):
+    python -m tools.wait_benchmark --runs 30
+    python -m tools.wait_benchmark --runs 50 --browser-name firefox --output waits.json
+"""
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from playwright.sync_api import expect, sync_playwright
+
+from config import Settings
+from data.person_info import PersonInfo
+from fixtures.page_fixtures import create_context, launch_browser
+from pages.web_tables_page import WebTablePage
+from tools import time_budget
+from tools.field_fuzz import INVALID_BORDER_COLOR
+from tools.load import PERCENTILES, percentile
+from tools.logger import get_logger
+from tools.routes import AppRoute
+
+logger = get_logger(__name__)
+
+# Методы ожидания в отчёте
+METHODS = ("event", "expect")
+
+
+def _close_scenario(webtable_page: WebTablePage, method: str, run: int) -> float:
+    """
+    Заполняет и отправляет форму, ждёт её закрытия выбранным методом.
+
+    :return: Задержка ожидания в миллисекундах.
+    """
+    form = webtable_page.registration_form
+    webtable_page.click_add_button()
+    form.fill_form(PersonInfo.generate_person(seed=run))
+    form.submit_button.click()
+    started = time.perf_counter()
+    if method == "event":
+        assert form.wait_closed(), "Registration form did not close"
+    else:
+        expect(form.title_form.locator).to_be_hidden()
+    return (time.perf_counter() - started) * 1000
+
+
+def _invalid_scenario(webtable_page: WebTablePage, method: str, run: int) -> float:
+    """
+    Отправляет пустую форму, ждёт невалидного first_name выбранным методом и закрывает форму.
+
+    :return: Задержка ожидания в миллисекундах.
+    """
+    form = webtable_page.registration_form
+    webtable_page.click_add_button()
+    form.submit_button.click()
+    started = time.perf_counter()
+    if method == "event":
+        assert form.wait_field_invalid("first_name"), "first_name was not marked invalid"
+    else:
+        expect(form.input_fields["first_name"].locator).to_have_css("border-bottom-color", INVALID_BORDER_COLOR)
+    elapsed = (time.perf_counter() - started) * 1000
+    form.close()
+    return elapsed
+
+
+SCENARIOS: dict[str, Callable[[WebTablePage, str, int], float]] = {
+    "close": _close_scenario,
+    "invalid": _invalid_scenario,
+}
+
+
+def measure(webtable_page: WebTablePage, scenario: str, runs: int) -> dict[str, list[float]]:
+    """
+    Замеряет задержку ожиданий сценария обоими методами.
+
+    Методы чередуются (event, expect, expect, event, ...), чтобы дрейф страницы за время
+    замера одинаково влиял на оба. Время отсчитывается после click() кнопки [Submit]:
+    замеряется только ожидание.
+
+    :param webtable_page: Открытая страница Web Tables.
+    :param scenario: Сценарий из SCENARIOS.
+    :param runs: Прогонов на метод.
+    :return: {метод: [задержка, мс]}.
+    """
+    samples: dict[str, list[float]] = {method: [] for method in METHODS}
+    for run in range(runs):
+        for method in (METHODS if run % 2 == 0 else METHODS[::-1]):
+            samples[method].append(SCENARIOS[scenario](webtable_page, method, run))
+    return samples
+
+
+def summarize(samples: list[float]) -> dict[str, Any]:
+    """Число замеров, среднее, перцентили и максимум задержки (мс)."""
+    return {
+        "count": len(samples),
+        "mean_ms": statistics.fmean(samples) if samples else None,
+        **{f"p{rank}_ms": percentile(samples, rank) for rank in PERCENTILES},
+        "max_ms": max(samples) if samples else None,
+    }
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """
+    Точка входа командной строки сравнения ожиданий.
+
+    :param argv: Аргументы командной строки (None — sys.argv).
+    :return: Код возврата.
+    """
+    parser = argparse.ArgumentParser(description="Compare latency of event-driven form waits with "
+                                                 "expect()-based polling on the Web Tables form")
+    parser.add_argument("--runs", type=int, default=20, help="Runs per scenario and method")
+    parser.add_argument("--scenarios", nargs="+", choices=sorted(SCENARIOS), default=sorted(SCENARIOS),
+                        help="Scenarios to measure")
+    parser.add_argument("--browser-name", default="chromium", help="Browser (as --browser-name of pytest)")
+    parser.add_argument("--output", type=Path, default=None, help="Write the JSON report here")
+    args = parser.parse_args(argv)
+
+    settings = Settings.initialize(args.browser_name)
+    time_budget.set_expect_timeout(settings.expect_timeout)
+    result: dict[str, Any] = {"browser": settings.browser_name, "runs": args.runs, "scenarios": {}}
+    with sync_playwright() as playwright:
+        browser = launch_browser(playwright, settings)
+        try:
+            webtable_page = WebTablePage(create_context(browser, settings).new_page())
+            webtable_page.open(AppRoute.WEB_TABLES)
+            for scenario in args.scenarios:
+                samples = measure(webtable_page, scenario, args.runs)
+                result["scenarios"][scenario] = {method: summarize(values) for method, values in samples.items()}
+        finally:
+            browser.close()
+
+    print(f"{'scenario':<9} {'method':<7} {'mean, ms':>9} "
+          + " ".join(f"{f'p{rank}, ms':>9}" for rank in PERCENTILES) + f" {'max, ms':>9}")
+    for scenario, methods in result["scenarios"].items():
+        for method, row in methods.items():
+            print(f"{scenario:<9} {method:<7} {row['mean_ms'] or 0:>9.1f} "
+                  + " ".join(f"{row[f'p{rank}_ms'] or 0:>9.1f}" for rank in PERCENTILES)
+                  + f" {row['max_ms'] or 0:>9.1f}")
+    if args.output:
+        args.output.write_text(json.dumps(result, indent=2), encoding="utf-8")
+        logger.info(f"Wait benchmark report written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())